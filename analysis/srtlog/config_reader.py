@@ -5,6 +5,7 @@ Configuration reader module for parsing node config files
 import json
 import logging
 import os
+import re
 from typing import Any
 
 import pandas as pd
@@ -15,6 +16,11 @@ from .models import NodeConfig, ParsedCommandInfo
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Compiled once; applied to every log file name and command line in a run
+# Use greedy match (.+) since node names can contain underscores
+_SERVICE_FILENAME = re.compile(r"(.+)_(prefill|decode|frontend|nginx|nats|etcd)")
+_CLI_FLAG = re.compile(r"--([a-z0-9-]+)")
+
 
 def validate_config_structure(config: dict[str, Any], config_path: str) -> None:
     """Validate config structure and log warnings if format changed.
@@ -303,9 +309,6 @@ def parse_command_line_from_err(run_path: str) -> ParsedCommandInfo:
             'services': {node_name: [service_types]}
         }
     """
-    import os
-    import re
-
     # Initialize cache manager
     cache_mgr = CacheManager(run_path)
     source_patterns = ["*.err", "*.out"]
@@ -348,8 +351,7 @@ def parse_command_line_from_err(run_path: str) -> ParsedCommandInfo:
 
             # Extract node name and service type from filename
             # Pattern: watchtower-navy-cn01_prefill_w0.err or r02-p01-dgx-c11_prefill_w0.out -> cn01/c11, prefill
-            # Use greedy match (.+) since node names can contain underscores
-            match = re.match(r"(.+)_(prefill|decode|frontend|nginx|nats|etcd)", filename)
+            match = _SERVICE_FILENAME.match(filename)
             if match:
                 node_name = match.group(1).replace("watchtower-navy-", "")
                 service_type = match.group(2)
@@ -369,7 +371,7 @@ def parse_command_line_from_err(run_path: str) -> ParsedCommandInfo:
                     for line in f:
                         if "python" in line and "sglang" in line and "--" in line:
                             # Extract all --flag-name patterns
-                            flags = re.findall(r"--([a-z0-9-]+)", line)
+                            flags = _CLI_FLAG.findall(line)
                             explicit_flags.update(flags)
                             commands_found += 1
                             break  # Only need to find the command once per file
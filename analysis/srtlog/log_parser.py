@@ -5,17 +5,123 @@ All parsing logic encapsulated in the NodeAnalyzer class.
 """
 
 import logging
+import multiprocessing
 import os
+import pickle
 import re
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any
 
 import pandas as pd
 
 from .cache_manager import CacheManager
+from .models import BatchMetrics, MemoryMetrics, NodeMetrics
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 
+def _regex_module() -> Any:
+    """Get google-re2 if it is installed, else the stdlib re module.
+
+    RE2 (pip install google-re2) runs these linear, backtracking-free patterns
+    as a DFA. pyre2 and fb-re2 also install a module named re2 with a different
+    API, so only google-re2 (which has re2.Options) is used.
+    """
+    try:
+        import re2
+    except ImportError:
+        return re
+    return re2 if hasattr(re2, "Options") else re
+
+
+_re = _regex_module()
+
+# Compiled once at import; these run against every line of every log file
+_TIMESTAMP = r"(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})"
+# All three tag formats in one pattern: "DP0 TP0 EP0", "TP0" or "PP0"
+_TAG = _re.compile(rf"\[{_TIMESTAMP} (?:DP(\d+) TP(\d+) EP(\d+)|TP(\d+)|PP(\d+))\]")
+
+# (dp, tp, ep, timestamp) as returned by NodeAnalyzer._parse_dp_tp_ep_tag
+_Tag = tuple[int | None, int | None, int | None, str | None]
+_NO_TAG: _Tag = (None, None, None, None)
+
+# One alternation per batch type, so a line is scanned once rather than once per metric
+_PREFILL_METRICS = _re.compile(
+    r"#new-seq:\s*(?P<new_seq>\d+)"
+    r"|#new-token:\s*(?P<new_token>\d+)"
+    r"|#cached-token:\s*(?P<cached_token>\d+)"
+    r"|token usage:\s*(?P<token_usage>[\d.]+)"
+    r"|#running-req:\s*(?P<running_req>\d+)"
+    r"|#queue-req:\s*(?P<queue_req>\d+)"
+    r"|#prealloc-req:\s*(?P<prealloc_req>\d+)"
+    r"|#inflight-req:\s*(?P<inflight_req>\d+)"
+    r"|input throughput \(token/s\):\s*(?P<input_throughput>[\d.]+)"
+)
+
+_DECODE_METRICS = _re.compile(
+    r"#running-req:\s*(?P<running_req>\d+)"
+    r"|#token:\s*(?P<num_tokens>\d+)"
+    r"|token usage:\s*(?P<token_usage>[\d.]+)"
+    r"|pre-allocated usage:\s*(?P<preallocated_usage>[\d.]+)"
+    r"|#prealloc-req:\s*(?P<prealloc_req>\d+)"
+    r"|#transfer-req:\s*(?P<transfer_req>\d+)"
+    r"|#queue-req:\s*(?P<queue_req>\d+)"
+    r"|gen throughput \(token/s\):\s*(?P<gen_throughput>[\d.]+)"
+)
+
+# Converter for each named metric group; counts are integers, rates and usages floats
+_METRIC_TYPES: dict[str, type] = {
+    "new_seq": int,
+    "new_token": int,
+    "cached_token": int,
+    "running_req": int,
+    "queue_req": int,
+    "prealloc_req": int,
+    "inflight_req": int,
+    "transfer_req": int,
+    "num_tokens": int,
+    "token_usage": float,
+    "preallocated_usage": float,
+    "input_throughput": float,
+    "gen_throughput": float,
+}
+
+_AVAIL_MEM = _re.compile(r"avail mem=([\d.]+)\s*GB")
+_MEM_USAGE = _re.compile(r"mem usage=([\d.]+)\s*GB")
+_KV_SIZE = _re.compile(r"KV size:\s*([\d.]+)\s*GB")
+_KV_TOKENS = _re.compile(r"#tokens:\s*(\d+)")
+
+_PARALLEL_SIZE = _re.compile(r"--(tp|dp|ep)-size\s+(\d+)")
+
+_LOG_FILENAME = _re.compile(r"(.+)_(prefill|decode|frontend)_([^.]+)\.(err|out)")
+
+
+# Node logs are read in large blocks and split in C, rather than line by line
+_READ_CHUNK_SIZE = 1 << 20
+
+
+def _read_line_chunks(f: Any, chunk_size: int = _READ_CHUNK_SIZE) -> Iterator[list[str]]:
+    """Yield lists of complete lines (without newlines) read from f in chunk_size blocks."""
+    tail = ""
+    while chunk := f.read(chunk_size):
+        lines = (tail + chunk).split("\n")
+        tail = lines.pop()
+        yield lines
+    if tail:
+        yield [tail]
+
+
+def _extract_metrics(pattern: Any, line: str, metrics: dict) -> None:
+    """Add each named metric in line to metrics, keeping the first occurrence."""
+    for match in pattern.finditer(line):
+        key = match.lastgroup
+        if key not in metrics:
+            metrics[key] = _METRIC_TYPES[key](match.group(key))
+
+
 class NodeAnalyzer:
     """Service for analyzing node-level metrics from log files.
 
@@ -62,17 +168,20 @@ class NodeAnalyzer:
             logger.error(f"Run path does not exist: {run_path}")
             return nodes
 
-        total_err_files = 0
-        parsed_successfully = 0
-
-        for file in os.listdir(run_path):
-            if (file.endswith(".err") or file.endswith(".out")) and ("prefill" in file or "decode" in file):
-                total_err_files += 1
-                filepath = os.path.join(run_path, file)
-                node = self.parse_single_log(filepath)
-                if node:
-                    nodes.append(node)
-                    parsed_successfully += 1
+        # scandir entries carry the full path and cached file type, so no per-file
+        # join or stat is needed
+        with os.scandir(run_path) as entries:
+            filepaths = [
+                entry.path
+                for entry in entries
+                if entry.name.endswith((".err", ".out"))
+                and ("prefill" in entry.name or "decode" in entry.name)
+                and entry.is_file()
+            ]
+        total_err_files = len(filepaths)
+
+        nodes = [node for node in self._parse_logs(filepaths) if node]
+        parsed_successfully = len(nodes)
 
         logger.info(f"Parsed {parsed_successfully}/{total_err_files} prefill/decode log files from {run_path}")
 
@@ -86,6 +195,32 @@ class NodeAnalyzer:
 
         return nodes
 
+    def _parse_logs(self, filepaths: list[str]) -> list:
+        """Parse node log files, in parallel worker processes when there are several.
+
+        Each file is parsed independently and the work is CPU-bound, so it
+        scales with cores. Workers are spawned rather than forked, since this
+        runs inside the multi-threaded Streamlit server. Falls back to parsing
+        in-process if a pool cannot be used.
+
+        Returns:
+            Results of parse_single_log, in filepaths order
+        """
+        if len(filepaths) < 2:
+            return [self.parse_single_log(filepath) for filepath in filepaths]
+
+        # One file per task: node logs are few and large, so batching them would idle workers
+        try:
+            with ProcessPoolExecutor(
+                max_workers=min(len(filepaths), os.cpu_count() or 1),
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as executor:
+                return list(executor.map(self.parse_single_log, filepaths, chunksize=1))
+        # Pool start-up, pickling ("cannot pickle" is a TypeError) and dead workers
+        except (OSError, BrokenProcessPool, pickle.PicklingError, TypeError, AttributeError) as e:
+            logger.warning(f"Parallel log parsing unavailable ({e}), parsing sequentially")
+            return [self.parse_single_log(filepath) for filepath in filepaths]
+
     def parse_single_log(self, filepath: str):
         """Parse a single node log file.
 
@@ -95,8 +230,6 @@ class NodeAnalyzer:
         Returns:
             NodeMetrics object or None if parsing failed
         """
-        from .models import BatchMetrics, MemoryMetrics, NodeMetrics
-
         node_info = self._extract_node_info_from_filename(filepath)
         if not node_info:
             logger.warning(
@@ -108,82 +241,36 @@ class NodeAnalyzer:
         batches = []
         memory_snapshots = []
         config = {}
+        add_batch = batches.append
+        add_memory = memory_snapshots.append
 
         try:
             with open(filepath) as f:
-                for line in f:
-                    # Parse prefill batch metrics
-                    batch_metrics = self._parse_prefill_batch_line(line)
-                    if batch_metrics:
-                        batches.append(
-                            BatchMetrics(
-                                timestamp=batch_metrics["timestamp"],
-                                dp=batch_metrics["dp"],
-                                tp=batch_metrics["tp"],
-                                ep=batch_metrics["ep"],
-                                batch_type=batch_metrics["type"],
-                                new_seq=batch_metrics.get("new_seq"),
-                                new_token=batch_metrics.get("new_token"),
-                                cached_token=batch_metrics.get("cached_token"),
-                                token_usage=batch_metrics.get("token_usage"),
-                                running_req=batch_metrics.get("running_req"),
-                                queue_req=batch_metrics.get("queue_req"),
-                                prealloc_req=batch_metrics.get("prealloc_req"),
-                                inflight_req=batch_metrics.get("inflight_req"),
-                                input_throughput=batch_metrics.get("input_throughput"),
-                            )
-                        )
-
-                    # Parse decode batch metrics
-                    decode_metrics = self._parse_decode_batch_line(line)
-                    if decode_metrics:
-                        batches.append(
-                            BatchMetrics(
-                                timestamp=decode_metrics["timestamp"],
-                                dp=decode_metrics["dp"],
-                                tp=decode_metrics["tp"],
-                                ep=decode_metrics["ep"],
-                                batch_type=decode_metrics["type"],
-                                running_req=decode_metrics.get("running_req"),
-                                queue_req=decode_metrics.get("queue_req"),
-                                prealloc_req=decode_metrics.get("prealloc_req"),
-                                transfer_req=decode_metrics.get("transfer_req"),
-                                token_usage=decode_metrics.get("token_usage"),
-                                preallocated_usage=decode_metrics.get("preallocated_usage"),
-                                num_tokens=decode_metrics.get("num_tokens"),
-                                gen_throughput=decode_metrics.get("gen_throughput"),
-                            )
-                        )
-
-                    # Parse memory metrics
-                    mem_metrics = self._parse_memory_line(line)
-                    if mem_metrics:
-                        memory_snapshots.append(
-                            MemoryMetrics(
-                                timestamp=mem_metrics["timestamp"],
-                                dp=mem_metrics["dp"],
-                                tp=mem_metrics["tp"],
-                                ep=mem_metrics["ep"],
-                                metric_type=mem_metrics["type"],
-                                avail_mem_gb=mem_metrics.get("avail_mem_gb"),
-                                mem_usage_gb=mem_metrics.get("mem_usage_gb"),
-                                kv_cache_gb=mem_metrics.get("kv_cache_gb"),
-                                kv_tokens=mem_metrics.get("kv_tokens"),
-                            )
-                        )
-
-                    # Extract TP/DP/EP configuration from command line
-                    if "--tp-size" in line:
-                        tp_match = re.search(r"--tp-size\s+(\d+)", line)
-                        dp_match = re.search(r"--dp-size\s+(\d+)", line)
-                        ep_match = re.search(r"--ep-size\s+(\d+)", line)
-
-                        if tp_match:
-                            config["tp_size"] = int(tp_match.group(1))
-                        if dp_match:
-                            config["dp_size"] = int(dp_match.group(1))
-                        if ep_match:
-                            config["ep_size"] = int(ep_match.group(1))
+                for chunk in _read_line_chunks(f):
+                    for line in chunk:
+                        # A line carries at most one kind of metric, so classify it by its
+                        # discriminator literal and dispatch to a single parser. Cheap
+                        # substring checks skip the regexes on the vast majority of lines,
+                        # and the DP/TP/EP tag is only parsed for lines that need it.
+                        if "Prefill batch" in line:
+                            batch_metrics = self._parse_prefill_batch_line(line, self._parse_dp_tp_ep_tag(line))
+                            # Parser keys match the BatchMetrics/MemoryMetrics fields
+                            if batch_metrics:
+                                add_batch(BatchMetrics(**batch_metrics))
+                        elif "Decode batch" in line:
+                            batch_metrics = self._parse_decode_batch_line(line, self._parse_dp_tp_ep_tag(line))
+                            if batch_metrics:
+                                add_batch(BatchMetrics(**batch_metrics))
+                        elif "avail mem=" in line or "mem usage=" in line or "KV size:" in line:
+                            mem_metrics = self._parse_memory_line(line, self._parse_dp_tp_ep_tag(line))
+                            if mem_metrics:
+                                add_memory(MemoryMetrics(**mem_metrics))
+
+                        # Extract TP/DP/EP configuration from the launch command line,
+                        # which is logged once near the top of the file
+                        if not config and "--tp-size" in line:
+                            for key, value in _PARALLEL_SIZE.findall(line):
+                                config.setdefault(f"{key}_size", int(value))
 
         except Exception as e:
             logger.error(f"Error parsing {filepath}: {e}")
@@ -199,7 +286,7 @@ class NodeAnalyzer:
                 f"Log format may have changed."
             )
 
-        logger.debug(f"Parsed {filepath}: {len(batches)} batches, " f"{len(memory_snapshots)} memory snapshots")
+        logger.debug(f"Parsed {filepath}: {len(batches)} batches, {len(memory_snapshots)} memory snapshots")
 
         return NodeMetrics(
             node_info=node_info,
@@ -346,7 +433,6 @@ class NodeAnalyzer:
             List of NodeMetrics objects
         """
         import time
-        from .models import BatchMetrics, MemoryMetrics, NodeMetrics
 
         start_time = time.time()
         nodes = []
@@ -442,7 +528,7 @@ class NodeAnalyzer:
 
     # Private helper methods
 
-    def _parse_dp_tp_ep_tag(self, line: str) -> tuple[int | None, int | None, int | None, str | None]:
+    def _parse_dp_tp_ep_tag(self, line: str) -> _Tag:
         """Extract DP, TP, EP indices and timestamp from log line.
 
         Supports three formats:
@@ -456,27 +542,22 @@ class NodeAnalyzer:
         Returns:
             (dp, tp, ep, timestamp) or (None, None, None, None) if pattern not found
         """
-        # Try full format first: DP0 TP0 EP0
-        match = re.search(r"\[(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}) DP(\d+) TP(\d+) EP(\d+)\]", line)
-        if match:
-            timestamp, dp, tp, ep = match.groups()
-            return int(dp), int(tp), int(ep), timestamp
+        # Every tag format carries a TP or PP index; skip the regex otherwise
+        if "TP" not in line and "PP" not in line:
+            return _NO_TAG
 
-        # Try simple format: TP0 only (1P4D style)
-        match = re.search(r"\[(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}) TP(\d+)\]", line)
-        if match:
-            timestamp, tp = match.groups()
-            return 0, int(tp), 0, timestamp  # Default DP=0, EP=0
+        match = _TAG.search(line)
+        if not match:
+            return _NO_TAG
 
-        # Try pipeline parallelism format: PP0 (prefill with PP)
-        match = re.search(r"\[(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}) PP(\d+)\]", line)
-        if match:
-            timestamp, pp = match.groups()
-            return 0, int(pp), 0, timestamp  # Map PP to TP slot, default DP=0, EP=0
+        timestamp, dp, tp, ep, simple_tp, pp = match.groups()
+        if tp is not None:
+            return int(dp), int(tp), int(ep), timestamp
 
-        return None, None, None, None
+        # Simple TP (1P4D style) and pipeline (PP mapped to the TP slot) default DP=0, EP=0
+        return 0, int(simple_tp if simple_tp is not None else pp), 0, timestamp
 
-    def _parse_prefill_batch_line(self, line: str) -> dict | None:
+    def _parse_prefill_batch_line(self, line: str, tag: _Tag | None = None) -> dict | None:
         """Parse prefill batch log line for metrics.
 
         Example line:
@@ -484,34 +565,18 @@ class NodeAnalyzer:
         #cached-token: 0, token usage: 0.00, #running-req: 0, #queue-req: 0,
         #prealloc-req: 0, #inflight-req: 0, input throughput (token/s): 0.00,
         """
-        dp, tp, ep, timestamp = self._parse_dp_tp_ep_tag(line)
+        dp, tp, ep, timestamp = tag if tag is not None else self._parse_dp_tp_ep_tag(line)
         if dp is None or "Prefill batch" not in line:
             return None
 
-        metrics = {"timestamp": timestamp, "dp": dp, "tp": tp, "ep": ep, "type": "prefill"}
+        metrics = {"timestamp": timestamp, "dp": dp, "tp": tp, "ep": ep, "batch_type": "prefill"}
 
         # Extract metrics using regex
-        patterns = {
-            "new_seq": r"#new-seq:\s*(\d+)",
-            "new_token": r"#new-token:\s*(\d+)",
-            "cached_token": r"#cached-token:\s*(\d+)",
-            "token_usage": r"token usage:\s*([\d.]+)",
-            "running_req": r"#running-req:\s*(\d+)",
-            "queue_req": r"#queue-req:\s*(\d+)",
-            "prealloc_req": r"#prealloc-req:\s*(\d+)",
-            "inflight_req": r"#inflight-req:\s*(\d+)",
-            "input_throughput": r"input throughput \(token/s\):\s*([\d.]+)",
-        }
-
-        for key, pattern in patterns.items():
-            match = re.search(pattern, line)
-            if match:
-                value = match.group(1)
-                metrics[key] = float(value) if "." in value else int(value)
+        _extract_metrics(_PREFILL_METRICS, line, metrics)
 
         return metrics
 
-    def _parse_decode_batch_line(self, line: str) -> dict | None:
+    def _parse_decode_batch_line(self, line: str, tag: _Tag | None = None) -> dict | None:
         """Parse decode batch log line for metrics.
 
         Example line:
@@ -519,33 +584,18 @@ class NodeAnalyzer:
         token usage: 0.00, pre-allocated usage: 0.00, #prealloc-req: 0, #transfer-req: 0,
         #retracted-req: 0, cuda graph: True, gen throughput (token/s): 6.73, #queue-req: 0,
         """
-        dp, tp, ep, timestamp = self._parse_dp_tp_ep_tag(line)
+        dp, tp, ep, timestamp = tag if tag is not None else self._parse_dp_tp_ep_tag(line)
         if dp is None or "Decode batch" not in line:
             return None
 
-        metrics = {"timestamp": timestamp, "dp": dp, "tp": tp, "ep": ep, "type": "decode"}
+        metrics = {"timestamp": timestamp, "dp": dp, "tp": tp, "ep": ep, "batch_type": "decode"}
 
         # Extract metrics using regex
-        patterns = {
-            "running_req": r"#running-req:\s*(\d+)",
-            "num_tokens": r"#token:\s*(\d+)",
-            "token_usage": r"token usage:\s*([\d.]+)",
-            "preallocated_usage": r"pre-allocated usage:\s*([\d.]+)",
-            "prealloc_req": r"#prealloc-req:\s*(\d+)",
-            "transfer_req": r"#transfer-req:\s*(\d+)",
-            "queue_req": r"#queue-req:\s*(\d+)",
-            "gen_throughput": r"gen throughput \(token/s\):\s*([\d.]+)",
-        }
-
-        for key, pattern in patterns.items():
-            match = re.search(pattern, line)
-            if match:
-                value = match.group(1)
-                metrics[key] = float(value) if "." in value else int(value)
+        _extract_metrics(_DECODE_METRICS, line, metrics)
 
         return metrics
 
-    def _parse_memory_line(self, line: str) -> dict | None:
+    def _parse_memory_line(self, line: str, tag: _Tag | None = None) -> dict | None:
         """Parse memory-related log lines.
 
         Examples:
@@ -554,7 +604,7 @@ class NodeAnalyzer:
 
         [2025-11-04 05:27:13 DP0 TP0 EP0] KV Cache is allocated. #tokens: 524288, KV size: 17.16 GB
         """
-        dp, tp, ep, timestamp = self._parse_dp_tp_ep_tag(line)
+        dp, tp, ep, timestamp = tag if tag is not None else self._parse_dp_tp_ep_tag(line)
         if dp is None:
             return None
 
@@ -565,30 +615,32 @@ class NodeAnalyzer:
             "ep": ep,
         }
 
+        # Each regex only runs when its literal is present; most memory lines carry
+        # just two of the four fields
         # Parse available memory
-        avail_match = re.search(r"avail mem=([\d.]+)\s*GB", line)
+        avail_match = _AVAIL_MEM.search(line) if "avail mem=" in line else None
         if avail_match:
             metrics["avail_mem_gb"] = float(avail_match.group(1))
-            metrics["type"] = "memory"
+            metrics["metric_type"] = "memory"
 
         # Parse memory usage
-        usage_match = re.search(r"mem usage=([\d.]+)\s*GB", line)
+        usage_match = _MEM_USAGE.search(line) if "mem usage=" in line else None
         if usage_match:
             metrics["mem_usage_gb"] = float(usage_match.group(1))
-            metrics["type"] = "memory"
+            metrics["metric_type"] = "memory"
 
         # Parse KV cache size
-        kv_match = re.search(r"KV size:\s*([\d.]+)\s*GB", line)
+        kv_match = _KV_SIZE.search(line) if "KV size:" in line else None
         if kv_match:
             metrics["kv_cache_gb"] = float(kv_match.group(1))
-            metrics["type"] = "kv_cache"
+            metrics["metric_type"] = "kv_cache"
 
         # Parse token count for KV cache
-        token_match = re.search(r"#tokens:\s*(\d+)", line)
+        token_match = _KV_TOKENS.search(line) if "#tokens:" in line else None
         if token_match:
             metrics["kv_tokens"] = int(token_match.group(1))
 
-        return metrics if "type" in metrics else None
+        return metrics if "metric_type" in metrics else None
 
     def _extract_node_info_from_filename(self, filename: str) -> dict | None:
         """Extract node name and worker info from filename.
@@ -597,7 +649,7 @@ class NodeAnalyzer:
         Returns: {'node': 'watchtower-navy-cn01', 'worker_type': 'prefill', 'worker_id': 'w0'}
         """
         # Use greedy match for node name up to _(prefill|decode|frontend)_
-        match = re.match(r"(.+)_(prefill|decode|frontend)_([^.]+)\.(err|out)", os.path.basename(filename))
+        match = _LOG_FILENAME.match(os.path.basename(filename))
         if match:
             return {
                 "node": match.group(1),
@@ -358,7 +358,7 @@ class BenchmarkRun:
         self.missing_concurrencies = sorted(missing)
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchMetrics:
     """Metrics from a single batch (prefill or decode), parsed from log files."""
 
@@ -391,7 +391,7 @@ class BatchMetrics:
         return None
 
 
-@dataclass
+@dataclass(slots=True)
 class MemoryMetrics:
     """Memory metrics from log lines."""
 
@@ -406,7 +406,7 @@ class MemoryMetrics:
     kv_tokens: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class NodeMetrics:
     """Metrics from a single node (prefill or decode worker), parsed from log files."""
 
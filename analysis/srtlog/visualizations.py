@@ -40,6 +40,80 @@ def parse_elapsed_time(timestamps: list[str]) -> list[float]:
         return list(range(len(timestamps)))
 
 
+# Batch metrics averaged across nodes by aggregate_all_nodes and group_nodes_by_dp
+_AVERAGED_METRICS = (
+    "input_throughput",
+    "gen_throughput",
+    "new_seq",
+    "new_token",
+    "running_req",
+    "queue_req",
+    "inflight_req",
+    "transfer_req",
+    "prealloc_req",
+    "num_tokens",
+    "token_usage",
+    "preallocated_usage",
+)
+
+
+def _average_batches_by_timestamp(nodes: list[dict], dp: int) -> list[dict]:
+    """Average batch metrics across nodes at each timestamp.
+
+    Batches are flattened in one pass into per-metric columns of (timestamp index,
+    value), and each column is then reduced with numpy bincount rather than
+    building and averaging a Python list per timestamp and metric.
+
+    Args:
+        nodes: Node data dictionaries to average together
+        dp: DP index to record on every averaged batch
+
+    Returns:
+        One averaged batch per timestamp, sorted by timestamp
+    """
+    ts_index: dict[str, int] = {}
+    batch_types: list[str] = []
+    columns: dict[str, tuple[list[int], list[float]]] = {metric: ([], []) for metric in _AVERAGED_METRICS}
+
+    for node in nodes:
+        for batch in node["prefill_batches"]:
+            ts = batch.get("timestamp", "")
+            if not ts:
+                continue
+
+            idx = ts_index.get(ts)
+            if idx is None:
+                idx = ts_index[ts] = len(ts_index)
+                # Type is taken from the first batch seen at each timestamp
+                batch_types.append(batch.get("type", "prefill"))
+
+            for metric, value in batch.items():
+                column = columns.get(metric)
+                if column is not None:
+                    column[0].append(idx)
+                    column[1].append(value)
+
+    num_timestamps = len(ts_index)
+    means = {}
+    for metric, (indices, values) in columns.items():
+        if indices:
+            counts = np.bincount(indices, minlength=num_timestamps)
+            sums = np.bincount(indices, weights=values, minlength=num_timestamps)
+            means[metric] = (sums, counts)
+
+    averaged_batches = []
+    for ts in sorted(ts_index):
+        idx = ts_index[ts]
+        avg_batch = {"timestamp": ts, "dp": dp}
+        for metric, (sums, counts) in means.items():
+            if counts[idx]:
+                avg_batch[metric] = sums[idx] / counts[idx]
+        avg_batch["type"] = batch_types[idx]
+        averaged_batches.append(avg_batch)
+
+    return averaged_batches
+
+
 def aggregate_all_nodes(node_metrics_list: list[dict]) -> list[dict]:
     """Aggregate all nodes together and average their metrics.
 
@@ -68,49 +142,7 @@ def aggregate_all_nodes(node_metrics_list: list[dict]) -> list[dict]:
         if not nodes:
             continue
 
-        # Collect all timestamps and metrics across ALL nodes in this run
-        all_batches = defaultdict(list)  # timestamp -> list of metric values
-
-        for node in nodes:
-            for batch in node["prefill_batches"]:
-                ts = batch.get("timestamp", "")
-                if ts:
-                    all_batches[ts].append(batch)
-
-        # Average metrics at each timestamp
-        averaged_batches = []
-        for timestamp in sorted(all_batches.keys()):
-            batches_at_time = all_batches[timestamp]
-
-            # Average all numeric metrics
-            avg_batch = {"timestamp": timestamp, "dp": 0}
-
-            # List of metrics to average
-            metrics = [
-                "input_throughput",
-                "gen_throughput",
-                "new_seq",
-                "new_token",
-                "running_req",
-                "queue_req",
-                "inflight_req",
-                "transfer_req",
-                "prealloc_req",
-                "num_tokens",
-                "token_usage",
-                "preallocated_usage",
-            ]
-
-            for metric in metrics:
-                values = [b.get(metric) for b in batches_at_time if metric in b]
-                if values:
-                    avg_batch[metric] = np.mean(values)
-
-            # Copy type from first batch
-            if batches_at_time:
-                avg_batch["type"] = batches_at_time[0].get("type", "prefill")
-
-            averaged_batches.append(avg_batch)
+        averaged_batches = _average_batches_by_timestamp(nodes, dp=0)
 
         # Create aggregated node data structure
         node_count = len(nodes)
@@ -163,49 +195,7 @@ def group_nodes_by_dp(node_metrics_list: list[dict]) -> list[dict]:
         if not nodes:
             continue
 
-        # Collect all timestamps and metrics across nodes in this DP group
-        all_batches = defaultdict(list)  # timestamp -> list of metric values
-
-        for node in nodes:
-            for batch in node["prefill_batches"]:
-                ts = batch.get("timestamp", "")
-                if ts:
-                    all_batches[ts].append(batch)
-
-        # Average metrics at each timestamp
-        averaged_batches = []
-        for timestamp in sorted(all_batches.keys()):
-            batches_at_time = all_batches[timestamp]
-
-            # Average all numeric metrics
-            avg_batch = {"timestamp": timestamp, "dp": dp_idx}
-
-            # List of metrics to average
-            metrics = [
-                "input_throughput",
-                "gen_throughput",
-                "new_seq",
-                "new_token",
-                "running_req",
-                "queue_req",
-                "inflight_req",
-                "transfer_req",
-                "prealloc_req",
-                "num_tokens",
-                "token_usage",
-                "preallocated_usage",
-            ]
-
-            for metric in metrics:
-                values = [b.get(metric) for b in batches_at_time if metric in b]
-                if values:
-                    avg_batch[metric] = np.mean(values)
-
-            # Copy type from first batch
-            if batches_at_time:
-                avg_batch["type"] = batches_at_time[0].get("type", "prefill")
-
-            averaged_batches.append(avg_batch)
+        averaged_batches = _average_batches_by_timestamp(nodes, dp=dp_idx)
 
         # Create grouped node data structure
         tp_count = len(nodes)
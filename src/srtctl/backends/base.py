@@ -5,7 +5,7 @@
 Base types and protocols for backend configurations.
 """
 
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 from enum import Enum
 from typing import TYPE_CHECKING, Any, Optional, Protocol
@@ -125,3 +125,52 @@ class BackendProtocol(Protocol):
     def get_served_model_name(self, default: str) -> str:
         """Get served model name from backend config, or return default."""
         ...
+
+
+# ============================================================================
+# CLI Argument Rendering
+# ============================================================================
+
+# Translation table for snake_case config keys -> kebab-case CLI flags
+_FLAG_NAME_TABLE = str.maketrans("_", "-")
+_FLAG_PREFIX = "--"
+
+
+def _bool_flag_args(flag: str, value: bool) -> list[str]:
+    return [flag] if value else []
+
+
+def _list_flag_args(flag: str, value: list[Any]) -> list[str]:
+    return [flag, *[str(v) for v in value]]
+
+
+def _none_flag_args(flag: str, value: None) -> list[str]:
+    return []
+
+
+def _scalar_flag_args(flag: str, value: Any) -> list[str]:
+    return [flag, str(value)]
+
+
+# Renderers by exact value type; anything else is passed as a single string value
+_FLAG_ARG_RENDERERS: dict[type, Callable[[str, Any], list[str]]] = {
+    bool: _bool_flag_args,
+    list: _list_flag_args,
+    type(None): _none_flag_args,
+}
+
+
+def config_to_cli_args(config: dict[str, Any]) -> list[str]:
+    """Convert a backend server config dict to CLI arguments.
+
+    Keys are sorted and converted to kebab-case flags. True booleans become bare
+    flags, lists become a flag followed by each item, and False/None are omitted.
+    """
+    if not config:
+        return []
+
+    args: list[str] = []
+    for key, value in sorted(config.items()):
+        render = _FLAG_ARG_RENDERERS.get(type(value), _scalar_flag_args)
+        args.extend(render(_FLAG_PREFIX + key.translate(_FLAG_NAME_TABLE), value))
+    return args
@@ -22,6 +22,8 @@ from typing import (
 from marshmallow import Schema
 from marshmallow_dataclass import dataclass
 
+from srtctl.backends.base import config_to_cli_args
+
 if TYPE_CHECKING:
     from srtctl.backends.base import SrunConfig
     from srtctl.core.runtime import RuntimeContext
@@ -94,18 +96,24 @@ class SGLangProtocol:
 
         return SrunConfig(mpi=None, oversubscribe=False, launch_per_endpoint=False)
 
-    def get_config_for_mode(self, mode: WorkerMode) -> dict[str, Any]:
-        """Get merged config dict for a worker mode."""
+    def _mode_section(self, mode: WorkerMode) -> dict[str, Any] | None:
+        """Get the sglang_config section for a worker mode, without copying it."""
         if not self.sglang_config:
-            return {}
+            return None
 
         if mode == "prefill":
-            return dict(self.sglang_config.prefill or {})
+            section = self.sglang_config.prefill
         elif mode == "decode":
-            return dict(self.sglang_config.decode or {})
+            section = self.sglang_config.decode
         elif mode == "agg":
-            return dict(self.sglang_config.aggregated or {})
-        return {}
+            section = self.sglang_config.aggregated
+        else:
+            section = None
+        return section
+
+    def get_config_for_mode(self, mode: WorkerMode) -> dict[str, Any]:
+        """Get merged config dict for a worker mode."""
+        return dict(self._mode_section(mode) or {})
 
     def get_environment_for_mode(self, mode: WorkerMode) -> dict[str, str]:
         """Get environment variables for a worker mode."""
@@ -127,8 +135,9 @@ class SGLangProtocol:
 
     def is_grpc_mode(self, mode: WorkerMode) -> bool:
         """Check if gRPC mode is enabled for a worker mode."""
-        config = self.get_config_for_mode(mode)
-        return config.get("grpc-mode", False)
+        # Read the mode section in place; get_config_for_mode() copies it for callers that mutate.
+        config = self._mode_section(mode)
+        return bool(config and config.get("grpc-mode", False))
 
     def get_served_model_name(self, default: str) -> str:
         """Get served model name from SGLang config, or return default."""
@@ -303,22 +312,6 @@ class SGLangProtocol:
             cmd.extend(["--kv-events-config", json.dumps(kv_cfg)])
 
         # Add all config flags
-        cmd.extend(_config_to_cli_args(config))
+        cmd.extend(config_to_cli_args(config))
 
         return cmd
-
-
-def _config_to_cli_args(config: dict[str, Any]) -> list[str]:
-    """Convert config dict to CLI arguments."""
-    args: list[str] = []
-    for key, value in sorted(config.items()):
-        flag_name = key.replace("_", "-")
-        if isinstance(value, bool):
-            if value:
-                args.append(f"--{flag_name}")
-        elif isinstance(value, list):
-            args.append(f"--{flag_name}")
-            args.extend(str(v) for v in value)
-        elif value is not None:
-            args.extend([f"--{flag_name}", str(value)])
-    return args
@@ -23,6 +23,8 @@ from typing import (
 from marshmallow import Schema
 from marshmallow_dataclass import dataclass
 
+from srtctl.backends.base import config_to_cli_args
+
 if TYPE_CHECKING:
     from srtctl.backends.base import SrunConfig
     from srtctl.core.runtime import RuntimeContext
@@ -337,7 +339,7 @@ class VLLMProtocol:
         # agg mode: no flag (default behavior)
 
         # KV connector - check for mode-specific override first, then fall back to default
-        # Pop from config so it doesn't get added again by _config_to_cli_args
+        # Pop from config so it doesn't get added again by config_to_cli_args
         mode_connector = config.pop("connector", None)
         connector = mode_connector if mode_connector is not None else self.connector
 
@@ -365,7 +367,7 @@ class VLLMProtocol:
                     str(dp_rpc_port),
                 ]
             )
-            # Note: --data-parallel-size is added via _config_to_cli_args from vllm_config
+            # Note: --data-parallel-size is added via config_to_cli_args from vllm_config
         elif is_multi_node:
             # Standard TP+PP multi-node coordination flags
             node_rank = endpoint_nodes.index(process.node)
@@ -389,22 +391,6 @@ class VLLMProtocol:
             cmd.extend(["--dump-config-to", str(dump_config_path)])
 
         # Add all config flags from vllm_config
-        cmd.extend(_config_to_cli_args(config))
+        cmd.extend(config_to_cli_args(config))
 
         return cmd
-
-
-def _config_to_cli_args(config: dict[str, Any]) -> list[str]:
-    """Convert config dict to CLI arguments."""
-    args: list[str] = []
-    for key, value in sorted(config.items()):
-        flag_name = key.replace("_", "-")
-        if isinstance(value, bool):
-            if value:
-                args.append(f"--{flag_name}")
-        elif isinstance(value, list):
-            args.append(f"--{flag_name}")
-            args.extend(str(v) for v in value)
-        elif value is not None:
-            args.extend([f"--{flag_name}", str(value)])
-    return args
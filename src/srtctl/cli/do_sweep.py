@@ -23,7 +23,7 @@ from pathlib import Path
 
 from srtctl.cli.mixins import BenchmarkStageMixin, FrontendStageMixin, PostProcessStageMixin, WorkerStageMixin
 from srtctl.core.config import load_config
-from srtctl.core.health import wait_for_port
+from srtctl.core.health import wait_for_ports
 from srtctl.core.processes import (
     ManagedProcess,
     ProcessRegistry,
@@ -131,22 +131,20 @@ class SweepOrchestrator(WorkerStageMixin, FrontendStageMixin, BenchmarkStageMixi
         )
 
         # 300s timeout to handle slow container imports on first run
-        logger.info("Waiting for NATS (port 4222) on %s...", infra_node)
-        if not wait_for_port(infra_node, 4222, timeout=300):
+        logger.info("Waiting for NATS (port 4222) and etcd (port 2379) on %s...", infra_node)
+        pending = wait_for_ports([(infra_node, 4222), (infra_node, 2379)], timeout=300)
+        if (infra_node, 4222) in pending:
             raise RuntimeError("NATS failed to start")
-        logger.info("NATS is ready")
-
-        logger.info("Waiting for etcd (port 2379) on %s...", infra_node)
-        if not wait_for_port(infra_node, 2379, timeout=300):
+        if (infra_node, 2379) in pending:
             raise RuntimeError("etcd failed to start")
-        logger.info("etcd is ready")
+        logger.info("NATS and etcd are ready")
 
         return managed
 
     def _print_connection_info(self) -> None:
         """Print srun commands for connecting to nodes."""
         container_args = f"--container-image={self.runtime.container_image}"
-        mounts_str = ",".join(f"{src}:{dst}" for src, dst in self.runtime.container_mounts.items())
+        mounts_str = self.runtime.container_mounts_str
         if mounts_str:
             container_args += f" --container-mounts={mounts_str}"
 
@@ -18,18 +18,25 @@ Usage:
 """
 
 import contextlib
+import hashlib
+import os
+import pickle
+import tempfile
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
 import questionary
-import yaml
 from questionary import Style
 from rich.console import Console
+from rich.live import Live
 from rich.panel import Panel
 from rich.syntax import Syntax
 from rich.table import Table
 from rich.tree import Tree
 
+from srtctl.core import yaml_utils
+
 console = Console()
 
 # Custom questionary style
@@ -60,8 +67,18 @@ def find_recipes(root: Path | None = None) -> list[Path]:
     return sorted(recipes_dir.rglob("*.yaml"))
 
 
-def display_config_summary(config: dict[str, Any], title: str = "Configuration") -> None:
-    """Display a rich summary of a config dict."""
+# Rendered summary trees keyed by (config digest, title); oldest entry evicted first
+_TREE_CACHE_SIZE = 4
+_tree_cache: dict[tuple[bytes, str], Tree] = {}
+
+
+def _config_digest(config: dict[str, Any]) -> bytes:
+    """Content digest of a config dict, used to detect unchanged configs between renders."""
+    return hashlib.blake2b(pickle.dumps(config), digest_size=16).digest()
+
+
+def _build_config_tree(config: dict[str, Any], title: str) -> Tree:
+    """Build the rich summary tree for a config dict."""
     tree = Tree(f"[bold cyan]{title}[/]")
 
     # Model info
@@ -97,22 +114,47 @@ def display_config_summary(config: dict[str, Any], title: str = "Configuration")
         for key, values in config["sweep"].items():
             sweep_branch.add(f"{key}: [cyan]{values}[/]")
 
+    return tree
+
+
+def display_config_summary(config: dict[str, Any], title: str = "Configuration") -> None:
+    """Display a rich summary of a config dict.
+
+    The rendered tree is reused when the same config is displayed again unchanged.
+    """
+    key = (_config_digest(config), title)
+    tree = _tree_cache.get(key)
+    if tree is None:
+        tree = _build_config_tree(config, title)
+        if len(_tree_cache) >= _TREE_CACHE_SIZE:
+            del _tree_cache[next(iter(_tree_cache))]
+        _tree_cache[key] = tree
+
     console.print(tree)
 
 
-def display_sweep_table(configs: list[tuple[dict, dict]], title: str = "Sweep Jobs") -> None:
-    """Display sweep configurations as a rich table."""
+def display_sweep_table(configs: Iterable[tuple[dict, dict]], title: str = "Sweep Jobs") -> int:
+    """Display sweep configurations as a rich table.
+
+    Rows are rendered as they arrive, so a lazy iterable (see iter_sweep_configs)
+    is never fully materialized.
+
+    Returns:
+        Number of rows displayed
+    """
     table = Table(title=title, show_header=True, header_style="bold cyan")
     table.add_column("#", style="dim", width=4)
     table.add_column("Job Name", style="green")
     table.add_column("Parameters", style="yellow")
 
-    for i, (config_dict, params) in enumerate(configs, 1):
-        job_name = config_dict.get("name", f"job_{i}")
-        params_str = ", ".join(f"{k}={v}" for k, v in params.items())
-        table.add_row(str(i), job_name, params_str)
+    count = 0
+    with Live(table, console=console, refresh_per_second=8):
+        for count, (config_dict, params) in enumerate(configs, 1):
+            job_name = config_dict.get("name", f"job_{count}")
+            params_str = ", ".join(f"{k}={v}" for k, v in params.items())
+            table.add_row(str(count), job_name, params_str)
 
-    console.print(table)
+    return count
 
 
 def display_sbatch_script(script: str, title: str = "Generated sbatch Script") -> None:
@@ -184,12 +226,11 @@ def confirm_submission(config_path: Path, config: dict, is_sweep: bool) -> bool:
     display_config_summary(config)
 
     if is_sweep:
-        from srtctl.core.sweep import generate_sweep_configs
+        from srtctl.core.sweep import iter_sweep_configs
 
-        configs = generate_sweep_configs(config)
         console.print()
-        display_sweep_table(configs)
-        console.print(f"\n[bold]Total jobs:[/] [cyan]{len(configs)}[/]")
+        total = display_sweep_table(iter_sweep_configs(config))
+        console.print(f"\n[bold]Total jobs:[/] [cyan]{total}[/]")
 
     console.print()
     return questionary.confirm(
@@ -202,19 +243,53 @@ def confirm_submission(config_path: Path, config: dict, is_sweep: bool) -> bool:
 def preview_sbatch(config_path: Path, config: dict) -> None:
     """Preview the generated sbatch script."""
     from srtctl.cli.submit import generate_minimal_sbatch_script
-    from srtctl.core.config import load_config
+    from srtctl.core.config import load_config_dict
 
-    typed_config = load_config(config_path)
+    typed_config = load_config_dict(config, source=str(config_path))
     script = generate_minimal_sbatch_script(typed_config, config_path)
     display_sbatch_script(script)
 
 
+def write_config_file(config_path: Path, config: dict, modified: bool) -> Path:
+    """Get a YAML file holding config, for commands that read the config from disk.
+
+    Unmodified configs use their original file; modified ones are written to a
+    temp file only at this point, not on every edit.
+    """
+    if not modified:
+        return config_path
+
+    fd, temp_path = tempfile.mkstemp(suffix=".yaml", prefix="srtctl_modified_")
+    with os.fdopen(fd, "w") as f:
+        yaml_utils.safe_dump(config, f)
+    return Path(temp_path)
+
+
+def _set_path(config: dict, parts: list[str], value: Any) -> dict:
+    """Return a copy of config with value set at the nested key path.
+
+    Only the dicts along the path are copied; untouched branches are shared
+    with the input, which is never mutated.
+    """
+    root = {**config}
+    target = root
+    for p in parts[:-1]:
+        child = target.get(p)
+        target[p] = {**child} if isinstance(child, dict) else {}
+        target = target[p]
+    target[parts[-1]] = value
+    return root
+
+
 def modify_config_interactive(config: dict) -> dict:
-    """Allow interactive modification of config parameters."""
+    """Allow interactive modification of config parameters.
+
+    Returns a new config dict; the input config is left unchanged.
+    """
     console.print("\n[bold]Modify Configuration[/]")
     console.print("[dim]Press Enter to keep current value, or type new value[/]\n")
 
-    modified = config.copy()
+    modified = config
 
     # Modifiable fields
     modifiable = [
@@ -247,13 +322,7 @@ def modify_config_interactive(config: dict) -> dict:
                 with contextlib.suppress(ValueError):
                     new_val = float(new_val)
 
-            # Navigate and set
-            target = modified
-            for p in parts[:-1]:
-                if p not in target:
-                    target[p] = {}
-                target = target[p]
-            target[parts[-1]] = new_val
+            modified = _set_path(modified, parts, new_val)
 
     return modified
 
@@ -281,9 +350,10 @@ def run_interactive() -> int:
 
     # Load config
     with open(config_path) as f:
-        config = yaml.safe_load(f)
+        config = yaml_utils.safe_load(f)
 
     is_sweep = "sweep" in config
+    modified = False
 
     # Show summary
     console.print()
@@ -314,33 +384,32 @@ def run_interactive() -> int:
             if not config_path:
                 continue
             with open(config_path) as f:
-                config = yaml.safe_load(f)
+                config = yaml_utils.safe_load(f)
             is_sweep = "sweep" in config
+            modified = False
             display_config_summary(config, title=str(config_path))
 
         elif action == "preview":
-            preview_sbatch(config_path, config)
+            preview_sbatch(write_config_file(config_path, config, modified), config)
 
         elif action == "modify":
             config = modify_config_interactive(config)
-            # Save to temp file for submission
-            import tempfile
-
-            fd, temp_path = tempfile.mkstemp(suffix=".yaml", prefix="srtctl_modified_")
-            with open(temp_path, "w") as f:
-                yaml.dump(config, f)
-            config_path = Path(temp_path)
+            modified = True
             console.print("[green]Configuration modified.[/]")
             display_config_summary(config)
 
         elif action == "dry-run":
             from srtctl.cli.submit import submit_single, submit_sweep
+            from srtctl.core.config import load_config_dict
 
             console.print()
+            # The rendered script copies and runs config_path, so it must hold the edits
+            dry_run_path = write_config_file(config_path, config, modified)
             if is_sweep:
-                submit_sweep(config_path, dry_run=True)
+                submit_sweep(dry_run_path, dry_run=True)
             else:
-                submit_single(config_path=config_path, dry_run=True)
+                typed_config = load_config_dict(config, source=str(config_path))
+                submit_single(config_path=dry_run_path, config=typed_config, dry_run=True)
 
         elif action == "submit":
             if not confirm_submission(config_path, config, is_sweep):
@@ -350,10 +419,11 @@ def run_interactive() -> int:
             from srtctl.cli.submit import submit_single, submit_sweep
 
             try:
+                submit_path = write_config_file(config_path, config, modified)
                 if is_sweep:
-                    submit_sweep(config_path, dry_run=False)
+                    submit_sweep(submit_path, dry_run=False)
                 else:
-                    submit_single(config_path=config_path, dry_run=False)
+                    submit_single(config_path=submit_path, dry_run=False)
                 console.print("\n[bold green]✅ Submission complete![/]")
                 return 0
             except Exception as e:
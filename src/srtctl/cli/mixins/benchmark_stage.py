@@ -11,11 +11,12 @@ import logging
 import shlex
 import threading
 import time
+from collections.abc import Iterable
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from srtctl.core.health import wait_for_model
-from srtctl.core.slurm import get_hostname_ip, start_srun_process
+from srtctl.core.slurm import get_hostname_ip, get_node_ips, get_slurm_job_id, start_srun_process
 from srtctl.core.status import JobStage, JobStatus, StatusReporter
 
 if TYPE_CHECKING:
@@ -28,6 +29,15 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def _resolve_node_ips(nodes: Iterable[str], network_interface: str | None = None) -> dict[str, str]:
+    """Resolve each distinct node once, warming the IP cache with one batched srun inside a job."""
+    unique_nodes = list(dict.fromkeys(nodes))
+    slurm_job_id = get_slurm_job_id()
+    if slurm_job_id and len(unique_nodes) > 1:
+        get_node_ips(unique_nodes, slurm_job_id, network_interface)
+    return {node: get_hostname_ip(node, network_interface) for node in unique_nodes}
+
+
 class BenchmarkStageMixin:
     """Mixin for benchmark execution stage.
 
@@ -173,7 +183,7 @@ class BenchmarkStageMixin:
             nodelist=[self.runtime.nodes.head],
             output=str(log_file),
             container_image=str(self.runtime.container_image),
-            container_mounts=self.runtime.container_mounts,
+            container_mounts_str=self.runtime.container_mounts_str,
             env_to_set=env_to_set,
         )
 
@@ -196,12 +206,7 @@ class BenchmarkStageMixin:
             p = self.config.profiling
 
             # Traffic generator params
-            if p.isl is not None:
-                env["PROFILE_ISL"] = str(p.isl)
-            if p.osl is not None:
-                env["PROFILE_OSL"] = str(p.osl)
-            if p.concurrency is not None:
-                env["PROFILE_CONCURRENCY"] = str(p.concurrency)
+            env.update(p.get_traffic_env_vars())
 
             # Model name
             env["PROFILE_MODEL_NAME"] = self.config.served_model_name
@@ -210,43 +215,20 @@ class BenchmarkStageMixin:
             env["HEAD_NODE"] = self.runtime.nodes.head
             env["HEAD_PORT"] = str(self.runtime.frontend_port)
 
-            # Collect worker leader IPs by mode
-            prefill_ips = []
-            decode_ips = []
-            agg_ips = []
-
+            # Collect worker leader IPs by mode, resolving each leader node once
+            ips_by_mode: dict[str, list[str]] = {"prefill": [], "decode": [], "agg": []}
+            leader_ips = _resolve_node_ips(e.leader_node for e in self.endpoints if e.mode in ips_by_mode)
             for endpoint in self.endpoints:
-                leader_ip = get_hostname_ip(endpoint.leader_node)
-                if endpoint.mode == "prefill":
-                    prefill_ips.append(leader_ip)
-                elif endpoint.mode == "decode":
-                    decode_ips.append(leader_ip)
-                elif endpoint.mode == "agg":
-                    agg_ips.append(leader_ip)
-
-            if prefill_ips:
-                env["PROFILE_PREFILL_IPS"] = ",".join(prefill_ips)
-            if decode_ips:
-                env["PROFILE_DECODE_IPS"] = ",".join(decode_ips)
-            if agg_ips:
-                env["PROFILE_AGG_IPS"] = ",".join(agg_ips)
+                if endpoint.mode in ips_by_mode:
+                    ips_by_mode[endpoint.mode].append(leader_ips[endpoint.leader_node])
+
+            for mode, ips in ips_by_mode.items():
+                if ips:
+                    env[f"PROFILE_{mode.upper()}_IPS"] = ",".join(ips)
 
             # Phase-specific step configs
-            if p.prefill:
-                if p.prefill.start_step is not None:
-                    env["PROFILE_PREFILL_START_STEP"] = str(p.prefill.start_step)
-                if p.prefill.stop_step is not None:
-                    env["PROFILE_PREFILL_STOP_STEP"] = str(p.prefill.stop_step)
-            if p.decode:
-                if p.decode.start_step is not None:
-                    env["PROFILE_DECODE_START_STEP"] = str(p.decode.start_step)
-                if p.decode.stop_step is not None:
-                    env["PROFILE_DECODE_STOP_STEP"] = str(p.decode.stop_step)
-            if p.aggregated:
-                if p.aggregated.start_step is not None:
-                    env["PROFILE_AGG_START_STEP"] = str(p.aggregated.start_step)
-                if p.aggregated.stop_step is not None:
-                    env["PROFILE_AGG_STOP_STEP"] = str(p.aggregated.stop_step)
+            for mode in ips_by_mode:
+                env.update(p.get_phase_env_vars(mode))
 
             # Torch profiler directory
             if p.is_torch:
@@ -263,11 +245,9 @@ class BenchmarkStageMixin:
         Collects metrics endpoints from all backend processes that expose
         a sys_port (vLLM workers with AIPerf metrics enabled).
         """
-        urls: list[str] = []
-        for process in self.backend_processes:
-            if process.sys_port > 0:
-                host = get_hostname_ip(process.node, self.runtime.network_interface)
-                urls.append(f"http://{host}:{process.sys_port}/metrics")
+        metrics_processes = [p for p in self.backend_processes if p.sys_port > 0]
+        hosts = _resolve_node_ips((p.node for p in metrics_processes), self.runtime.network_interface)
+        urls = [f"http://{hosts[p.node]}:{p.sys_port}/metrics" for p in metrics_processes]
 
         if not urls:
             return {}
@@ -9,11 +9,10 @@ Handles frontend/router and nginx startup.
 
 import logging
 from dataclasses import dataclass
-from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from srtctl.core.processes import ManagedProcess
-from srtctl.core.slurm import get_hostname_ip, start_srun_process
+from srtctl.core.slurm import get_hostname_ip, get_node_ips, get_slurm_job_id, start_srun_process
 from srtctl.frontends import get_frontend
 
 if TYPE_CHECKING:
@@ -144,7 +143,7 @@ class FrontendStageMixin:
             nodelist=[topology.nginx_node],
             output=str(nginx_log),
             container_image=self.config.frontend.nginx_container,
-            container_mounts=self.runtime.container_mounts,
+            container_mounts_str=self.runtime.container_mounts_str,
             use_bash_wrapper=False,  # Already wrapped in bash -c
             srun_options={
                 "container-remap-root": "",
@@ -161,13 +160,14 @@ class FrontendStageMixin:
 
     def _generate_nginx_config(self, topology: FrontendTopology) -> str:
         """Generate nginx configuration from template."""
-        from jinja2 import Environment, FileSystemLoader
+        from srtctl.templates import get_template
 
-        template_dir = Path(__file__).parent.parent.parent / "templates"
-        env = Environment(loader=FileSystemLoader(str(template_dir)))
-        template = env.get_template("nginx.conf.j2")
+        template = get_template("nginx.conf.j2")
 
-        # Get IPs for frontend nodes
+        # Get IPs for frontend nodes, warming the IP cache with one batched srun inside a job
+        slurm_job_id = get_slurm_job_id()
+        if slurm_job_id and len(topology.frontend_nodes) > 1:
+            get_node_ips(topology.frontend_nodes, slurm_job_id)
         frontend_hosts = [get_hostname_ip(node) for node in topology.frontend_nodes]
 
         return template.render(
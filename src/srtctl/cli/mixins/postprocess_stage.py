@@ -27,7 +27,7 @@ import requests
 
 from srtctl.benchmarks.base import SCRIPTS_DIR
 from srtctl.core.config import load_cluster_config
-from srtctl.core.schema import AIAnalysisConfig, S3Config
+from srtctl.core.schema import AIAnalysisConfig, S3Config, cached_schema
 from srtctl.core.slurm import start_srun_process
 
 if TYPE_CHECKING:
@@ -71,7 +71,7 @@ class PostProcessStageMixin:
             return None
 
         try:
-            schema = AIAnalysisConfig.Schema()
+            schema = cached_schema(AIAnalysisConfig)
             return schema.load(ai_config_dict)
         except Exception as e:
             logger.warning("Failed to parse reporting.ai_analysis config: %s", e)
@@ -96,7 +96,7 @@ class PostProcessStageMixin:
             return None
 
         try:
-            schema = S3Config.Schema()
+            schema = cached_schema(S3Config)
             return schema.load(s3_dict)
         except Exception as e:
             logger.warning("Failed to parse reporting.s3 config: %s", e)
@@ -23,6 +23,13 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+class _KeepUnknownPlaceholders(dict):
+    """format_map() mapping that leaves unknown {placeholders} unchanged."""
+
+    def __missing__(self, key: str) -> str:
+        return "{" + key + "}"
+
+
 class WorkerStageMixin:
     """Mixin for worker process startup stage.
 
@@ -122,20 +129,15 @@ class WorkerStageMixin:
         # Support simple {node} and {node_id} templating
         # Unknown placeholders are left unchanged (no error thrown)
         node_id = self.runtime.nodes.worker.index(process.node)
-        template_vars = {"node": process.node, "node_id": node_id}
-
-        class SafeDict(dict):
-            def __missing__(self, key: str) -> str:
-                return "{" + key + "}"  # Leave unknown placeholders unchanged
+        template_vars = _KeepUnknownPlaceholders(node=process.node, node_id=node_id)
 
+        # Values without a "{" have nothing to substitute and are used as-is
         for key, value in self.backend.get_environment_for_mode(mode).items():
-            formatted_value = value.format_map(SafeDict(template_vars))
-            env_to_set[key] = formatted_value
+            env_to_set[key] = value.format_map(template_vars) if "{" in value else value
 
         # Add config environment variables with same templating support
         for key, value in self.runtime.environment.items():
-            formatted_value = value.format_map(SafeDict(template_vars))
-            env_to_set[key] = formatted_value
+            env_to_set[key] = value.format_map(template_vars) if "{" in value else value
 
         # Add profiling environment variables
         if profiling.enabled:
@@ -165,7 +167,7 @@ class WorkerStageMixin:
             nodelist=[process.node],
             output=str(worker_log),
             container_image=str(self.runtime.container_image),
-            container_mounts=self.runtime.container_mounts,
+            container_mounts_str=self.runtime.container_mounts_str,
             env_to_set=env_to_set,
             bash_preamble=bash_preamble,
         )
@@ -269,7 +271,7 @@ class WorkerStageMixin:
             nodelist=endpoint_nodes,
             output=str(worker_log),
             container_image=str(self.runtime.container_image),
-            container_mounts=self.runtime.container_mounts,
+            container_mounts_str=self.runtime.container_mounts_str,
             env_to_set=env_to_set,
             bash_preamble=bash_preamble,
             mpi=srun_config.mpi,
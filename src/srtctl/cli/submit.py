@@ -15,6 +15,7 @@ Usage:
 
 import argparse
 import contextlib
+import functools
 import json
 import logging
 import os
@@ -24,8 +25,8 @@ import sys
 import tempfile
 from datetime import datetime
 from pathlib import Path
+from typing import Any
 
-import yaml
 from rich.console import Console
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
@@ -33,7 +34,8 @@ from rich.syntax import Syntax
 from rich.table import Table
 
 # Import from srtctl modules
-from srtctl.core.config import get_srtslurm_setting, load_config
+from srtctl.core import yaml_utils
+from srtctl.core.config import get_srtslurm_setting, load_cluster_config, load_config, load_config_dict
 from srtctl.core.schema import SrtConfig
 from srtctl.core.status import create_job_record
 
@@ -48,11 +50,59 @@ def setup_logging(level: int = logging.INFO) -> None:
     )
 
 
+@functools.cache
+def _package_source_dir() -> Path:
+    """Resolved srtctl source tree (the parent of src/srtctl, i.e., the repo root)."""
+    return Path(__file__).resolve().parent.parent.parent.parent
+
+
+def _srtctl_source(srtctl_root: str | None) -> Path:
+    """Get the srtctl source directory, preferring srtslurm.yaml's srtctl_root."""
+    return Path(srtctl_root) if srtctl_root else _package_source_dir()
+
+
+def _cluster_template_vars(output_dir: Path | None = None) -> dict[str, Any]:
+    """Resolve the sbatch template variables that come from srtslurm.yaml.
+
+    These are the same for every job submitted from one cluster, so they are
+    resolved from a single cluster config lookup rather than one per setting.
+
+    Args:
+        output_dir: Custom output directory (CLI flag, highest priority)
+
+    Returns:
+        Template variables shared by all jobs on this cluster
+    """
+    cluster_config = load_cluster_config() or {}
+
+    srtctl_source = _srtctl_source(cluster_config.get("srtctl_root"))
+
+    # Determine output base directory
+    # Priority: CLI -o flag > srtslurm.yaml output_dir > srtctl_root/outputs
+    if output_dir:
+        output_base = str(output_dir.resolve())
+    else:
+        custom_output_dir = cluster_config.get("output_dir")
+        if custom_output_dir:
+            output_base = str(Path(os.path.expandvars(custom_output_dir)).resolve())
+        else:
+            output_base = str((srtctl_source / "outputs").resolve())
+
+    return {
+        "use_gpus_per_node_directive": cluster_config.get("use_gpus_per_node_directive", True),
+        "use_segment_sbatch_directive": cluster_config.get("use_segment_sbatch_directive", True),
+        "use_exclusive_sbatch_directive": cluster_config.get("use_exclusive_sbatch_directive", False),
+        "srtctl_source": str(srtctl_source.resolve()),
+        "output_base": output_base,
+    }
+
+
 def generate_minimal_sbatch_script(
     config: SrtConfig,
     config_path: Path,
     setup_script: str | None = None,
     output_dir: Path | None = None,
+    timestamp: str | None = None,
 ) -> str:
     """Generate minimal sbatch script that calls the Python orchestrator.
 
@@ -64,39 +114,22 @@ def generate_minimal_sbatch_script(
         config_path: Path to the YAML config file
         setup_script: Optional setup script override (passed via env var)
         output_dir: Custom output directory (CLI flag, highest priority)
+        timestamp: Generation timestamp to stamp into the script (default: now);
+            sweeps pass one shared value for all their jobs
 
     Returns:
         Rendered sbatch script as string
     """
-    from jinja2 import Environment, FileSystemLoader
-
-    # Find template directory and srtctl source
-    # Templates are now in src/srtctl/templates/
-    template_dir = Path(__file__).parent.parent / "templates"
+    from srtctl.templates import get_template
 
-    srtctl_root = get_srtslurm_setting("srtctl_root")
-    # srtctl source is the parent of src/srtctl (i.e., the repo root)
-    srtctl_source = Path(srtctl_root) if srtctl_root else Path(__file__).parent.parent.parent.parent
-
-    # Determine output base directory
-    # Priority: CLI -o flag > srtslurm.yaml output_dir > srtctl_root/outputs
-    if output_dir:
-        output_base = str(output_dir.resolve())
-    else:
-        custom_output_dir = get_srtslurm_setting("output_dir")
-        if custom_output_dir:
-            output_base = str(Path(os.path.expandvars(custom_output_dir)).resolve())
-        else:
-            output_base = str((srtctl_source / "outputs").resolve())
-
-    env = Environment(loader=FileSystemLoader(str(template_dir)))
-    template = env.get_template("job_script_minimal.j2")
+    template = get_template("job_script_minimal.j2")
 
     total_nodes = config.resources.total_nodes
     # Add extra node for dedicated etcd/nats infrastructure
     if config.infra.etcd_nats_dedicated_node:
         total_nodes += 1
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    if timestamp is None:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
     # Resolve container image path (expand aliases from srtslurm.yaml)
     container_image = os.path.expandvars(config.model.container)
@@ -111,14 +144,10 @@ def generate_minimal_sbatch_script(
         time_limit=config.slurm.time_limit or "01:00:00",
         config_path=str(config_path.resolve()),
         timestamp=timestamp,
-        use_gpus_per_node_directive=get_srtslurm_setting("use_gpus_per_node_directive", True),
-        use_segment_sbatch_directive=get_srtslurm_setting("use_segment_sbatch_directive", True),
-        use_exclusive_sbatch_directive=get_srtslurm_setting("use_exclusive_sbatch_directive", False),
         sbatch_directives=config.sbatch_directives,
         container_image=container_image,
-        srtctl_source=str(srtctl_source.resolve()),
-        output_base=output_base,
         setup_script=setup_script,
+        **_cluster_template_vars(output_dir),
     )
 
     return rendered
@@ -131,6 +160,7 @@ def submit_with_orchestrator(
     tags: list[str] | None = None,
     setup_script: str | None = None,
     output_dir: Path | None = None,
+    timestamp: str | None = None,
 ) -> None:
     """Submit job using the new Python orchestrator.
 
@@ -143,6 +173,7 @@ def submit_with_orchestrator(
         tags: Optional tags for the run
         setup_script: Optional custom setup script name (overrides config)
         output_dir: Custom output directory (CLI flag, highest priority)
+        timestamp: Script generation timestamp (default: now)
     """
 
     if config is None:
@@ -153,6 +184,7 @@ def submit_with_orchestrator(
         config_path=config_path,
         setup_script=setup_script,
         output_dir=output_dir,
+        timestamp=timestamp,
     )
 
     if dry_run:
@@ -198,9 +230,7 @@ def submit_with_orchestrator(
             if custom_output_dir:
                 job_output_dir = Path(os.path.expandvars(custom_output_dir)) / job_id
             else:
-                srtctl_root = get_srtslurm_setting("srtctl_root")
-                srtctl_source = Path(srtctl_root) if srtctl_root else Path(__file__).parent.parent.parent.parent
-                job_output_dir = srtctl_source / "outputs" / job_id
+                job_output_dir = _srtctl_source(get_srtslurm_setting("srtctl_root")) / "outputs" / job_id
         job_output_dir.mkdir(parents=True, exist_ok=True)
 
         shutil.copy(config_path, job_output_dir / "config.yaml")
@@ -280,6 +310,7 @@ def submit_single(
     setup_script: str | None = None,
     tags: list[str] | None = None,
     output_dir: Path | None = None,
+    timestamp: str | None = None,
 ):
     """Submit a single job from YAML config.
 
@@ -292,6 +323,7 @@ def submit_single(
         setup_script: Optional custom setup script name
         tags: Optional list of tags
         output_dir: Custom output directory (CLI flag, highest priority)
+        timestamp: Script generation timestamp (default: now)
     """
     if config is None and config_path:
         config = load_config(config_path)
@@ -307,6 +339,7 @@ def submit_single(
         tags=tags,
         setup_script=setup_script,
         output_dir=output_dir,
+        timestamp=timestamp,
     )
 
 
@@ -314,7 +347,7 @@ def is_sweep_config(config_path: Path) -> bool:
     """Check if config file is a sweep config by looking for 'sweep' section."""
     try:
         with open(config_path) as f:
-            config = yaml.safe_load(f)
+            config = yaml_utils.safe_load(f)
         return "sweep" in config if config else False
     except Exception:
         return False
@@ -339,9 +372,11 @@ def submit_sweep(
     from srtctl.core.sweep import generate_sweep_configs
 
     with open(config_path) as f:
-        sweep_config = yaml.safe_load(f)
+        sweep_config = yaml_utils.safe_load(f)
 
     configs = generate_sweep_configs(sweep_config)
+    # One timestamp for the whole sweep rather than one per generated script
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
     # Display sweep table
     table = Table(title=f"Sweep: {sweep_config.get('name', 'unnamed')} ({len(configs)} jobs)")
@@ -367,18 +402,18 @@ def submit_sweep(
             )
         )
 
-        sweep_dir = Path.cwd() / "dry-runs" / f"{sweep_config['name']}_sweep_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        sweep_dir = Path.cwd() / "dry-runs" / f"{sweep_config['name']}_sweep_{timestamp}"
         sweep_dir.mkdir(parents=True, exist_ok=True)
 
         with open(sweep_dir / "sweep_config.yaml", "w") as f:
-            yaml.dump(sweep_config, f, default_flow_style=False)
+            yaml_utils.safe_dump(sweep_config, f, default_flow_style=False)
 
         for i, (config_dict, _params) in enumerate(configs, 1):
             job_name = config_dict.get("name", f"job_{i}")
             job_dir = sweep_dir / f"job_{i:03d}_{job_name}"
             job_dir.mkdir(exist_ok=True)
             with open(job_dir / "config.yaml", "w") as f:
-                yaml.dump(config_dict, f, default_flow_style=False)
+                yaml_utils.safe_dump(config_dict, f, default_flow_style=False)
 
         console.print(f"[dim]📁 Output:[/] {sweep_dir}")
         return
@@ -395,26 +430,27 @@ def submit_sweep(
             job_name = config_dict.get("name", f"job_{i}")
             progress.update(task, description=f"[{i}/{len(configs)}] {job_name}")
 
-        # Save temp config and submit
-        fd, temp_config_path = tempfile.mkstemp(suffix=".yaml", prefix="srtctl_sweep_", text=True)
-        try:
-            with os.fdopen(fd, "w") as f:
-                yaml.dump(config_dict, f)
-
-            config = load_config(Path(temp_config_path))
-            submit_single(
-                config_path=Path(temp_config_path),
-                config=config,
-                dry_run=False,
-                setup_script=setup_script,
-                tags=tags,
-                output_dir=output_dir,
-            )
-        finally:
-            with contextlib.suppress(OSError):
-                os.remove(temp_config_path)
+            # Validate the in-memory config; the temp file is only for the sbatch script to reference
+            config = load_config_dict(config_dict, source=job_name)
+            fd, temp_config_path = tempfile.mkstemp(suffix=".yaml", prefix="srtctl_sweep_", text=True)
+            try:
+                with os.fdopen(fd, "w") as f:
+                    yaml_utils.safe_dump(config_dict, f)
+
+                submit_single(
+                    config_path=Path(temp_config_path),
+                    config=config,
+                    dry_run=False,
+                    setup_script=setup_script,
+                    tags=tags,
+                    output_dir=output_dir,
+                    timestamp=timestamp,
+                )
+            finally:
+                with contextlib.suppress(OSError):
+                    os.remove(temp_config_path)
 
-            progress.advance(task)
+                progress.advance(task)
 
     console.print(f"\n[bold green]✅ Sweep complete![/] Submitted {len(configs)} jobs.")
 
@@ -428,8 +464,15 @@ def find_yaml_files(directory: Path) -> list[Path]:
     Returns:
         Sorted list of YAML file paths
     """
-    yaml_files = list(directory.rglob("*.yaml")) + list(directory.rglob("*.yml"))
-    return sorted(set(yaml_files))
+    # One os.walk (scandir-based) pass collects both extensions, instead of a
+    # separate rglob tree walk per pattern
+    yaml_files = [
+        Path(dirpath, name)
+        for dirpath, _dirnames, filenames in os.walk(directory)
+        for name in filenames
+        if name.endswith((".yaml", ".yml"))
+    ]
+    return sorted(yaml_files)
 
 
 def submit_directory(
@@ -25,7 +25,7 @@ from srtctl.backends import (
     SGLangServerConfig,
 )
 
-from .config import get_srtslurm_setting, load_config
+from .config import get_srtslurm_setting, load_config, load_config_dict
 from .formatting import FormattablePath, FormattableString
 from .health import (
     WorkerHealthResult,
@@ -35,8 +35,9 @@ from .health import (
     wait_for_health,
     wait_for_model,
     wait_for_port,
+    wait_for_ports,
 )
-from .ip_utils import get_local_ip, get_node_ip
+from .ip_utils import get_local_ip, get_node_ip, get_node_ips_batch
 from .processes import (
     ManagedProcess,
     NamedProcesses,
@@ -61,6 +62,7 @@ from .schema import (
     SrtConfig,
 )
 from .slurm import (
+    clear_ip_cache,
     get_container_mounts_str,
     get_hostname_ip,
     get_node_ips,
@@ -80,6 +82,7 @@ from .topology import (
 __all__ = [
     # Config loading
     "load_config",
+    "load_config_dict",
     "get_srtslurm_setting",
     # Schema types (frozen dataclasses)
     "SrtConfig",
@@ -112,11 +115,13 @@ __all__ = [
     "get_slurm_nodelist",
     "get_hostname_ip",
     "get_node_ips",
+    "clear_ip_cache",
     "start_srun_process",
     "run_command",
     "get_container_mounts_str",
     # IP utilities
     "get_node_ip",
+    "get_node_ips_batch",
     "get_local_ip",
     # Topology (worker allocation)
     "Endpoint",
@@ -132,6 +137,7 @@ __all__ = [
     "start_process_monitor",
     # Health checks
     "wait_for_port",
+    "wait_for_ports",
     "wait_for_health",
     "wait_for_etcd",
     "wait_for_model",
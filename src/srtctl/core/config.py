@@ -7,18 +7,18 @@ Config loading and resolution with srtslurm.yaml integration.
 
 This module provides:
 - load_config(): Load YAML config, apply cluster defaults, return typed SrtConfig
+- load_config_dict(): Same as load_config() for an already-parsed config dict
 - get_srtslurm_setting(): Get cluster-wide settings
 """
 
-import copy
+import functools
 import logging
 import os
 from pathlib import Path
 from typing import Any
 
-import yaml
-
-from .schema import ClusterConfig, SrtConfig
+from . import yaml_utils
+from .schema import ClusterConfig, SrtConfig, cached_schema
 
 logger = logging.getLogger(__name__)
 
@@ -63,21 +63,36 @@ def load_cluster_config() -> dict[str, Any] | None:
             return None
 
     try:
-        with open(cluster_config_path) as f:
-            raw_config = yaml.safe_load(f)
-
-        # Validate with marshmallow schema
-        schema = ClusterConfig.Schema()
-        validated = schema.load(raw_config)
-        logger.debug(f"Loaded cluster config from {cluster_config_path}")
-
-        # Dump back to dict for compatibility
-        return schema.dump(validated)
+        cluster_config = _load_cluster_config_file(
+            str(cluster_config_path.resolve()), cluster_config_path.stat().st_mtime_ns
+        )
+        # Copy so callers can't mutate the cached result
+        return yaml_utils.copy_data(cluster_config)
     except Exception as e:
         logger.warning(f"Failed to load or validate srtslurm.yaml: {e}")
         return None
 
 
+@functools.lru_cache(maxsize=8)
+def _load_cluster_config_file(path: str, mtime_ns: int) -> dict[str, Any]:
+    """Parse and validate a srtslurm.yaml file.
+
+    Cached by (path, mtime) so repeated lookups (e.g. get_srtslurm_setting
+    across a sweep) skip the YAML parse and schema validation, while edits
+    to the file are still picked up.
+    """
+    with open(path) as f:
+        raw_config = yaml_utils.safe_load(f)
+
+    # Validate with marshmallow schema
+    schema = cached_schema(ClusterConfig)
+    validated = schema.load(raw_config)
+    logger.debug(f"Loaded cluster config from {path}")
+
+    # Dump back to dict for compatibility
+    return schema.dump(validated)
+
+
 def resolve_config_with_defaults(user_config: dict[str, Any], cluster_config: dict[str, Any] | None) -> dict[str, Any]:
     """
     Resolve user config by applying cluster defaults and aliases.
@@ -95,7 +110,7 @@ def resolve_config_with_defaults(user_config: dict[str, Any], cluster_config: di
         Resolved config dict with all defaults applied
     """
     # Deep copy to avoid mutating original
-    config = copy.deepcopy(user_config)
+    config = yaml_utils.copy_data(user_config)
 
     if cluster_config is None:
         return config
@@ -188,10 +203,29 @@ def load_config(path: Path | str) -> SrtConfig:
     if not path.exists():
         raise FileNotFoundError(f"Config file not found: {path}")
 
-    # Load raw user config
-    with open(path) as f:
-        user_config = yaml.safe_load(f)
+    # Load raw user config; load_config_dict copies it before applying defaults
+    user_config = yaml_utils.load_file(path, mutable=False)
+
+    return load_config_dict(user_config, source=str(path))
 
+
+def load_config_dict(user_config: dict[str, Any], source: str = "config dict") -> SrtConfig:
+    """
+    Validate an in-memory config dict, applying cluster defaults.
+
+    Same as load_config() for callers that already hold the parsed dict
+    (e.g. expanded sweep configs), avoiding a YAML write/read round-trip.
+
+    Args:
+        user_config: User config as dict
+        source: Description of where the config came from, used in errors
+
+    Returns:
+        SrtConfig frozen dataclass
+
+    Raises:
+        ValueError: If config validation fails
+    """
     # Load cluster defaults (optional)
     cluster_config = load_cluster_config()
 
@@ -200,10 +234,9 @@ def load_config(path: Path | str) -> SrtConfig:
 
     # Parse with marshmallow schema to get typed SrtConfig
     try:
-        schema = SrtConfig.Schema()
-        config = schema.load(resolved_config)
+        config = cached_schema(SrtConfig).load(resolved_config)
         assert isinstance(config, SrtConfig)
         logger.info(f"Loaded config: {config.name}")
         return config
     except Exception as e:
-        raise ValueError(f"Invalid config in {path}: {e}") from e
+        raise ValueError(f"Invalid config in {source}: {e}") from e
@@ -6,6 +6,7 @@ HTTP health check and port waiting utilities.
 
 This module provides:
 - wait_for_port(): Poll TCP port availability
+- wait_for_ports(): Poll several TCP ports concurrently
 - wait_for_health(): HTTP health check with worker count validation
 - wait_for_etcd(): Wait for etcd to be ready
 - wait_for_model(): Wait for model with worker count validation (replaces bash version)
@@ -13,23 +14,55 @@ This module provides:
 - check_sglang_router_health(): Parse sglang /workers response for worker counts
 """
 
+import errno
+import itertools
 import logging
+import random
+import selectors
 import socket
 import threading
 import time
+from collections import Counter
 from dataclasses import dataclass
 
-import requests
+import urllib3
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    from json import loads as _json_loads
 
 logger = logging.getLogger(__name__)
 
 
+# ============================================================================
+# HTTP Connection Pool
+# ============================================================================
+
+# Health polls are plain GETs, so they go straight through urllib3 rather than
+# requests; one thread-safe pool keeps connections to each host alive.
+_HTTP_TIMEOUT = urllib3.Timeout(connect=2.0, read=5.0)
+
+_pool: urllib3.PoolManager | None = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> urllib3.PoolManager:
+    """Get the shared HTTP connection pool for health polling."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = urllib3.PoolManager(num_pools=4, maxsize=8, retries=False, timeout=_HTTP_TIMEOUT)
+    return _pool
+
+
 # ============================================================================
 # Worker Health Check Result
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkerHealthResult:
     """Result of a worker health check."""
 
@@ -39,6 +72,7 @@ class WorkerHealthResult:
     prefill_expected: int = 0
     decode_ready: int = 0
     decode_expected: int = 0
+    regular_ready: int = 0
 
 
 # ============================================================================
@@ -46,6 +80,38 @@ class WorkerHealthResult:
 # ============================================================================
 
 
+def _worker_count_result(
+    prefill_ready: int,
+    prefill_expected: int,
+    decode_ready: int,
+    decode_expected: int,
+    regular_ready: int = 0,
+) -> WorkerHealthResult:
+    """Build a WorkerHealthResult and its status message from worker counts."""
+    ready = prefill_ready >= prefill_expected and decode_ready >= decode_expected
+    regular = f" ({regular_ready} regular workers)" if regular_ready > 0 else ""
+    have = f"Have {prefill_ready} prefills and {decode_ready} decodes."
+    if ready:
+        message = f"Model is ready. {have}{regular}"
+    else:
+        message = (
+            f"Model is not ready, waiting for "
+            f"{max(0, prefill_expected - prefill_ready)} prefills and "
+            f"{max(0, decode_expected - decode_ready)} decodes. "
+            f"{have}{regular}"
+        )
+
+    return WorkerHealthResult(
+        ready=ready,
+        message=message,
+        prefill_ready=prefill_ready,
+        prefill_expected=prefill_expected,
+        decode_ready=decode_ready,
+        decode_expected=decode_expected,
+        regular_ready=regular_ready,
+    )
+
+
 def check_sglang_router_health(
     response_json: dict,
     expected_prefill: int,
@@ -94,30 +160,7 @@ def check_sglang_router_health(
     # (caller passes expected_prefill=0, expected_decode=num_agg)
     effective_decode = actual_decode + actual_regular
 
-    ready = actual_prefill >= expected_prefill and effective_decode >= expected_decode
-
-    if ready:
-        message = f"Model is ready. Have {actual_prefill} prefills and {effective_decode} decodes."
-        if actual_regular > 0:
-            message += f" ({actual_regular} regular workers)"
-    else:
-        message = (
-            f"Model is not ready, waiting for "
-            f"{max(0, expected_prefill - actual_prefill)} prefills and "
-            f"{max(0, expected_decode - effective_decode)} decodes. "
-            f"Have {actual_prefill} prefills and {effective_decode} decodes."
-        )
-        if actual_regular > 0:
-            message += f" ({actual_regular} regular workers)"
-
-    return WorkerHealthResult(
-        ready=ready,
-        message=message,
-        prefill_ready=actual_prefill,
-        prefill_expected=expected_prefill,
-        decode_ready=effective_decode,
-        decode_expected=expected_decode,
-    )
+    return _worker_count_result(actual_prefill, expected_prefill, effective_decode, expected_decode, actual_regular)
 
 
 def check_dynamo_health(
@@ -141,48 +184,39 @@ def check_dynamo_health(
             message=f"Key 'instances' not found in response: {response_json}",
         )
 
-    prefill_count = 0
-    decode_count = 0
-
-    for instance in response_json["instances"]:
-        if instance.get("endpoint") == "generate":
-            component = instance.get("component")
-            if component == "prefill":
-                prefill_count += 1
-            # TRTLLM decode workers are reported as "tensorrt_llm"
-            elif component == "decode" or component == "tensorrt_llm":
-                decode_count += 1
-            elif component == "backend":
-                # In aggregated mode, workers report as "backend"
-                # Count them as decode (caller passes expected_prefill=0)
-                decode_count += 1
-
-    ready = prefill_count >= expected_prefill and decode_count >= expected_decode
-
-    if ready:
-        message = f"Model is ready. Have {prefill_count} prefills and {decode_count} decodes."
-    else:
-        message = (
-            f"Model is not ready, waiting for "
-            f"{expected_prefill - prefill_count} prefills and "
-            f"{expected_decode - decode_count} decodes. "
-            f"Have {prefill_count} prefills and {decode_count} decodes."
-        )
-
-    return WorkerHealthResult(
-        ready=ready,
-        message=message,
-        prefill_ready=prefill_count,
-        prefill_expected=expected_prefill,
-        decode_ready=decode_count,
-        decode_expected=expected_decode,
+    components = Counter(
+        instance.get("component") for instance in response_json["instances"] if instance.get("endpoint") == "generate"
     )
+    prefill_count = components["prefill"]
+    # TRTLLM decode workers are reported as "tensorrt_llm"; in aggregated mode
+    # workers report as "backend" and count as decode (caller passes expected_prefill=0)
+    decode_count = components["decode"] + components["tensorrt_llm"] + components["backend"]
+
+    return _worker_count_result(prefill_count, expected_prefill, decode_count, expected_decode)
 
 
 # ============================================================================
 # Port and Basic Health Waiting
 # ============================================================================
 
+# First retry delay; later retries double up to the caller's interval
+_BACKOFF_BASE = 0.1
+
+
+def _backoff_delay(attempt: int, cap: float, base: float = _BACKOFF_BASE) -> float:
+    """Delay before retry number `attempt` (0-based).
+
+    Grows exponentially from `base` up to `cap`, scaled by a random factor in
+    [0.5, 1.0) so concurrent waiters don't poll in lockstep.
+    """
+    delay = min(cap, base * 2 ** min(attempt, 32))
+    return delay * (0.5 + random.random() * 0.5)
+
+
+def _sleep_before_retry(attempt: int, interval: float, deadline: float) -> None:
+    """Back off before the next retry without sleeping past `deadline` (time.monotonic)."""
+    time.sleep(min(_backoff_delay(attempt, interval), max(0.0, deadline - time.monotonic())))
+
 
 def wait_for_port(
     host: str,
@@ -196,23 +230,97 @@ def wait_for_port(
         host: Hostname or IP address
         port: Port number
         timeout: Maximum time to wait in seconds
-        interval: Time between checks in seconds
+        interval: Maximum time between checks in seconds (retries back off up to this)
 
     Returns:
         True if port became available, False if timeout
     """
     start_time = time.time()
+    attempt = 0
 
     while time.time() - start_time < timeout:
         try:
             with socket.create_connection((host, port), timeout=1.0):
                 return True
         except (TimeoutError, ConnectionRefusedError, OSError):
-            time.sleep(interval)
+            time.sleep(_backoff_delay(attempt, interval))
+            attempt += 1
 
     return False
 
 
+def _probe_ports(endpoints: list[tuple[str, int]], timeout: float) -> set[tuple[str, int]]:
+    """Attempt non-blocking connects to all endpoints at once.
+
+    Returns:
+        Endpoints that accepted a connection within timeout
+    """
+    ready: set[tuple[str, int]] = set()
+    with selectors.DefaultSelector() as sel:
+        for endpoint in endpoints:
+            try:
+                family, socktype, proto, _, addr = socket.getaddrinfo(*endpoint, type=socket.SOCK_STREAM)[0]
+            except OSError:
+                continue
+            sock = socket.socket(family, socktype, proto)
+            sock.setblocking(False)
+            err = sock.connect_ex(addr)
+            if err in (0, errno.EINPROGRESS, errno.EWOULDBLOCK):
+                sel.register(sock, selectors.EVENT_WRITE, endpoint)
+            else:
+                sock.close()
+
+        deadline = time.monotonic() + timeout
+        try:
+            while sel.get_map() and (remaining := deadline - time.monotonic()) > 0:
+                for key, _ in sel.select(remaining):
+                    sock = key.fileobj
+                    sel.unregister(sock)
+                    if sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                        ready.add(key.data)
+                    sock.close()
+        finally:
+            for key in list(sel.get_map().values()):
+                key.fileobj.close()
+
+    return ready
+
+
+def wait_for_ports(
+    endpoints: list[tuple[str, int]],
+    timeout: float = 60.0,
+    interval: float = 1.0,
+) -> list[tuple[str, int]]:
+    """Wait for several TCP ports to become available, polling them concurrently.
+
+    All pending endpoints are probed together with non-blocking connects, so
+    waiting on N ports costs one poll loop rather than N sequential waits.
+
+    Args:
+        endpoints: (host, port) pairs to wait for
+        timeout: Maximum time to wait in seconds
+        interval: Maximum time between checks in seconds (retries back off up to this)
+
+    Returns:
+        Endpoints that were still unavailable at timeout (empty if all came up)
+    """
+    pending = list(dict.fromkeys(endpoints))
+    deadline = time.monotonic() + timeout
+    attempt = 0
+
+    while pending:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        ready = _probe_ports(pending, min(1.0, remaining))
+        pending = [endpoint for endpoint in pending if endpoint not in ready]
+        if pending:
+            _sleep_before_retry(attempt, interval, deadline)
+            attempt += 1
+
+    return pending
+
+
 def wait_for_health(
     host: str,
     port: int,
@@ -228,8 +336,8 @@ def wait_for_health(
     Args:
         host: Hostname or IP address
         port: HTTP port
-        max_attempts: Maximum number of attempts
-        interval: Time between attempts in seconds
+        max_attempts: Number of attempts at `interval`; sets the time budget (max_attempts * interval)
+        interval: Maximum time between attempts in seconds (retries back off up to this)
         expected_workers: Expected number of workers (checks /v1/models)
         stop_event: Optional threading.Event to abort waiting
 
@@ -238,31 +346,35 @@ def wait_for_health(
     """
     health_url = f"http://{host}:{port}/health"
     models_url = f"http://{host}:{port}/v1/models"
+    pool = _get_pool()
+    # Backoff makes early polls quicker, so bound the wait by time rather than attempt count
+    deadline = time.monotonic() + max_attempts * interval
 
-    for attempt in range(max_attempts):
+    for attempt in itertools.count():
+        if attempt and time.monotonic() >= deadline:
+            break
         if stop_event and stop_event.is_set():
             logger.warning("Wait aborted by stop event")
             return False
 
         try:
             # Check health endpoint
-            response = requests.get(health_url, timeout=5.0)
-            if response.status_code != 200:
+            response = pool.request("GET", health_url)
+            if response.status != 200:
                 logger.debug(
-                    "Health check failed (attempt %d/%d): status %d",
+                    "Health check failed (attempt %d): status %d",
                     attempt + 1,
-                    max_attempts,
-                    response.status_code,
+                    response.status,
                 )
-                time.sleep(interval)
+                _sleep_before_retry(attempt, interval, deadline)
                 continue
 
             # If expected_workers specified, check /v1/models
             if expected_workers is not None:
                 try:
-                    models_response = requests.get(models_url, timeout=5.0)
-                    if models_response.status_code == 200:
-                        data = models_response.json()
+                    models_response = pool.request("GET", models_url)
+                    if models_response.status == 200:
+                        data = _json_loads(models_response.data)
                         # Check if we have the expected number of workers
                         # The response format depends on the backend
                         models = data.get("data", [])
@@ -274,23 +386,22 @@ def wait_for_health(
                             return True
                 except Exception as e:
                     logger.debug("Models check failed: %s", e)
-                    time.sleep(interval)
+                    _sleep_before_retry(attempt, interval, deadline)
                     continue
             else:
                 logger.info("Health check passed")
                 return True
 
-        except requests.exceptions.RequestException as e:
+        except urllib3.exceptions.HTTPError as e:
             logger.debug(
-                "Health check failed (attempt %d/%d): %s",
+                "Health check failed (attempt %d): %s",
                 attempt + 1,
-                max_attempts,
                 e,
             )
 
-        time.sleep(interval)
+        _sleep_before_retry(attempt, interval, deadline)
 
-    logger.error("Health check failed after %d attempts", max_attempts)
+    logger.error("Health check failed after %.0f seconds", max_attempts * interval)
     return False
 
 
@@ -303,31 +414,31 @@ def wait_for_etcd(
 
     Args:
         etcd_url: Base URL of etcd (e.g., http://node1:2379)
-        max_retries: Maximum number of retries
-        interval: Time between retries in seconds
+        max_retries: Number of retries at `interval`; sets the time budget (max_retries * interval)
+        interval: Maximum time between retries in seconds (retries back off up to this)
 
     Returns:
         True if etcd is ready, False if timeout
     """
     health_url = f"{etcd_url}/health"
+    pool = _get_pool()
+    deadline = time.monotonic() + max_retries * interval
 
-    for attempt in range(max_retries):
+    for attempt in itertools.count():
+        if attempt and time.monotonic() >= deadline:
+            break
         try:
-            response = requests.get(health_url, timeout=5.0)
-            if response.status_code == 200:
+            response = pool.request("GET", health_url)
+            if response.status == 200:
                 logger.info("etcd is ready")
                 return True
-        except requests.exceptions.RequestException:
+        except urllib3.exceptions.HTTPError:
             pass
 
-        logger.debug(
-            "etcd not ready (attempt %d/%d), retrying...",
-            attempt + 1,
-            max_retries,
-        )
-        time.sleep(interval)
+        logger.debug("etcd not ready (attempt %d), retrying...", attempt + 1)
+        _sleep_before_retry(attempt, interval, deadline)
 
-    logger.error("etcd not ready after %d attempts", max_retries)
+    logger.error("etcd not ready after %.0f seconds", max_retries * interval)
     return False
 
 
@@ -357,7 +468,8 @@ def wait_for_model(
         port: Model server port
         n_prefill: Expected number of prefill workers
         n_decode: Expected number of decode workers
-        poll_interval: Seconds between health checks
+        poll_interval: Maximum seconds between health checks (retries back off up to this,
+            restarting from a short delay whenever worker counts change)
         timeout: Maximum wait time in seconds
         report_every: Log progress every N seconds
         frontend_type: Frontend type - "sglang" uses /workers, "dynamo" uses /health
@@ -369,7 +481,7 @@ def wait_for_model(
     if frontend_type == "sglang":
         health_url = f"http://{host}:{port}/workers"
         logger.info(
-            "Polling %s every %.1fs for %d prefills and %d decodes (sglang frontend)",
+            "Polling %s (backing off to every %.1fs) for %d prefills and %d decodes (sglang frontend)",
             health_url,
             poll_interval,
             n_prefill,
@@ -378,15 +490,18 @@ def wait_for_model(
     else:
         health_url = f"http://{host}:{port}/health"
         logger.info(
-            "Polling %s every %.1fs for %d prefills and %d decodes",
+            "Polling %s (backing off to every %.1fs) for %d prefills and %d decodes",
             health_url,
             poll_interval,
             n_prefill,
             n_decode,
         )
 
+    pool = _get_pool()
     start_time = time.time()
     last_report_time = start_time
+    attempt = 0
+    last_counts: tuple[int, int] | None = None
 
     while True:
         # Check for abort
@@ -402,9 +517,9 @@ def wait_for_model(
 
         # Try to fetch health
         try:
-            response = requests.get(health_url, timeout=5.0)
-            if response.status_code == 200:
-                response_json = response.json()
+            response = pool.request("GET", health_url)
+            if response.status == 200:
+                response_json = _json_loads(response.data)
 
                 # Check worker counts based on frontend type
                 if frontend_type == "sglang":
@@ -416,17 +531,24 @@ def wait_for_model(
                     logger.info(result.message)
                     return True
 
+                # Workers are still registering: poll quickly again
+                counts = (result.prefill_ready, result.decode_ready)
+                if counts != last_counts:
+                    last_counts = counts
+                    attempt = 0
+
                 # Report progress periodically
                 if time.time() - last_report_time >= report_every:
                     logger.info(result.message)
                     last_report_time = time.time()
 
-        except requests.exceptions.RequestException as e:
-            # Report connection errors periodically
-            if time.time() - last_report_time >= report_every:
+        except urllib3.exceptions.HTTPError as e:
+            # Report connection errors periodically (only tracked when debug logging is on)
+            if logger.isEnabledFor(logging.DEBUG) and time.time() - last_report_time >= report_every:
                 logger.debug("Health check failed: %s", e)
                 last_report_time = time.time()
         except Exception as e:
             logger.debug("Unexpected error during health check: %s", e)
 
-        time.sleep(poll_interval)
+        time.sleep(_backoff_delay(attempt, poll_interval))
+        attempt += 1
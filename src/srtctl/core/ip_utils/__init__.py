@@ -6,10 +6,13 @@ IP address resolution utilities.
 
 This module provides:
 - get_node_ip(): Get IP address for a remote SLURM node (via srun)
+- get_node_ips_batch(): Get IP addresses for several SLURM nodes with one srun
 - get_local_ip(): Get local IP address
 """
 
 import logging
+import socket
+import struct
 import subprocess
 from pathlib import Path
 
@@ -27,6 +30,8 @@ def _run_bash_function(
 ) -> tuple[bool, str]:
     """Run a bash function from a script file.
 
+    Arguments are passed as argv, not interpolated into a shell command.
+
     Args:
         script: Name of the script file
         function: Name of the function to call
@@ -41,13 +46,10 @@ def _run_bash_function(
         logger.error("Script not found: %s", script_path)
         return False, f"Script not found: {script_path}"
 
-    # Build bash command that sources the script and calls the function
-    quoted_args = " ".join(f'"{arg}"' for arg in args)
-    bash_cmd = f'source "{script_path}" && {function} {quoted_args}'
-
     try:
+        # The script dispatches to the named function when run directly
         result = subprocess.run(
-            ["bash", "-c", bash_cmd],
+            ["bash", str(script_path), function, *args],
             capture_output=True,
             text=True,
             timeout=timeout,
@@ -106,13 +108,92 @@ def get_node_ip(
         return None
 
 
+def get_node_ips_batch(
+    nodes: list[str],
+    slurm_job_id: str | None = None,
+    network_interface: str | None = None,
+    timeout: float = 30.0,
+) -> dict[str, str]:
+    """Get IP addresses for several SLURM nodes with a single srun.
+
+    Runs IP resolution as one task per node, so N nodes cost one srun
+    rather than N.
+
+    Args:
+        nodes: Hostnames of the nodes to query
+        slurm_job_id: SLURM job ID for srun context
+        network_interface: Specific network interface to use
+        timeout: Command timeout in seconds
+
+    Returns:
+        Dict mapping node hostname to IP address; empty if the srun failed.
+        Nodes that reported no IP are omitted.
+    """
+    success, output = _run_bash_function(
+        "get_node_ip.sh",
+        "get_node_ips_batch",
+        [",".join(nodes), slurm_job_id or "", network_interface or ""],
+        timeout=timeout,
+    )
+
+    if not success:
+        logger.warning("Batch IP resolution failed for %d nodes: %s", len(nodes), output)
+        return {}
+
+    requested = set(nodes)
+    ips = {}
+    for line in output.splitlines():
+        node, _, ip = line.strip().partition(" ")
+        if node in requested and ip:
+            ips[node] = ip
+    logger.debug("Resolved IPs: %s", ips)
+    return ips
+
+
+def _is_bad_ip(ip: str) -> bool:
+    """Check for unusable addresses (unset, loopback, link-local)."""
+    return not ip or ip == "0.0.0.0" or ip.startswith(("127.", "169.254."))
+
+
+def _interface_ip(network_interface: str) -> str | None:
+    """Get the IPv4 address of a network interface (Linux SIOCGIFADDR ioctl)."""
+    try:
+        import fcntl
+    except ImportError:  # Not on Linux
+        return None
+
+    siocgifaddr = 0x8915
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            ifreq = struct.pack("256s", network_interface.encode()[:15])
+            return socket.inet_ntoa(fcntl.ioctl(s.fileno(), siocgifaddr, ifreq)[20:24])
+    except OSError:
+        return None
+
+
+def _default_route_ip() -> str | None:
+    """Get the source IP the kernel would use for the default route.
+
+    Connecting a UDP socket only selects a route; no packets are sent.
+    """
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            s.connect(("8.8.8.8", 80))
+            return s.getsockname()[0]
+    except OSError:
+        return None
+
+
 def get_local_ip(network_interface: str | None = None) -> str:
     """Get local IP address.
 
     Tries multiple methods:
     1. Specific network interface (if provided)
-    2. hostname -I (gets first non-loopback IP)
-    3. ip route get 8.8.8.8 (finds default source IP)
+    2. Default route source IP (like ip route get 8.8.8.8)
+    3. get_node_ip.sh's get_local_ip (adds hostname -I)
+
+    The first two are resolved in-process; the bash script is only run
+    when neither yields a usable address.
 
     Args:
         network_interface: Specific network interface to use
@@ -120,6 +201,15 @@ def get_local_ip(network_interface: str | None = None) -> str:
     Returns:
         IP address string, or "127.0.0.1" if all methods fail
     """
+    if network_interface:
+        ip = _interface_ip(network_interface)
+        if ip and not _is_bad_ip(ip):
+            return ip
+
+    ip = _default_route_ip()
+    if ip and not _is_bad_ip(ip):
+        return ip
+
     success, output = _run_bash_function(
         "get_node_ip.sh",
         "get_local_ip",
@@ -98,16 +98,13 @@ get_local_ip() {
     fi
 }
 
-# Get IP address of a remote SLURM node via srun
-# Usage: get_node_ip "node_name" "slurm_job_id" "network_interface"
-# Returns: IP address on stdout, exits with code 1 on failure
-get_node_ip() {
-    local node=$1
-    local slurm_job_id=$2
-    local network_interface=$3
+# Build the inline script that resolves the IP of the node it runs on
+# Usage: _remote_ip_script "network_interface"
+# Returns: bash script on stdout
+_remote_ip_script() {
+    local network_interface=$1
 
-    # Create inline script with the resolution logic
-    local ip_script="
+    echo "
         _is_bad_ip() {
             ip=\$1
             case \"\$ip\" in
@@ -175,6 +172,19 @@ get_node_ip() {
 
         exit 1
     "
+}
+
+# Get IP address of a remote SLURM node via srun
+# Usage: get_node_ip "node_name" "slurm_job_id" "network_interface"
+# Returns: IP address on stdout, exits with code 1 on failure
+get_node_ip() {
+    local node=$1
+    local slurm_job_id=$2
+    local network_interface=$3
+
+    # Create inline script with the resolution logic
+    local ip_script
+    ip_script=$(_remote_ip_script "$network_interface")
 
     # Execute the script on target node with single srun command
     local result
@@ -189,3 +199,40 @@ get_node_ip() {
         return 1
     fi
 }
+
+# Get IP addresses of several SLURM nodes with a single srun
+# Usage: get_node_ips_batch "node1,node2,..." "slurm_job_id" "network_interface"
+# Returns: one "node ip" line per resolved node on stdout, exits with code 1 on failure
+get_node_ips_batch() {
+    local nodes=$1
+    local slurm_job_id=$2
+    local network_interface=$3
+
+    local num_nodes
+    num_nodes=$(echo "$nodes" | tr ',' '\n' | wc -l)
+
+    # Wrap the resolver so each task tags its IP with its SLURM node name
+    local ip_script
+    ip_script="_resolve_node_ip() {
+$(_remote_ip_script "$network_interface")
+}
+ip=\$(_resolve_node_ip) && echo \"\$SLURMD_NODENAME \$ip\""
+
+    local result
+    result=$(srun --overlap --jobid $slurm_job_id --nodes=$num_nodes --ntasks=$num_nodes --ntasks-per-node=1 \
+        --nodelist=$nodes bash -c "$ip_script")
+    local rc=$?
+
+    if [ $rc -eq 0 ] && [ -n "$result" ]; then
+        echo "$result"
+        return 0
+    else
+        echo "Error: Could not retrieve IP addresses for nodes $nodes" >&2
+        return 1
+    fi
+}
+
+# Allow calling a function directly: bash get_node_ip.sh <function> [args...]
+if [[ "${BASH_SOURCE[0]}" == "$0" && $# -gt 0 ]]; then
+    "$@"
+fi
@@ -11,6 +11,7 @@ This module provides lifecycle management for srun processes, including:
 """
 
 import logging
+import os
 import signal
 import subprocess
 import sys
@@ -68,6 +69,33 @@ class ManagedProcess:
 NamedProcesses = dict[str, ManagedProcess]
 
 
+def _tail_lines(path: Path, count: int, block_size: int = 64 * 1024) -> list[str]:
+    """Return the last count lines of a text file.
+
+    Reads backwards from the end in blocks until enough newlines are seen, so
+    tailing a multi-GB worker log does not load and split the whole file.
+    Newlines are counted per block, so long stretches without one (e.g.
+    carriage-return progress bars) are still read in linear time.
+    """
+    if count <= 0:
+        return []
+
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        blocks: list[bytes] = []
+        newlines = 0
+        while pos > 0 and newlines <= count:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            block = f.read(step)
+            blocks.append(block)
+            newlines += block.count(b"\n")
+
+    data = b"".join(reversed(blocks))
+    return data.decode(errors="replace").splitlines()[-count:]
+
+
 class ProcessRegistry:
     """Registry for managing multiple processes with health monitoring.
 
@@ -134,15 +162,17 @@ class ProcessRegistry:
         """
         with self._lock:
             for name, proc in self._processes.items():
-                if proc.critical and not proc.is_running:
-                    exit_code = proc.exit_code
-                    if exit_code != 0 and name not in self._failed_processes:
-                        self._failed_processes.append(name)
-                        logger.error(
-                            "Critical process '%s' exited with code %d",
-                            name,
-                            exit_code,
-                        )
+                if not proc.critical or name in self._failed_processes:
+                    continue
+                # One poll per process: None while running, 0 on a clean exit
+                exit_code = proc.exit_code
+                if exit_code:
+                    self._failed_processes.append(name)
+                    logger.error(
+                        "Critical process '%s' exited with code %d",
+                        name,
+                        exit_code,
+                    )
 
             return len(self._failed_processes) > 0
 
@@ -185,10 +215,10 @@ class ProcessRegistry:
                 # Tail the log file if available
                 if proc.log_file and proc.log_file.exists():
                     try:
-                        lines = proc.log_file.read_text().splitlines()
+                        lines = _tail_lines(proc.log_file, tail_lines)
                         if lines:
                             logger.error("\nLast %d lines of log:", tail_lines)
-                            for line in lines[-tail_lines:]:
+                            for line in lines:
                                 logger.error("  %s", line)
                     except Exception as e:
                         logger.error("Could not read log file: %s", e)
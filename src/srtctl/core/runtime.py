@@ -8,13 +8,14 @@ This module provides the single source of truth for all runtime values,
 replacing scattered bash variables and Jinja templating with typed Python.
 """
 
+import functools
 import os
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from .config import get_srtslurm_setting
-from .slurm import get_hostname_ip, get_slurm_nodelist
+from .slurm import get_container_mounts_str, get_hostname_ip, get_slurm_nodelist
 
 if TYPE_CHECKING:
     from srtctl.core.schema import SrtConfig
@@ -274,6 +275,11 @@ class RuntimeContext:
             is_hf_model=is_hf_model,
         )
 
+    @functools.cached_property
+    def container_mounts_str(self) -> str:
+        """container_mounts serialized for srun --container-mounts."""
+        return get_container_mounts_str(self.container_mounts)
+
     def format_string(self, template: str, **extra_kwargs) -> str:
         """Format a template string with runtime values.
 
@@ -12,6 +12,7 @@ Backend configs are defined in srtctl.backends.configs/ for modularity.
 """
 
 import builtins
+import functools
 import itertools
 import logging
 from collections.abc import Iterator, Mapping
@@ -26,7 +27,6 @@ from typing import (
     Literal,
 )
 
-import yaml
 from marshmallow import Schema, ValidationError, fields
 from marshmallow_dataclass import dataclass
 
@@ -36,6 +36,7 @@ from srtctl.backends import (
     TRTLLMProtocol,
     VLLMProtocol,
 )
+from srtctl.core import yaml_utils
 from srtctl.core.formatting import (
     FormattablePath,
     FormattablePathField,
@@ -47,6 +48,17 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+@functools.cache
+def cached_schema(dataclass_type: type) -> Schema:
+    """Return a shared marshmallow schema instance for a dataclass.
+
+    Instantiating a schema also builds every nested schema, which costs more
+    than loading a typical config. Schemas keep no per-load state, so a single
+    instance per dataclass is reused.
+    """
+    return dataclass_type.Schema()
+
+
 # ============================================================================
 # Reporting Configuration
 # ============================================================================
@@ -263,14 +275,11 @@ class BackendConfigField(fields.Field):
         backend_type = value.get("type", "sglang")
 
         if backend_type == "sglang":
-            schema = SGLangProtocol.Schema()
-            return schema.load(value)
+            return cached_schema(SGLangProtocol).load(value)
         elif backend_type == "trtllm":
-            schema = TRTLLMProtocol.Schema()
-            return schema.load(value)
+            return cached_schema(TRTLLMProtocol).load(value)
         elif backend_type == "vllm":
-            schema = VLLMProtocol.Schema()
-            return schema.load(value)
+            return cached_schema(VLLMProtocol).load(value)
         else:
             raise ValidationError(f"Unknown backend type: {backend_type!r}. Supported types: sglang, trtllm, vllm")
 
@@ -279,11 +288,11 @@ class BackendConfigField(fields.Field):
         if value is None:
             return None
         if isinstance(value, SGLangProtocol):
-            return SGLangProtocol.Schema().dump(value)
+            return cached_schema(SGLangProtocol).dump(value)
         if isinstance(value, TRTLLMProtocol):
-            return TRTLLMProtocol.Schema().dump(value)
+            return cached_schema(TRTLLMProtocol).dump(value)
         if isinstance(value, VLLMProtocol):
-            return VLLMProtocol.Schema().dump(value)
+            return cached_schema(VLLMProtocol).dump(value)
         return value
 
 
@@ -299,20 +308,14 @@ class SweepConfigField(fields.Field):
             raise ValidationError(f"Expected dict for sweep config, got {type(value).__name__}")
 
         mode = value.get("mode", "zip")
-        parameters: dict[str, list[Any]] = {}
-
         if "parameters" in value:
-            for key, val in value["parameters"].items():
-                if not isinstance(val, list):
-                    raise ValidationError(f"Sweep parameter '{key}' must be a list")
-                parameters[key] = val
+            parameters: dict[str, list[Any]] = dict(value["parameters"])
         else:
-            for key, val in value.items():
-                if key == "mode":
-                    continue
-                if not isinstance(val, list):
-                    raise ValidationError(f"Sweep parameter '{key}' must be a list")
-                parameters[key] = val
+            parameters = {key: val for key, val in value.items() if key != "mode"}
+
+        bad_key = next((key for key, val in parameters.items() if not isinstance(val, list)), None)
+        if bad_key is not None:
+            raise ValidationError(f"Sweep parameter '{bad_key}' must be a list")
 
         return SweepConfig(mode=mode, parameters=parameters)
 
@@ -517,7 +520,7 @@ class BenchmarkConfig:
     osl: int | None = None
     concurrencies: list[int] | str | None = None
     req_rate: str | int | None = "inf"
-    sweep: Annotated[SweepConfig, SweepConfigField()] | None = None
+    sweep: Annotated[SweepConfig, SweepConfigField(allow_none=True)] | None = None
     # Accuracy benchmark fields
     num_examples: int | None = None
     max_tokens: int | None = None
@@ -544,6 +547,11 @@ class BenchmarkConfig:
     Schema: ClassVar[builtins.type[Schema]] = Schema
 
 
+# (attribute, env var) pairs exported to the profiling workload
+_PROFILE_TRAFFIC_ENV = (("isl", "PROFILE_ISL"), ("osl", "PROFILE_OSL"), ("concurrency", "PROFILE_CONCURRENCY"))
+_PROFILE_STEP_ENV = (("start_step", "START_STEP"), ("stop_step", "STOP_STEP"))
+
+
 @dataclass(frozen=True)
 class ProfilingPhaseConfig:
     """Profiling config for a single phase (prefill/decode/aggregated)."""
@@ -604,6 +612,22 @@ class ProfilingConfig:
             return self.aggregated
         return None
 
+    def get_traffic_env_vars(self) -> dict[str, str]:
+        """Get PROFILE_ISL/OSL/CONCURRENCY for the parameters that are set."""
+        return {env: str(value) for attr, env in _PROFILE_TRAFFIC_ENV if (value := getattr(self, attr)) is not None}
+
+    def get_phase_env_vars(self, mode: str) -> dict[str, str]:
+        """Get PROFILE_<PHASE>_START_STEP/STOP_STEP for the given mode's phase config."""
+        phase_config = self._get_phase_config(mode)
+        if phase_config is None:
+            return {}
+        phase_key = "AGG" if mode in ("agg", "aggregated") else mode.upper()
+        return {
+            f"PROFILE_{phase_key}_{suffix}": str(value)
+            for attr, suffix in _PROFILE_STEP_ENV
+            if (value := getattr(phase_config, attr)) is not None
+        }
+
     def get_env_vars(self, mode: str, profile_dir: str) -> dict[str, str]:
         """Get profiling-specific environment variables.
 
@@ -619,25 +643,12 @@ class ProfilingConfig:
 
         env = {
             "PROFILING_MODE": mode,
+            # Traffic generator params (same for all phases)
+            **self.get_traffic_env_vars(),
+            # Phase-specific start/stop steps
+            **self.get_phase_env_vars(mode),
         }
 
-        # Traffic generator params (same for all phases)
-        if self.isl is not None:
-            env["PROFILE_ISL"] = str(self.isl)
-        if self.osl is not None:
-            env["PROFILE_OSL"] = str(self.osl)
-        if self.concurrency is not None:
-            env["PROFILE_CONCURRENCY"] = str(self.concurrency)
-
-        # Phase-specific start/stop steps
-        phase_config = self._get_phase_config(mode)
-        if phase_config:
-            phase_key = mode.upper() if mode != "agg" else "AGG"
-            if phase_config.start_step is not None:
-                env[f"PROFILE_{phase_key}_START_STEP"] = str(phase_config.start_step)
-            if phase_config.stop_step is not None:
-                env[f"PROFILE_{phase_key}_STOP_STEP"] = str(phase_config.stop_step)
-
         if self.is_torch:
             env["SGLANG_TORCH_PROFILER_DIR"] = f"{profile_dir}/{mode}"
 
@@ -908,10 +919,8 @@ class SrtConfig:
 
     @classmethod
     def from_yaml(cls, yaml_path: Path) -> "SrtConfig":
-        with open(yaml_path) as f:
-            data = yaml.safe_load(f)
-        schema = cls.Schema()
-        return schema.load(data)
+        data = yaml_utils.load_file(yaml_path)
+        return cached_schema(cls).load(data)
 
     @property
     def served_model_name(self) -> str:
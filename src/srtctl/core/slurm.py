@@ -6,7 +6,7 @@ SLURM utilities for job management and process launching.
 
 This module consolidates all SLURM-related functionality:
 - Environment: get_slurm_job_id, get_slurm_nodelist
-- Network: get_hostname_ip, get_node_ips
+- Network: get_hostname_ip, get_node_ips, clear_ip_cache
 - Process launching: start_srun_process, run_command
 - Container utilities: get_container_mounts_str
 """
@@ -16,10 +16,12 @@ import os
 import shlex
 import socket
 import subprocess
+import threading
+import time
 from collections.abc import Sequence
 from pathlib import Path
 
-from .ip_utils import get_node_ip
+from .ip_utils import get_node_ip, get_node_ips_batch
 
 logger = logging.getLogger(__name__)
 
@@ -34,9 +36,15 @@ def get_slurm_job_id() -> str | None:
     return os.environ.get("SLURM_JOB_ID") or os.environ.get("SLURM_JOBID")
 
 
+# Expanded hostnames by raw SLURM_NODELIST value; a job's nodelist never changes
+_nodelist_cache: dict[str, tuple[str, ...]] = {}
+
+
 def get_slurm_nodelist() -> list[str]:
     """Get list of nodes from SLURM_NODELIST environment variable.
 
+    The scontrol expansion is cached, so only the first call forks.
+
     Returns:
         List of node hostnames, or empty list if not in SLURM.
     """
@@ -44,24 +52,63 @@ def get_slurm_nodelist() -> list[str]:
     if not nodelist_raw:
         return []
 
-    # Use scontrol to expand the nodelist
+    cached = _nodelist_cache.get(nodelist_raw)
+    if cached is not None:
+        return list(cached)
+
+    # Use scontrol to expand the nodelist, reading hostnames as they are printed
     try:
-        result = subprocess.run(
+        with subprocess.Popen(
             ["scontrol", "show", "hostnames", nodelist_raw],
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True,
-            check=True,
-        )
-        return result.stdout.strip().split("\n")
-    except (subprocess.CalledProcessError, FileNotFoundError):
+        ) as proc:
+            assert proc.stdout is not None
+            nodes = tuple(line.rstrip("\n") for line in proc.stdout if line.strip())
+    except FileNotFoundError:
+        nodes = ()
+    else:
+        if proc.returncode != 0:
+            nodes = ()
+    if not nodes:
         # Fallback: try simple parsing for non-ranged formats
         return [nodelist_raw]
 
+    _nodelist_cache[nodelist_raw] = nodes
+    return list(nodes)
+
 
 # ============================================================================
 # Network Resolution
 # ============================================================================
 
+# Resolved IPs by (hostname, network_interface). Each srun-based lookup forks
+# bash and srun, while node IPs are stable for the life of a job.
+_IP_CACHE_TTL = 600.0
+_ip_cache: dict[tuple[str, str | None], tuple[float, str]] = {}
+_ip_cache_lock = threading.Lock()
+
+
+def _get_cached_ip(hostname: str, network_interface: str | None) -> str | None:
+    """Get a cached IP for hostname if it was resolved within the TTL."""
+    with _ip_cache_lock:
+        entry = _ip_cache.get((hostname, network_interface))
+    if entry is not None and time.monotonic() - entry[0] < _IP_CACHE_TTL:
+        return entry[1]
+    return None
+
+
+def _cache_ip(hostname: str, network_interface: str | None, ip: str) -> None:
+    with _ip_cache_lock:
+        _ip_cache[(hostname, network_interface)] = (time.monotonic(), ip)
+
+
+def clear_ip_cache() -> None:
+    """Forget all resolved node IPs."""
+    with _ip_cache_lock:
+        _ip_cache.clear()
+
 
 def get_hostname_ip(hostname: str, network_interface: str | None = None) -> str:
     """Resolve hostname to routable IP address.
@@ -70,6 +117,9 @@ def get_hostname_ip(hostname: str, network_interface: str | None = None) -> str:
     1. If inside a SLURM job, use srun to get the real IP from the target node
     2. Fall back to socket.gethostbyname() (may return loopback on some systems)
 
+    IPs resolved via srun are cached for a few minutes; socket fallbacks are
+    not, so a transient srun failure cannot pin a wrong address.
+
     Args:
         hostname: Node hostname to resolve
         network_interface: Optional network interface to prefer
@@ -77,12 +127,17 @@ def get_hostname_ip(hostname: str, network_interface: str | None = None) -> str:
     Returns:
         IP address as string
     """
+    cached = _get_cached_ip(hostname, network_interface)
+    if cached is not None:
+        return cached
+
     # If we're inside a SLURM allocation, use srun-based resolution
     # This gets the actual routable IP from the target node
     slurm_job_id = get_slurm_job_id()
     if slurm_job_id:
         ip = get_node_ip(hostname, slurm_job_id, network_interface)
         if ip:
+            _cache_ip(hostname, network_interface, ip)
             return ip
         logger.warning(
             "srun-based IP resolution failed for %s, falling back to socket resolution",
@@ -112,6 +167,9 @@ def get_node_ips(
 ) -> dict[str, str]:
     """Get IP addresses for multiple SLURM nodes.
 
+    Uncached nodes are resolved with a single batched srun, falling back to
+    one srun per node for any the batch did not resolve.
+
     Args:
         nodes: List of node hostnames
         slurm_job_id: SLURM job ID for srun context
@@ -120,10 +178,16 @@ def get_node_ips(
     Returns:
         Dict mapping node hostname to IP address
     """
+    uncached = [node for node in dict.fromkeys(nodes) if _get_cached_ip(node, network_interface) is None]
+    if len(uncached) > 1:
+        for node, ip in get_node_ips_batch(uncached, slurm_job_id, network_interface).items():
+            _cache_ip(node, network_interface, ip)
+
     ips = {}
     for node in nodes:
-        ip = get_node_ip(node, slurm_job_id, network_interface)
+        ip = _get_cached_ip(node, network_interface) or get_node_ip(node, slurm_job_id, network_interface)
         if ip:
+            _cache_ip(node, network_interface, ip)
             ips[node] = ip
         else:
             logger.warning("Could not resolve IP for node %s", node)
@@ -145,6 +209,7 @@ def start_srun_process(
     output: str | None = None,
     container_image: str | None = None,
     container_mounts: dict[Path, Path] | None = None,
+    container_mounts_str: str | None = None,
     env_to_pass_through: list[str] | None = None,
     env_to_set: dict[str, str] | None = None,
     bash_preamble: str | None = None,
@@ -169,6 +234,8 @@ def start_srun_process(
         output: Output file path (optional)
         container_image: Container image path (optional)
         container_mounts: Dict of host_path -> container_path mounts
+        container_mounts_str: Pre-serialized --container-mounts value (e.g.
+            RuntimeContext.container_mounts_str); used instead of container_mounts
         env_to_pass_through: Environment variable names to pass through
         env_to_set: Environment variables to set (name -> value)
         bash_preamble: Bash commands to run before the main command
@@ -223,9 +290,10 @@ def start_srun_process(
         srun_cmd.append("--no-container-entrypoint")
         srun_cmd.append("--no-container-mount-home")
 
-        if container_mounts:
-            mount_str = ",".join(f"{host}:{container}" for host, container in container_mounts.items())
-            srun_cmd.extend(["--container-mounts", mount_str])
+        if container_mounts_str is None and container_mounts:
+            container_mounts_str = get_container_mounts_str(container_mounts)
+        if container_mounts_str:
+            srun_cmd.extend(["--container-mounts", container_mounts_str])
 
     # Additional srun options
     if srun_options:
@@ -258,7 +326,8 @@ def start_srun_process(
     else:
         srun_cmd.extend(command)
 
-    logger.debug("Starting srun: %s", shlex.join(srun_cmd))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Starting srun: %s", shlex.join(srun_cmd))
 
     # Start the process
     proc = subprocess.Popen(
@@ -9,59 +9,139 @@ This module generates multiple job configs from a sweep configuration by
 expanding all combinations of sweep parameters.
 """
 
-import copy
+import functools
 import itertools
+import re
+from collections.abc import Iterator
 from typing import Any
 
+# {param} placeholders; each distinct template string is split on them once
+_PLACEHOLDER_RE = re.compile(r"\{([^{}]+)\}")
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_template(template: str) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Split a template string into literal segments and placeholder keys.
+
+    Cached so every sweep point reuses the split instead of rescanning the
+    same string; there is always one more literal than there are keys.
+    """
+    parts = _PLACEHOLDER_RE.split(template)
+    return tuple(parts[0::2]), tuple(parts[1::2])
+
+
+def _format_value(values: dict[str, Any], key: str) -> str:
+    """Render the value for a placeholder key, leaving unknown placeholders as-is."""
+    if key not in values:
+        return "{" + key + "}"
+    value = values[key]
+    # Lists embedded in a larger string become comma-separated
+    if isinstance(value, list):
+        return ",".join(str(v) for v in value)
+    return str(value)
+
+
+def _expand_string(template: str, values: dict[str, Any]) -> Any:
+    """Substitute values into a string that contains placeholders."""
+    literals, keys = _parse_template(template)
+    # For YAML lists, a string that is just the placeholder becomes the list itself
+    if literals == ("", "") and isinstance(values.get(keys[0]), list):
+        return values[keys[0]]
+    parts = [literals[0]]
+    for key, literal in zip(keys, literals[1:], strict=True):
+        parts.append(_format_value(values, key))
+        parts.append(literal)
+    return "".join(parts)
+
+
+def _plan_template(template: Any) -> Any:
+    """Record where a template holds placeholder strings.
+
+    The plan mirrors the template down to those strings: a placeholder string is
+    its own plan, a dict or list maps the keys (or indices) of children holding
+    placeholders to their plans, and None means there is nothing to substitute.
+    A sweep plans its template once and reuses the plan for every combination.
+    """
+    # Walk with an explicit stack rather than recursion, collecting the path to
+    # every placeholder string, then nest those paths into the plan.
+    sites: list[tuple[tuple[Any, ...], str]] = []
+    stack: list[tuple[tuple[Any, ...], Any]] = [((), template)]
+    while stack:
+        path, node = stack.pop()
+        if isinstance(node, dict):
+            stack.extend((path + (key,), child) for key, child in node.items())
+        elif isinstance(node, list):
+            stack.extend((path + (index,), child) for index, child in enumerate(node))
+        elif isinstance(node, str) and "{" in node and _parse_template(node)[1]:
+            sites.append((path, node))
+
+    if not sites:
+        return None
+    if not sites[0][0]:
+        # The template is itself a placeholder string
+        return sites[0][1]
+    plan: dict[Any, Any] = {}
+    for path, string in sites:
+        parent = plan
+        for key in path[:-1]:
+            parent = parent.setdefault(key, {})
+        parent[path[-1]] = string
+    return plan
+
+
+def _apply_plan(template: Any, plan: Any, values: dict[str, Any]) -> Any:
+    """Expand the placeholder sites recorded in plan, copying only the containers above them."""
+    if plan is None:
+        return template
+    if isinstance(plan, str):
+        return _expand_string(plan, values)
+    expanded = template.copy()
+    stack = [(expanded, template, plan)]
+    while stack:
+        target, source, node_plan = stack.pop()
+        for key, child_plan in node_plan.items():
+            if isinstance(child_plan, str):
+                target[key] = _expand_string(child_plan, values)
+            else:
+                child = source[key].copy()
+                target[key] = child
+                stack.append((child, source[key], child_plan))
+    return expanded
+
 
 def expand_template(template: Any, values: dict[str, Any]) -> Any:
-    """Recursively expand template strings with values.
+    """Expand template strings with values, at any nesting depth.
 
     Args:
         template: Template object (dict, list, str, or other)
         values: Dictionary of parameter values to substitute
 
     Returns:
-        Expanded template with {param} placeholders replaced
+        Expanded template with {param} placeholders replaced. Strings, dicts and
+        lists without placeholders are returned as-is rather than copied.
     """
-    if isinstance(template, dict):
-        return {k: expand_template(v, values) for k, v in template.items()}
-    elif isinstance(template, list):
-        return [expand_template(item, values) for item in template]
-    elif isinstance(template, str):
-        result = template
-        for key, value in values.items():
-            placeholder = f"{{{key}}}"
-            # Handle list values specially - convert to comma-separated string or keep as list
-            if isinstance(value, list):
-                # For YAML lists, we want to keep them as lists, not convert to string
-                if placeholder in result and result == placeholder:
-                    # If the entire string is just the placeholder, replace with the list
-                    return value
-                else:
-                    # If it's embedded in a string, convert to comma-separated
-                    result = result.replace(placeholder, ",".join(str(v) for v in value))
-            else:
-                result = result.replace(placeholder, str(value))
-        return result
-    else:
-        return template
+    return _apply_plan(template, _plan_template(template), values)
 
 
-def generate_sweep_configs(sweep_config: dict) -> list[tuple[dict, dict]]:
-    """Generate all job configs from a sweep configuration.
+def iter_sweep_configs(sweep_config: dict) -> Iterator[tuple[dict, dict]]:
+    """Lazily generate job configs from a sweep configuration.
+
+    Each combination is expanded and validated only when requested, so callers
+    that just stream the results (e.g. for display) never hold the full sweep.
 
     Args:
         sweep_config: Config dict with 'sweep' section defining parameters
 
-    Returns:
-        List of (expanded_config, param_values) tuples
+    Yields:
+        (expanded_config, param_values) tuples
     """
     if "sweep" not in sweep_config:
         raise ValueError("Sweep config must have 'sweep' section")
 
     # Apply cluster defaults before sweep expansion
+    from srtctl.core import yaml_utils
     from srtctl.core.config import load_cluster_config, resolve_config_with_defaults
+    from srtctl.core.schema import SrtConfig, cached_schema
 
     cluster_config = load_cluster_config()
     sweep_config = resolve_config_with_defaults(sweep_config, cluster_config)
@@ -69,33 +149,52 @@ def generate_sweep_configs(sweep_config: dict) -> list[tuple[dict, dict]]:
     # Extract sweep parameters
     sweep_params = sweep_config["sweep"]
 
-    # Generate all combinations
+    # Generate all combinations. Each value is paired with its text for template
+    # strings and its "<name><value>" job-name fragment, so both are rendered once
+    # per sweep instead of per combination. Lists stay as-is: a string that is just
+    # their placeholder expands to the list itself.
     param_names = list(sweep_params.keys())
-    param_values_list = [sweep_params[name] for name in param_names]
+    param_choices = [
+        [(value, value if isinstance(value, list) else str(value), f"{name}{value}") for value in sweep_params[name]]
+        for name in param_names
+    ]
 
-    configs = []
-    for values in itertools.product(*param_values_list):
-        # Create parameter dict for this combination
-        params = dict(zip(param_names, values, strict=False))
+    # Copy the config without the sweep section once. Combinations share its
+    # placeholder-free subtrees until each result is copied on the way out, so
+    # nothing below may mutate the expanded config.
+    template = yaml_utils.copy_data({k: v for k, v in sweep_config.items() if k != "sweep"})
+
+    # Locate the placeholders once; each combination only rebuilds the paths to them
+    plan = _plan_template(template)
+    schema = cached_schema(SrtConfig)
 
-        # Create a copy of the config without the sweep section
-        config = copy.deepcopy(sweep_config)
-        del config["sweep"]
+    for choice in itertools.product(*param_choices):
+        # Create parameter dict for this combination
+        params = {name: value for name, (value, _, _) in zip(param_names, choice, strict=True)}
 
-        # Expand all template placeholders
-        config = expand_template(config, params)
+        # Expand all template placeholders from the pre-rendered values
+        rendered = {name: text for name, (_, text, _) in zip(param_names, choice, strict=True)}
+        config = _apply_plan(template, plan, rendered)
 
         # Generate a unique name for this config
-        param_str = "_".join(f"{k}{v}" for k, v in params.items())
-        config["name"] = f"{sweep_config['name']}_{param_str}"
-
-        # Validate and serialize back to dict
-        from srtctl.core.schema import SrtConfig
+        param_str = "_".join(fragment for _, _, fragment in choice)
+        config = {**config, "name": f"{sweep_config['name']}_{param_str}"}
 
-        schema = SrtConfig.Schema()
+        # Validate and serialize back to dict. Raw fields pass the shared template
+        # subtrees through unchanged, so copy to give each result its own data.
         validated = schema.load(config)
-        config = schema.dump(validated)
+        config = yaml_utils.copy_data(schema.dump(validated))
+
+        yield config, params
+
+
+def generate_sweep_configs(sweep_config: dict) -> list[tuple[dict, dict]]:
+    """Generate all job configs from a sweep configuration.
 
-        configs.append((config, params))
+    Args:
+        sweep_config: Config dict with 'sweep' section defining parameters
 
-    return configs
+    Returns:
+        List of (expanded_config, param_values) tuples
+    """
+    return list(iter_sweep_configs(sweep_config))
@@ -94,7 +94,7 @@ class NodePortAllocator:
         return port
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Endpoint:
     """A logical worker endpoint (serving unit).
 
@@ -137,7 +137,7 @@ class Endpoint:
         return self.num_nodes > 1
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Process:
     """A physical process within an endpoint.
 
@@ -0,0 +1,83 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+YAML helpers backed by libyaml when available.
+
+This module provides:
+- safe_load(): yaml.safe_load using the C loader if PyYAML was built with libyaml
+- safe_dump(): yaml.safe_dump using the C dumper if PyYAML was built with libyaml
+- load_file(): safe_load() of a file path, cached until the file changes
+- copy_data(): copy.deepcopy() specialized for loaded YAML data
+"""
+
+import copy
+import datetime
+import functools
+import os
+from typing import IO, Any
+
+import yaml
+
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper, SafeLoader  # type: ignore[assignment]
+
+
+def safe_load(stream: str | bytes | IO[Any]) -> Any:
+    """Parse YAML from a string or file, like yaml.safe_load()."""
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def safe_dump(data: Any, stream: IO[str] | None = None, **kwargs: Any) -> Any:
+    """Serialize data to YAML, like yaml.safe_dump().
+
+    Returns the YAML string when stream is None.
+    """
+    return yaml.dump(data, stream, Dumper=SafeDumper, **kwargs)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_file_snapshot(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML file; the result is shared and must not be mutated.
+
+    Keyed by (path, mtime, size) so edits to the file are picked up.
+    """
+    with open(path) as f:
+        return safe_load(f)
+
+
+def load_file(path: str | os.PathLike[str], mutable: bool = True) -> Any:
+    """Parse a YAML file, like safe_load(open(path)), reusing earlier parses.
+
+    By default each call returns an independent copy_data() of the cached
+    parse, so callers may freely mutate it. Callers that only read the data
+    (or copy it themselves) can pass mutable=False to get the shared parse.
+    """
+    stat = os.stat(path)
+    data = _load_file_snapshot(os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+    return copy_data(data) if mutable else data
+
+
+# Immutable scalar types YAML loads; copies can share them
+_SCALAR_TYPES = (str, int, float, bool, type(None), bytes, datetime.date, datetime.datetime)
+
+
+def copy_data(data: Any) -> Any:
+    """Deep-copy loaded YAML data, like copy.deepcopy().
+
+    Dicts and lists are rebuilt directly and scalars are shared, which skips
+    deepcopy's per-object dispatch and memo bookkeeping. Other types fall back
+    to copy.deepcopy(). Unlike deepcopy, objects referenced twice (YAML
+    aliases) become independent copies.
+    """
+    data_type = type(data)
+    if data_type is dict:
+        return {k: copy_data(v) for k, v in data.items()}
+    if data_type is list:
+        return [copy_data(v) for v in data]
+    if data_type in _SCALAR_TYPES:
+        return data
+    return copy.deepcopy(data)
@@ -70,32 +70,34 @@ class DynamoFrontend:
 
         processes: list[ManagedProcess] = []
 
-        for idx, node in enumerate(topology.frontend_nodes):
-            logger.info("Starting dynamo frontend %d on %s", idx, node)
+        # The command, env and preamble are the same on every frontend node
+        cmd = ["python3", "-m", "dynamo.frontend", f"--http-port={topology.frontend_port}"]
+        cmd.extend(self.get_frontend_args_list(config.frontend.args))
 
-            frontend_log = runtime.log_dir / f"{node}_frontend_{idx}.out"
-            cmd = ["python3", "-m", "dynamo.frontend", f"--http-port={topology.frontend_port}"]
-            cmd.extend(self.get_frontend_args_list(config.frontend.args))
+        env_to_set = {
+            "ETCD_ENDPOINTS": f"http://{runtime.nodes.infra}:2379",
+            "NATS_SERVER": f"nats://{runtime.nodes.infra}:4222",
+            "DYN_REQUEST_PLANE": "nats",
+        }
 
-            env_to_set = {
-                "ETCD_ENDPOINTS": f"http://{runtime.nodes.infra}:2379",
-                "NATS_SERVER": f"nats://{runtime.nodes.infra}:4222",
-                "DYN_REQUEST_PLANE": "nats",
-            }
+        # Add frontend env from config
+        if config.frontend.env:
+            env_to_set.update(config.frontend.env)
 
-            # Add frontend env from config
-            if config.frontend.env:
-                env_to_set.update(config.frontend.env)
+        # Build bash preamble (setup script + dynamo install)
+        bash_preamble = self._build_preamble(config)
 
-            # Build bash preamble (setup script + dynamo install)
-            bash_preamble = self._build_preamble(config)
+        for idx, node in enumerate(topology.frontend_nodes):
+            logger.info("Starting dynamo frontend %d on %s", idx, node)
+
+            frontend_log = runtime.log_dir / f"{node}_frontend_{idx}.out"
 
             proc = start_srun_process(
                 command=cmd,
                 nodelist=[node],
                 output=str(frontend_log),
                 container_image=str(runtime.container_image),
-                container_mounts=runtime.container_mounts,
+                container_mounts_str=runtime.container_mounts_str,
                 env_to_set=env_to_set,
                 bash_preamble=bash_preamble,
                 # TODO(jthomson): I don't have the faintest clue of
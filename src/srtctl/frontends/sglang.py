@@ -9,10 +9,11 @@ Uses sglang_router for direct communication with backend workers.
 
 import logging
 import shlex
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any
 
 from srtctl.core.health import WorkerHealthResult, check_sglang_router_health
-from srtctl.core.slurm import get_hostname_ip, start_srun_process
+from srtctl.core.slurm import get_hostname_ip, get_node_ips, get_slurm_job_id, start_srun_process
 
 if TYPE_CHECKING:
     from srtctl.core.processes import ManagedProcess
@@ -95,10 +96,18 @@ class SGLangFrontend:
             if backend.is_grpc_mode("agg"):
                 agg_scheme = "grpc://"
 
+        # Resolve each leader node once, even if it hosts several workers. Inside a
+        # job, warm the IP cache for all of them with a single batched srun first.
+        leader_nodes = list(dict.fromkeys(p.node for p in backend_processes if p.is_leader))
+        slurm_job_id = get_slurm_job_id()
+        if slurm_job_id:
+            get_node_ips(leader_nodes, slurm_job_id)
+        leader_ips = {node: get_hostname_ip(node) for node in leader_nodes}
+
         for process in backend_processes:
             if not process.is_leader:
                 continue
-            leader_ip = get_hostname_ip(process.node)
+            leader_ip = leader_ips[process.node]
             if process.endpoint_mode == "agg":
                 agg_workers.append((leader_ip, process.http_port))
             elif process.endpoint_mode == "prefill":
@@ -106,57 +115,62 @@ class SGLangFrontend:
             elif process.endpoint_mode == "decode":
                 decode_leaders.append((leader_ip, process.http_port))
 
-        processes: list[ManagedProcess] = []
+        # The router command and env are the same on every frontend node
+        cmd = ["python", "-m", "sglang_router.launch_router"]
+
+        if is_disaggregated:
+            # Disaggregated mode: --pd-disaggregation with --prefill and --decode
+            cmd.append("--pd-disaggregation")
+            for ip, http_port, bootstrap_port in prefill_leaders:
+                cmd.extend(["--prefill", f"{prefill_scheme}{ip}:{http_port}"])
+                # Add bootstrap port if available
+                if bootstrap_port is not None:
+                    cmd.append(str(bootstrap_port))
+            for ip, http_port in decode_leaders:
+                cmd.extend(["--decode", f"{decode_scheme}{ip}:{http_port}"])
+        else:
+            # Aggregated mode: --worker-urls with space-separated URLs
+            worker_urls = [f"{agg_scheme}{ip}:{port}" for ip, port in agg_workers]
+            cmd.extend(["--worker-urls"] + worker_urls)
+
+        cmd.extend(["--host", "0.0.0.0", "--port", str(topology.frontend_port)])
+        cmd.extend(self.get_frontend_args_list(config.frontend.args))
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Router command: %s", shlex.join(cmd))
 
-        for idx, node in enumerate(topology.frontend_nodes):
-            logger.info("Starting sglang-router %d on %s", idx, node)
+        # Build env vars
+        env_to_set: dict[str, str] = {}
+        if config.frontend.env:
+            env_to_set.update(config.frontend.env)
 
+        def start_router(idx: int, node: str) -> "ManagedProcess":
+            logger.info("Starting sglang-router %d on %s", idx, node)
             router_log = runtime.log_dir / f"{node}_router_{idx}.out"
 
-            cmd = ["python", "-m", "sglang_router.launch_router"]
-
-            if is_disaggregated:
-                # Disaggregated mode: --pd-disaggregation with --prefill and --decode
-                cmd.append("--pd-disaggregation")
-                for ip, http_port, bootstrap_port in prefill_leaders:
-                    cmd.extend(["--prefill", f"{prefill_scheme}{ip}:{http_port}"])
-                    # Add bootstrap port if available
-                    if bootstrap_port is not None:
-                        cmd.append(str(bootstrap_port))
-                for ip, http_port in decode_leaders:
-                    cmd.extend(["--decode", f"{decode_scheme}{ip}:{http_port}"])
-            else:
-                # Aggregated mode: --worker-urls with space-separated URLs
-                worker_urls = [f"{agg_scheme}{ip}:{port}" for ip, port in agg_workers]
-                cmd.extend(["--worker-urls"] + worker_urls)
-
-            cmd.extend(["--host", "0.0.0.0", "--port", str(topology.frontend_port)])
-            cmd.extend(self.get_frontend_args_list(config.frontend.args))
-
-            logger.info("Router command: %s", shlex.join(cmd))
-
-            # Build env vars
-            env_to_set: dict[str, str] = {}
-            if config.frontend.env:
-                env_to_set.update(config.frontend.env)
-
             proc = start_srun_process(
                 command=cmd,
                 nodelist=[node],
                 output=str(router_log),
                 container_image=str(runtime.container_image),
-                container_mounts=runtime.container_mounts,
+                container_mounts_str=runtime.container_mounts_str,
                 env_to_set=env_to_set if env_to_set else None,
             )
 
-            processes.append(
-                ManagedProcess(
-                    name=f"sglang_router_{idx}",
-                    popen=proc,
-                    log_file=router_log,
-                    node=node,
-                    critical=True,
-                )
+            return ManagedProcess(
+                name=f"sglang_router_{idx}",
+                popen=proc,
+                log_file=router_log,
+                node=node,
+                critical=True,
             )
 
+        # srun startup is dominated by fork/exec and the slurmctld round trip,
+        # so launch all routers concurrently
+        nodes = list(topology.frontend_nodes)
+        if not nodes:
+            return []
+        with ThreadPoolExecutor(max_workers=min(32, len(nodes))) as executor:
+            processes = list(executor.map(start_router, range(len(nodes)), nodes))
+
         return processes
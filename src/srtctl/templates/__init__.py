@@ -0,0 +1,74 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Jinja2 templates for generated sbatch scripts and service configs.
+
+This module provides:
+- get_template(): Load a compiled template from this directory
+"""
+
+import functools
+import os
+from pathlib import Path
+
+from jinja2 import BytecodeCache, Environment, FileSystemBytecodeCache, FileSystemLoader, Template
+
+# Path to the template files directory
+TEMPLATES_DIR = Path(__file__).parent
+
+
+# Opt-in directory for compiled template bytecode shared across runs
+TEMPLATE_CACHE_ENV = "SRTCTL_TEMPLATE_CACHE_DIR"
+
+
+def _get_bytecode_cache() -> BytecodeCache | None:
+    """Get an on-disk bytecode cache if one was requested, else None.
+
+    srtctl usually renders a handful of templates per invocation, so reusing
+    compiled bytecode across runs avoids recompiling them on every command.
+    Nothing is written to disk unless SRTCTL_TEMPLATE_CACHE_DIR is set, and
+    the cache is skipped if that directory isn't writable. Entries are keyed
+    by template source checksum, so edits are picked up.
+    """
+    cache_dir = os.environ.get(TEMPLATE_CACHE_ENV)
+    if not cache_dir:
+        return None
+    try:
+        Path(cache_dir).mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return None
+    return FileSystemBytecodeCache(cache_dir)
+
+
+@functools.cache
+def _get_environment(template_dir: str) -> Environment:
+    """Get the shared Jinja2 environment for a template directory.
+
+    Templates ship with the package and don't change at runtime, so the
+    environment never re-checks the files and keeps every compiled template.
+    """
+    return Environment(
+        loader=FileSystemLoader(template_dir),
+        auto_reload=False,
+        cache_size=-1,
+        bytecode_cache=_get_bytecode_cache(),
+    )
+
+
+def get_template(name: str) -> Template:
+    """Get a compiled template by file name.
+
+    Each template is read and compiled once per process; later calls return
+    the cached Template.
+
+    Args:
+        name: Template file name (e.g., "job_script_minimal.j2")
+
+    Returns:
+        Compiled jinja2 Template
+
+    Raises:
+        jinja2.TemplateNotFound: If the template file doesn't exist
+    """
+    return _get_environment(str(TEMPLATES_DIR)).get_template(name)
@@ -3,13 +3,39 @@
 
 """Tests for configuration loading and validation."""
 
-import glob
+import contextlib
+import os
+import re
+from dataclasses import replace
 from pathlib import Path
 
 import pytest
 
 from srtctl.backends import SGLangProtocol, SGLangServerConfig
-from srtctl.core.schema import SrtConfig
+from srtctl.cli.submit import find_yaml_files, generate_minimal_sbatch_script
+from srtctl.core.schema import DynamoConfig, FrontendConfig, InfraConfig, ModelConfig, ResourceConfig, SrtConfig
+
+_REPO_ROOT = Path(__file__).parent.parent
+_RECIPES_DIR = _REPO_ROOT / "recipes"
+
+# Config sections shared by the SrtConfig tests below. They are frozen, so one
+# instance can be reused instead of rebuilt (and re-validated) in every test.
+_MODEL = ModelConfig(path="/model", container="/container.sqsh", precision="fp8")
+_AGG_RESOURCES = ResourceConfig(gpu_type="h100", gpus_per_node=8, agg_nodes=1)
+_DISAGG_RESOURCES = ResourceConfig(
+    gpu_type="h100",
+    gpus_per_node=8,
+    prefill_nodes=1,
+    decode_nodes=1,
+    prefill_workers=1,
+    decode_workers=1,
+)
+
+# DynamoConfig install commands are "&&"-joined shell steps; these match the
+# steps each mode must emit, in the order they have to run.
+_VERSION_INSTALL_RE = re.compile(r"pip install .*ai-dynamo-runtime==0\.8\.0 .*ai-dynamo==0\.8\.0")
+_HASH_INSTALL_RE = re.compile(r"git clone .* && git checkout abc123 && .*maturin build .*pip install -e ")
+_TOP_OF_TREE_INSTALL_RE = re.compile(r"git clone .*maturin build .*pip install -e ")
 
 
 class TestConfigLoading:
@@ -18,7 +44,7 @@ class TestConfigLoading:
     def test_config_loading_from_yaml(self):
         """Test that config files in recipes/ can be loaded."""
         # Find all yaml files in recipes/
-        config_files = glob.glob("recipes/**/*.yaml", recursive=True)
+        config_files = [path for path in find_yaml_files(_RECIPES_DIR) if path.suffix == ".yaml"]
 
         if not config_files:
             pytest.skip("No config files found in recipes/")
@@ -27,15 +53,12 @@ class TestConfigLoading:
         loaded = 0
         for config_path in config_files:
             try:
-                config = SrtConfig.from_yaml(Path(config_path))
+                config = SrtConfig.from_yaml(config_path)
                 assert config.name is not None
                 assert config.model is not None
                 assert config.resources is not None
                 assert config.backend is not None
                 loaded += 1
-                print(f"\n✓ Loaded config: {config_path}")
-                print(f"  Name: {config.name}")
-                print(f"  Backend: {config.backend_type}")
             except Exception as e:
                 errors.append(f"{config_path}: {e}")
 
@@ -51,8 +74,6 @@ class TestSrtConfigStructure:
 
     def test_resource_config_disaggregated(self):
         """Test resource config disaggregation detection."""
-        from srtctl.core.schema import ResourceConfig
-
         # Disaggregated config
         disagg = ResourceConfig(
             gpu_type="h100",
@@ -72,8 +93,6 @@ class TestSrtConfigStructure:
 
     def test_decode_nodes_zero_inherits_tp_from_prefill(self):
         """When decode_nodes=0, gpus_per_decode inherits from prefill."""
-        from srtctl.core.schema import ResourceConfig
-
         # 6 prefill + 2 decode on 2 nodes, sharing
         config = ResourceConfig(
             gpu_type="gb200",
@@ -98,8 +117,6 @@ class TestDynamoConfig:
 
     def test_default_version(self):
         """Default is version 0.8.0."""
-        from srtctl.core.schema import DynamoConfig
-
         config = DynamoConfig()
         assert config.version == "0.8.0"
         assert config.hash is None
@@ -108,43 +125,29 @@ class TestDynamoConfig:
 
     def test_version_install_command(self):
         """Version config generates pip install command."""
-        from srtctl.core.schema import DynamoConfig
-
         config = DynamoConfig(version="0.8.0")
         cmd = config.get_install_commands()
-        assert "pip install" in cmd
-        assert "ai-dynamo-runtime==0.8.0" in cmd
-        assert "ai-dynamo==0.8.0" in cmd
+        assert _VERSION_INSTALL_RE.search(cmd)
 
     def test_hash_install_command(self):
         """Hash config generates source install command."""
-        from srtctl.core.schema import DynamoConfig
-
         config = DynamoConfig(hash="abc123")
         assert config.version is None  # Auto-cleared
         assert config.needs_source_install
         cmd = config.get_install_commands()
-        assert "git clone" in cmd
-        assert "git checkout abc123" in cmd
-        assert "maturin build" in cmd
-        assert "pip install -e" in cmd
+        assert _HASH_INSTALL_RE.search(cmd)
 
     def test_top_of_tree_install_command(self):
         """Top-of-tree config generates source install without checkout."""
-        from srtctl.core.schema import DynamoConfig
-
         config = DynamoConfig(top_of_tree=True)
         assert config.version is None  # Auto-cleared
         assert config.needs_source_install
         cmd = config.get_install_commands()
-        assert "git clone" in cmd
+        assert _TOP_OF_TREE_INSTALL_RE.search(cmd)
         assert "git checkout" not in cmd
-        assert "maturin build" in cmd
 
     def test_hash_and_top_of_tree_not_allowed(self):
         """Cannot specify both hash and top_of_tree."""
-        from srtctl.core.schema import DynamoConfig
-
         with pytest.raises(ValueError, match="Cannot specify both"):
             DynamoConfig(hash="abc123", top_of_tree=True)
 
@@ -264,6 +267,23 @@ class TestSGLangProtocol:
         assert config.is_grpc_mode("decode") is True
         assert config.is_grpc_mode("agg") is False
 
+    def test_config_to_cli_args(self):
+        """Test config dict conversion to sorted kebab-case CLI flags."""
+        from srtctl.backends.base import config_to_cli_args
+
+        args = config_to_cli_args(
+            {
+                "mem_fraction_static": 0.8,
+                "enable-dp-attention": True,
+                "disable_radix_cache": False,
+                "cuda-graph-bs": [1, 2, 4],
+                "skip": None,
+            }
+        )
+
+        assert args == ["--cuda-graph-bs", "1", "2", "4", "--enable-dp-attention", "--mem-fraction-static", "0.8"]
+        assert config_to_cli_args({}) == []
+
 
 class TestServedModelName:
     """Tests for served_model_name property extraction from backend configs."""
@@ -276,7 +296,6 @@ class TestServedModelName:
         instead of the configured name (e.g., "Qwen/Qwen3-32B").
         """
         from srtctl.backends import VLLMProtocol, VLLMServerConfig
-        from srtctl.core.schema import ModelConfig, ResourceConfig, SrtConfig
 
         config = SrtConfig(
             name="test",
@@ -295,7 +314,6 @@ class TestServedModelName:
     def test_vllm_served_model_name_fallback_to_path(self):
         """Test vLLM falls back to model path basename when not configured."""
         from srtctl.backends import VLLMProtocol
-        from srtctl.core.schema import ModelConfig, ResourceConfig, SrtConfig
 
         config = SrtConfig(
             name="test",
@@ -312,8 +330,6 @@ class TestFrontendConfig:
 
     def test_frontend_defaults(self):
         """Test frontend config defaults."""
-        from srtctl.core.schema import FrontendConfig
-
         frontend = FrontendConfig()
 
         assert frontend.type == "dynamo"
@@ -324,8 +340,6 @@ class TestFrontendConfig:
 
     def test_frontend_sglang_type(self):
         """Test sglang frontend config."""
-        from srtctl.core.schema import FrontendConfig
-
         frontend = FrontendConfig(
             type="sglang",
             args={"policy": "round_robin", "verbose": True},
@@ -401,16 +415,10 @@ class TestSetupScript:
 
     def test_setup_script_in_config(self):
         """Test setup_script can be set in config."""
-        from srtctl.core.schema import (
-            ModelConfig,
-            ResourceConfig,
-            SrtConfig,
-        )
-
         config = SrtConfig(
             name="test",
-            model=ModelConfig(path="/model", container="/container.sqsh", precision="fp8"),
-            resources=ResourceConfig(gpu_type="h100", gpus_per_node=8, agg_nodes=1),
+            model=_MODEL,
+            resources=_AGG_RESOURCES,
             setup_script="my-setup.sh",
         )
 
@@ -418,41 +426,28 @@ class TestSetupScript:
 
     def test_setup_script_override_with_replace(self):
         """Test setup_script can be overridden with dataclasses.replace."""
-        from dataclasses import replace
-
-        from srtctl.core.schema import (
-            ModelConfig,
-            ResourceConfig,
-            SrtConfig,
-        )
-
         config = SrtConfig(
             name="test",
-            model=ModelConfig(path="/model", container="/container.sqsh", precision="fp8"),
-            resources=ResourceConfig(gpu_type="h100", gpus_per_node=8, agg_nodes=1),
+            model=_MODEL,
+            resources=_AGG_RESOURCES,
         )
 
         assert config.setup_script is None
 
         # Override with replace (simulates CLI flag behavior)
-        config = replace(config, setup_script="install-sglang-main.sh")
-        assert config.setup_script == "install-sglang-main.sh"
+        overridden = replace(config, setup_script="install-sglang-main.sh")
+        assert overridden.setup_script == "install-sglang-main.sh"
+
+        # Nested sections are shared with the original, not re-built
+        assert overridden.model is config.model
+        assert overridden.resources is config.resources
 
     def test_sbatch_template_includes_setup_script_env_var(self):
         """Test that sbatch template sets SRTCTL_SETUP_SCRIPT env var."""
-        from pathlib import Path
-
-        from srtctl.cli.submit import generate_minimal_sbatch_script
-        from srtctl.core.schema import (
-            ModelConfig,
-            ResourceConfig,
-            SrtConfig,
-        )
-
         config = SrtConfig(
             name="test",
-            model=ModelConfig(path="/model", container="/container.sqsh", precision="fp8"),
-            resources=ResourceConfig(gpu_type="h100", gpus_per_node=8, agg_nodes=1),
+            model=_MODEL,
+            resources=_AGG_RESOURCES,
         )
 
         # Without setup_script
@@ -473,19 +468,10 @@ class TestSetupScript:
 
     def test_setup_script_env_var_override(self, monkeypatch):
         """Test that SRTCTL_SETUP_SCRIPT env var overrides config."""
-        import os
-        from dataclasses import replace
-
-        from srtctl.core.schema import (
-            ModelConfig,
-            ResourceConfig,
-            SrtConfig,
-        )
-
         config = SrtConfig(
             name="test",
-            model=ModelConfig(path="/model", container="/container.sqsh", precision="fp8"),
-            resources=ResourceConfig(gpu_type="h100", gpus_per_node=8, agg_nodes=1),
+            model=_MODEL,
+            resources=_AGG_RESOURCES,
             setup_script=None,
         )
 
@@ -502,268 +488,258 @@ class TestSetupScript:
         assert config.setup_script == "install-sglang-main.sh"
 
 
+@pytest.fixture(scope="module")
+def model_paths(tmp_path_factory):
+    """Model directory and container image shared by the worker stage tests.
+
+    Their parent directory doubles as the log base, so job logs stay out of ./outputs.
+    """
+    root = tmp_path_factory.mktemp("worker_stage")
+    model_path = root / "model"
+    model_path.mkdir()
+    container_path = root / "container.sqsh"
+    container_path.touch()
+    return model_path, container_path
+
+
+@contextlib.contextmanager
+def _mock_slurm_job(nodes: list[str]):
+    """Run inside a fake SLURM allocation of the given nodes.
+
+    Sets the SLURM job environment, answers `scontrol show hostnames` with
+    nodes, and resolves every hostname to 10.0.0.1.
+    """
+    import io
+    import os
+    import subprocess
+    from unittest.mock import MagicMock, patch
+
+    slurm_env = {
+        "SLURM_JOB_ID": "12345",
+        "SLURM_JOBID": "12345",
+        "SLURM_NODELIST": ",".join(nodes),
+        "SLURM_JOB_NUM_NODES": str(len(nodes)),
+        "SRTCTL_SOURCE_DIR": str(_REPO_ROOT),
+    }
+
+    real_popen = subprocess.Popen
+
+    def mock_scontrol(cmd, **kwargs):
+        if cmd[0] == "scontrol" and "hostnames" in cmd:
+            proc = MagicMock()
+            proc.__enter__.return_value = proc
+            proc.stdout = io.StringIO("\n".join(nodes))
+            proc.returncode = 0
+            return proc
+        return real_popen(cmd, **kwargs)
+
+    with (
+        patch.dict(os.environ, slurm_env),
+        patch("subprocess.Popen", mock_scontrol),
+        patch("srtctl.core.slurm.get_hostname_ip", return_value="10.0.0.1"),
+    ):
+        yield
+
+
 class TestWorkerEnvironmentTemplating:
     """Tests for per-worker environment variable templating with {node} and {node_id}."""
 
-    def test_environment_variable_node_templating(self, monkeypatch, tmp_path):
+    def test_environment_variable_node_templating(self, model_paths):
         """Test that environment variables support {node} and {node_id} templating."""
-        import os
-        import subprocess
-        from pathlib import Path
         from unittest.mock import MagicMock, patch
 
         from srtctl.backends import SGLangProtocol
         from srtctl.cli.mixins.worker_stage import WorkerStageMixin
         from srtctl.core.runtime import RuntimeContext
-        from srtctl.core.schema import ModelConfig, ResourceConfig, SrtConfig
         from srtctl.core.topology import Process
 
-        # Create temporary model and container paths
-        model_path = tmp_path / "model"
-        model_path.mkdir()
-        container_path = tmp_path / "container.sqsh"
-        container_path.touch()
-
-        # Mock SLURM environment
-        slurm_env = {
-            "SLURM_JOB_ID": "12345",
-            "SLURM_JOBID": "12345",
-            "SLURM_NODELIST": "gpu-[01-03]",
-            "SLURM_JOB_NUM_NODES": "3",
-            "SRTCTL_SOURCE_DIR": str(Path(__file__).parent.parent),
-        }
+        model_path, container_path = model_paths
+
+        with _mock_slurm_job(["gpu-01", "gpu-02", "gpu-03"]):
+            # Create config with templated environment variables
+            config = SrtConfig(
+                name="test",
+                model=ModelConfig(
+                    path=str(model_path),
+                    container=str(container_path),
+                    precision="fp8",
+                ),
+                resources=ResourceConfig(
+                    gpu_type="h100",
+                    gpus_per_node=8,
+                    prefill_nodes=1,
+                    decode_nodes=2,
+                ),
+                backend=SGLangProtocol(
+                    prefill_environment={
+                        "SGLANG_DG_CACHE_DIR": "/configs/dg-{node_id}",
+                        "WORKER_NODE": "{node}",
+                    },
+                    decode_environment={
+                        "SGLANG_DG_CACHE_DIR": "/configs/dg-{node_id}",
+                    },
+                ),
+            )
 
-        def mock_scontrol(cmd, **kwargs):
-            if cmd[0] == "scontrol" and "hostnames" in cmd:
-                result = MagicMock()
-                result.stdout = "gpu-01\ngpu-02\ngpu-03"
-                result.returncode = 0
-                return result
-            raise subprocess.CalledProcessError(1, cmd)
-
-        with patch.dict(os.environ, slurm_env):
-            with patch("subprocess.run", mock_scontrol):
-                with patch("srtctl.core.slurm.get_hostname_ip", return_value="10.0.0.1"):
-                    # Create config with templated environment variables
-                    config = SrtConfig(
-                        name="test",
-                        model=ModelConfig(
-                            path=str(model_path),
-                            container=str(container_path),
-                            precision="fp8",
-                        ),
-                        resources=ResourceConfig(
-                            gpu_type="h100",
-                            gpus_per_node=8,
-                            prefill_nodes=1,
-                            decode_nodes=2,
-                        ),
-                        backend=SGLangProtocol(
-                            prefill_environment={
-                                "SGLANG_DG_CACHE_DIR": "/configs/dg-{node_id}",
-                                "WORKER_NODE": "{node}",
-                            },
-                            decode_environment={
-                                "SGLANG_DG_CACHE_DIR": "/configs/dg-{node_id}",
-                            },
-                        ),
-                    )
-
-                    runtime = RuntimeContext.from_config(config, job_id="12345")
-
-                    # Create a mock worker stage
-                    class MockWorkerStage(WorkerStageMixin):
-                        def __init__(self, config, runtime):
-                            self.config = config
-                            self.runtime = runtime
-
-                    worker_stage = MockWorkerStage(config, runtime)
-
-                    # Create test processes on different nodes
-                    processes = [
-                        Process(
-                            node="gpu-01",
-                            gpu_indices=frozenset([0, 1, 2, 3, 4, 5, 6, 7]),
-                            sys_port=8081,
-                            http_port=30000,
-                            endpoint_mode="prefill",
-                            endpoint_index=0,
-                            node_rank=0,
-                        ),
-                        Process(
-                            node="gpu-02",
-                            gpu_indices=frozenset([0, 1, 2, 3, 4, 5, 6, 7]),
-                            sys_port=8082,
-                            http_port=30001,
-                            endpoint_mode="decode",
-                            endpoint_index=0,
-                            node_rank=0,
-                        ),
-                        Process(
-                            node="gpu-03",
-                            gpu_indices=frozenset([0, 1, 2, 3, 4, 5, 6, 7]),
-                            sys_port=8083,
-                            http_port=30002,
-                            endpoint_mode="decode",
-                            endpoint_index=1,
-                            node_rank=0,
-                        ),
-                    ]
-
-                    # Mock backend command builder and srun process to capture environment variables
-                    mock_backend = MagicMock()
-                    mock_backend.get_environment_for_mode.side_effect = config.backend.get_environment_for_mode
-                    mock_backend.build_worker_command.return_value = ["echo", "test"]
-                    
-                    with patch.object(worker_stage, 'config') as mock_config:
-                        mock_config.backend = mock_backend
-                        mock_config.profiling = config.profiling
-                        
-                        with patch("srtctl.cli.mixins.worker_stage.start_srun_process") as mock_srun:
-                            mock_srun.return_value = MagicMock()
-
-                            # Test prefill worker on gpu-01 (index 0)
-                            worker_stage.start_worker(processes[0], [])
-                            call_kwargs = mock_srun.call_args.kwargs
-                            env_vars = call_kwargs.get("env_to_set", {})
-
-                            assert "SGLANG_DG_CACHE_DIR" in env_vars
-                            assert env_vars["SGLANG_DG_CACHE_DIR"] == "/configs/dg-0"
-                            assert env_vars["WORKER_NODE"] == "gpu-01"
-
-                            # Test decode worker on gpu-02 (index 1)
-                            worker_stage.start_worker(processes[1], [])
-                            call_kwargs = mock_srun.call_args.kwargs
-                            env_vars = call_kwargs.get("env_to_set", {})
-
-                            assert env_vars["SGLANG_DG_CACHE_DIR"] == "/configs/dg-1"
-
-                            # Test decode worker on gpu-03 (index 2)
-                            worker_stage.start_worker(processes[2], [])
-                            call_kwargs = mock_srun.call_args.kwargs
-                            env_vars = call_kwargs.get("env_to_set", {})
-
-                            assert env_vars["SGLANG_DG_CACHE_DIR"] == "/configs/dg-2"
-
-    def test_environment_variable_unsupported_placeholder(self, monkeypatch, tmp_path):
+            runtime = RuntimeContext.from_config(config, job_id="12345", log_dir_base=model_path.parent)
+
+            # Create a mock worker stage
+            class MockWorkerStage(WorkerStageMixin):
+                def __init__(self, config, runtime):
+                    self.config = config
+                    self.runtime = runtime
+
+            worker_stage = MockWorkerStage(config, runtime)
+
+            # Create test processes on different nodes
+            processes = [
+                Process(
+                    node="gpu-01",
+                    gpu_indices=frozenset([0, 1, 2, 3, 4, 5, 6, 7]),
+                    sys_port=8081,
+                    http_port=30000,
+                    endpoint_mode="prefill",
+                    endpoint_index=0,
+                    node_rank=0,
+                ),
+                Process(
+                    node="gpu-02",
+                    gpu_indices=frozenset([0, 1, 2, 3, 4, 5, 6, 7]),
+                    sys_port=8082,
+                    http_port=30001,
+                    endpoint_mode="decode",
+                    endpoint_index=0,
+                    node_rank=0,
+                ),
+                Process(
+                    node="gpu-03",
+                    gpu_indices=frozenset([0, 1, 2, 3, 4, 5, 6, 7]),
+                    sys_port=8083,
+                    http_port=30002,
+                    endpoint_mode="decode",
+                    endpoint_index=1,
+                    node_rank=0,
+                ),
+            ]
+
+            # Mock backend command builder and srun process to capture environment variables
+            mock_backend = MagicMock()
+            mock_backend.get_environment_for_mode.side_effect = config.backend.get_environment_for_mode
+            mock_backend.build_worker_command.return_value = ["echo", "test"]
+
+            with patch.object(worker_stage, "config") as mock_config:
+                mock_config.backend = mock_backend
+                mock_config.profiling = config.profiling
+
+                with patch("srtctl.cli.mixins.worker_stage.start_srun_process") as mock_srun:
+                    # Test prefill worker on gpu-01 (index 0)
+                    worker_stage.start_worker(processes[0], [])
+                    call_kwargs = mock_srun.call_args.kwargs
+                    env_vars = call_kwargs.get("env_to_set", {})
+
+                    assert "SGLANG_DG_CACHE_DIR" in env_vars
+                    assert env_vars["SGLANG_DG_CACHE_DIR"] == "/configs/dg-0"
+                    assert env_vars["WORKER_NODE"] == "gpu-01"
+
+                    # Test decode worker on gpu-02 (index 1)
+                    worker_stage.start_worker(processes[1], [])
+                    call_kwargs = mock_srun.call_args.kwargs
+                    env_vars = call_kwargs.get("env_to_set", {})
+
+                    assert env_vars["SGLANG_DG_CACHE_DIR"] == "/configs/dg-1"
+
+                    # Test decode worker on gpu-03 (index 2)
+                    worker_stage.start_worker(processes[2], [])
+                    call_kwargs = mock_srun.call_args.kwargs
+                    env_vars = call_kwargs.get("env_to_set", {})
+
+                    assert env_vars["SGLANG_DG_CACHE_DIR"] == "/configs/dg-2"
+
+    def test_environment_variable_unsupported_placeholder(self, model_paths):
         """Test that unsupported placeholders like {foo} remain unchanged and don't throw errors."""
-        import os
-        import subprocess
-        from pathlib import Path
         from unittest.mock import MagicMock, patch
 
         from srtctl.backends import SGLangProtocol
         from srtctl.cli.mixins.worker_stage import WorkerStageMixin
         from srtctl.core.runtime import RuntimeContext
-        from srtctl.core.schema import ModelConfig, ResourceConfig, SrtConfig
         from srtctl.core.topology import Process
 
-        # Create temporary model and container paths
-        model_path = tmp_path / "model"
-        model_path.mkdir()
-        container_path = tmp_path / "container.sqsh"
-        container_path.touch()
-
-        slurm_env = {
-            "SLURM_JOB_ID": "12345",
-            "SLURM_JOBID": "12345",
-            "SLURM_NODELIST": "gpu-[01-02]",
-            "SLURM_JOB_NUM_NODES": "2",
-            "SRTCTL_SOURCE_DIR": str(Path(__file__).parent.parent),
-        }
+        model_path, container_path = model_paths
+
+        with _mock_slurm_job(["gpu-01", "gpu-02"]):
+            # Create config with unsupported template placeholders
+            config = SrtConfig(
+                name="test",
+                model=ModelConfig(
+                    path=str(model_path),
+                    container=str(container_path),
+                    precision="fp8",
+                ),
+                resources=ResourceConfig(
+                    gpu_type="h100",
+                    gpus_per_node=8,
+                    prefill_nodes=1,
+                    decode_nodes=1,
+                ),
+                backend=SGLangProtocol(
+                    prefill_environment={
+                        # Mix of supported and unsupported placeholders
+                        "CACHE_DIR": "/cache/{node_id}/data",
+                        "UNSUPPORTED": "/path/{foo}/bar/{baz}",
+                        "MIXED": "{node}-{unsupported_var}-cache",
+                    },
+                ),
+            )
+
+            runtime = RuntimeContext.from_config(config, job_id="12345", log_dir_base=model_path.parent)
+
+            class MockWorkerStage(WorkerStageMixin):
+                def __init__(self, config, runtime):
+                    self.config = config
+                    self.runtime = runtime
+
+            worker_stage = MockWorkerStage(config, runtime)
+
+            process = Process(
+                node="gpu-01",
+                gpu_indices=frozenset([0, 1, 2, 3, 4, 5, 6, 7]),
+                sys_port=8081,
+                http_port=30000,
+                endpoint_mode="prefill",
+                endpoint_index=0,
+                node_rank=0,
+            )
+
+            # Mock backend command builder and srun process to capture environment variables
+            mock_backend = MagicMock()
+            mock_backend.get_environment_for_mode.side_effect = config.backend.get_environment_for_mode
+            mock_backend.build_worker_command.return_value = ["echo", "test"]
+
+            with patch.object(worker_stage, "config") as mock_config:
+                mock_config.backend = mock_backend
+                mock_config.profiling = config.profiling
+
+                with patch("srtctl.cli.mixins.worker_stage.start_srun_process") as mock_srun:
+                    # This should NOT throw an error
+                    worker_stage.start_worker(process, [])
+                    call_kwargs = mock_srun.call_args.kwargs
+                    env_vars = call_kwargs.get("env_to_set", {})
+
+                    # Supported placeholder should be replaced
+                    assert env_vars["CACHE_DIR"] == "/cache/0/data"
+
+                    # Unsupported placeholders should remain unchanged
+                    assert env_vars["UNSUPPORTED"] == "/path/{foo}/bar/{baz}"
 
-        def mock_scontrol(cmd, **kwargs):
-            if cmd[0] == "scontrol" and "hostnames" in cmd:
-                result = MagicMock()
-                result.stdout = "gpu-01\ngpu-02"
-                result.returncode = 0
-                return result
-            raise subprocess.CalledProcessError(1, cmd)
-
-        with patch.dict(os.environ, slurm_env):
-            with patch("subprocess.run", mock_scontrol):
-                with patch("srtctl.core.slurm.get_hostname_ip", return_value="10.0.0.1"):
-                    # Create config with unsupported template placeholders
-                    config = SrtConfig(
-                        name="test",
-                        model=ModelConfig(
-                            path=str(model_path),
-                            container=str(container_path),
-                            precision="fp8",
-                        ),
-                        resources=ResourceConfig(
-                            gpu_type="h100",
-                            gpus_per_node=8,
-                            prefill_nodes=1,
-                            decode_nodes=1,
-                        ),
-                        backend=SGLangProtocol(
-                            prefill_environment={
-                                # Mix of supported and unsupported placeholders
-                                "CACHE_DIR": "/cache/{node_id}/data",
-                                "UNSUPPORTED": "/path/{foo}/bar/{baz}",
-                                "MIXED": "{node}-{unsupported_var}-cache",
-                            },
-                        ),
-                    )
-
-                    runtime = RuntimeContext.from_config(config, job_id="12345")
-
-                    class MockWorkerStage(WorkerStageMixin):
-                        def __init__(self, config, runtime):
-                            self.config = config
-                            self.runtime = runtime
-
-                    worker_stage = MockWorkerStage(config, runtime)
-
-                    process = Process(
-                        node="gpu-01",
-                        gpu_indices=frozenset([0, 1, 2, 3, 4, 5, 6, 7]),
-                        sys_port=8081,
-                        http_port=30000,
-                        endpoint_mode="prefill",
-                        endpoint_index=0,
-                        node_rank=0,
-                    )
-
-                    # Mock backend command builder and srun process to capture environment variables
-                    mock_backend = MagicMock()
-                    mock_backend.get_environment_for_mode.side_effect = config.backend.get_environment_for_mode
-                    mock_backend.build_worker_command.return_value = ["echo", "test"]
-                    
-                    with patch.object(worker_stage, 'config') as mock_config:
-                        mock_config.backend = mock_backend
-                        mock_config.profiling = config.profiling
-                        
-                        with patch("srtctl.cli.mixins.worker_stage.start_srun_process") as mock_srun:
-                            mock_srun.return_value = MagicMock()
-
-                            # This should NOT throw an error
-                            worker_stage.start_worker(process, [])
-                            call_kwargs = mock_srun.call_args.kwargs
-                            env_vars = call_kwargs.get("env_to_set", {})
-
-                            # Supported placeholder should be replaced
-                            assert env_vars["CACHE_DIR"] == "/cache/0/data"
-
-                            # Unsupported placeholders should remain unchanged
-                            assert env_vars["UNSUPPORTED"] == "/path/{foo}/bar/{baz}"
-
-                            # Mixed case: supported replaced, unsupported kept
-                            assert env_vars["MIXED"] == "gpu-01-{unsupported_var}-cache"
+                    # Mixed case: supported replaced, unsupported kept
+                    assert env_vars["MIXED"] == "gpu-01-{unsupported_var}-cache"
 
 class TestInfraConfig:
     """Tests for InfraConfig dataclass."""
 
     def test_infra_config_defaults(self):
         """Test that InfraConfig has correct defaults."""
-        from srtctl.core.schema import InfraConfig, ModelConfig, ResourceConfig, SrtConfig
-
-        config = SrtConfig(
-            name="test",
-            model=ModelConfig(path="/model", container="/container.sqsh", precision="fp8"),
-            resources=ResourceConfig(gpu_type="h100", gpus_per_node=8, agg_nodes=1),
-        )
+        config = SrtConfig(name="test", model=_MODEL, resources=_AGG_RESOURCES)
 
         # infra config should exist with default values
         assert config.infra is not None
@@ -771,12 +747,10 @@ class TestInfraConfig:
 
     def test_infra_config_enabled(self):
         """Test InfraConfig with dedicated node enabled."""
-        from srtctl.core.schema import InfraConfig, ModelConfig, ResourceConfig, SrtConfig
-
         config = SrtConfig(
             name="test",
-            model=ModelConfig(path="/model", container="/container.sqsh", precision="fp8"),
-            resources=ResourceConfig(gpu_type="h100", gpus_per_node=8, agg_nodes=1),
+            model=_MODEL,
+            resources=_AGG_RESOURCES,
             infra=InfraConfig(etcd_nats_dedicated_node=True),
         )
 
@@ -816,8 +790,6 @@ class TestNodesInfraAllocation:
         """Test that dedicated infra node requires at least 2 nodes."""
         from unittest.mock import patch
 
-        import pytest
-
         from srtctl.core.runtime import Nodes
 
         with patch("srtctl.core.runtime.get_slurm_nodelist", return_value=["node0"]):
@@ -830,23 +802,11 @@ class TestSbatchNodeCount:
 
     def test_sbatch_adds_node_for_dedicated_infra(self):
         """Test that sbatch script requests extra node when etcd_nats_dedicated_node is enabled."""
-        from pathlib import Path
-
-        from srtctl.cli.submit import generate_minimal_sbatch_script
-        from srtctl.core.schema import InfraConfig, ModelConfig, ResourceConfig, SrtConfig
-
         # Config with 2 worker nodes
         config = SrtConfig(
             name="test",
-            model=ModelConfig(path="/model", container="/container.sqsh", precision="fp8"),
-            resources=ResourceConfig(
-                gpu_type="h100",
-                gpus_per_node=8,
-                prefill_nodes=1,
-                decode_nodes=1,
-                prefill_workers=1,
-                decode_workers=1,
-            ),
+            model=_MODEL,
+            resources=_DISAGG_RESOURCES,
             infra=InfraConfig(etcd_nats_dedicated_node=True),
         )
 
@@ -857,23 +817,11 @@ class TestSbatchNodeCount:
 
     def test_sbatch_normal_node_count_without_dedicated_infra(self):
         """Test that sbatch script uses normal node count when etcd_nats_dedicated_node is disabled."""
-        from pathlib import Path
-
-        from srtctl.cli.submit import generate_minimal_sbatch_script
-        from srtctl.core.schema import InfraConfig, ModelConfig, ResourceConfig, SrtConfig
-
         # Config with 2 worker nodes, no dedicated infra
         config = SrtConfig(
             name="test",
-            model=ModelConfig(path="/model", container="/container.sqsh", precision="fp8"),
-            resources=ResourceConfig(
-                gpu_type="h100",
-                gpus_per_node=8,
-                prefill_nodes=1,
-                decode_nodes=1,
-                prefill_workers=1,
-                decode_workers=1,
-            ),
+            model=_MODEL,
+            resources=_DISAGG_RESOURCES,
             infra=InfraConfig(etcd_nats_dedicated_node=False),
         )
 
@@ -883,6 +831,228 @@ class TestSbatchNodeCount:
         assert "#SBATCH --nodes=2" in script
 
 
+class TestClusterConfigCache:
+    """Tests for srtslurm.yaml caching in get_srtslurm_setting."""
+
+    def test_settings_parsed_once_until_file_changes(self, tmp_path, monkeypatch):
+        """Test that repeated lookups reuse the parsed file and edits are picked up."""
+        from unittest.mock import patch
+
+        from srtctl.core import config as config_module
+        from srtctl.core import yaml_utils
+
+        cluster_file = tmp_path / "srtslurm.yaml"
+        cluster_file.write_text("default_account: acct1\nsrtctl_root: /srtctl\n")
+        monkeypatch.setenv("SRTSLURM_CONFIG", str(cluster_file))
+
+        with patch.object(config_module.yaml_utils, "safe_load", wraps=yaml_utils.safe_load) as mock_load:
+            assert config_module.get_srtslurm_setting("default_account") == "acct1"
+            assert config_module.get_srtslurm_setting("srtctl_root") == "/srtctl"
+            assert mock_load.call_count == 1
+
+            cluster_file.write_text("default_account: acct2\n")
+            stat = cluster_file.stat()
+            os.utime(cluster_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            assert config_module.get_srtslurm_setting("default_account") == "acct2"
+            assert mock_load.call_count == 2
+
+    def test_cached_config_not_shared_with_callers(self, tmp_path, monkeypatch):
+        """Test that mutating a returned cluster config doesn't affect later loads."""
+        from srtctl.core.config import load_cluster_config
+
+        cluster_file = tmp_path / "srtslurm.yaml"
+        cluster_file.write_text("containers:\n  sglang: /containers/sglang.sqsh\n")
+        monkeypatch.setenv("SRTSLURM_CONFIG", str(cluster_file))
+
+        first = load_cluster_config()
+        first["containers"]["sglang"] = "mutated"
+
+        assert load_cluster_config()["containers"]["sglang"] == "/containers/sglang.sqsh"
+
+
+class TestYamlFileCache:
+    """Tests for yaml_utils.load_file caching."""
+
+    def test_file_parsed_once_until_it_changes(self, tmp_path):
+        """Test that repeated loads reuse the parse and edits are picked up."""
+        from unittest.mock import patch
+
+        from srtctl.core import yaml_utils
+
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("name: first\n")
+
+        with patch.object(yaml_utils, "safe_load", wraps=yaml_utils.safe_load) as mock_load:
+            assert yaml_utils.load_file(config_file) == {"name": "first"}
+            assert yaml_utils.load_file(str(config_file)) == {"name": "first"}
+            assert mock_load.call_count == 1
+
+            config_file.write_text("name: second\n")
+            stat = config_file.stat()
+            os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            assert yaml_utils.load_file(config_file) == {"name": "second"}
+            assert mock_load.call_count == 2
+
+    def test_loaded_data_not_shared_with_callers(self, tmp_path):
+        """Test that mutating a loaded file's data doesn't affect later loads."""
+        from srtctl.core import yaml_utils
+
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("resources:\n  gpus_per_node: 8\n")
+
+        first = yaml_utils.load_file(config_file)
+        first["resources"]["gpus_per_node"] = 4
+
+        assert yaml_utils.load_file(config_file) == {"resources": {"gpus_per_node": 8}}
+
+    def test_load_config_leaves_cached_parse_untouched(self, tmp_path):
+        """Test that load_config reads the shared parse without mutating it."""
+        from srtctl.core import yaml_utils
+        from srtctl.core.config import load_config
+
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(
+            "name: shared\n"
+            "model: {path: /models/m, container: /c.sqsh, precision: fp8}\n"
+            "resources: {gpu_type: h100, agg_nodes: 1}\n"
+        )
+        before = yaml_utils.load_file(config_file)
+
+        load_config(config_file)
+
+        assert yaml_utils.load_file(config_file, mutable=False) == before
+
+    def test_from_yaml_results_do_not_share_cached_parse(self, tmp_path):
+        """Test that mutating raw config values from one from_yaml call doesn't leak into the next."""
+        from srtctl.core.schema import SrtConfig
+
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(
+            "name: raw\n"
+            "model: {path: /models/m, container: /c.sqsh, precision: fp8}\n"
+            "resources: {gpu_type: h100, agg_nodes: 1}\n"
+            "backend: {type: sglang, sglang_config: {aggregated: {cuda-graph-bs: [1, 2]}}}\n"
+        )
+
+        SrtConfig.from_yaml(config_file).backend.sglang_config.aggregated["cuda-graph-bs"].append(3)
+
+        assert SrtConfig.from_yaml(config_file).backend.sglang_config.aggregated["cuda-graph-bs"] == [1, 2]
+
+
+class TestFindYamlFiles:
+    """Tests for find_yaml_files."""
+
+    def test_finds_both_extensions_recursively(self, tmp_path):
+        """Test that .yaml and .yml files are found in nested dirs, sorted."""
+        (tmp_path / "nested" / "deeper").mkdir(parents=True)
+        for name in ("b.yaml", "nested/a.yml", "nested/deeper/c.yaml", "notes.txt", "nested/config.yaml.bak"):
+            (tmp_path / name).write_text("name: test\n")
+
+        assert find_yaml_files(tmp_path) == [
+            tmp_path / "b.yaml",
+            tmp_path / "nested" / "a.yml",
+            tmp_path / "nested" / "deeper" / "c.yaml",
+        ]
+
+
+class TestSubmitSweep:
+    """Tests for sweep submission."""
+
+    def test_submits_every_job_without_rereading_configs(self, tmp_path):
+        """Test that each expanded sweep config is validated in memory and submitted."""
+        from unittest.mock import patch
+
+        import yaml
+
+        from srtctl.cli import submit
+
+        sweep_file = tmp_path / "sweep.yaml"
+        sweep_file.write_text(
+            yaml.dump(
+                {
+                    "name": "sweep",
+                    "model": {"path": "/model", "container": "/container.sqsh", "precision": "fp8"},
+                    "resources": {"gpu_type": "h100", "gpus_per_node": 8, "agg_nodes": 1},
+                    "sweep": {"x": [1, 2, 3]},
+                }
+            )
+        )
+
+        with (
+            patch.object(submit, "submit_single") as mock_submit,
+            patch.object(submit, "load_config", side_effect=AssertionError("configs should not be re-read")),
+        ):
+            submit.submit_sweep(sweep_file)
+
+        names = [c.kwargs["config"].name for c in mock_submit.call_args_list]
+        assert names == ["sweep_x1", "sweep_x2", "sweep_x3"]
+        assert len({c.kwargs["timestamp"] for c in mock_submit.call_args_list}) == 1
+
+
+class TestTemplates:
+    """Tests for packaged Jinja2 template loading."""
+
+    def test_template_compiled_once(self):
+        """Test that repeated lookups return the cached compiled template."""
+        from srtctl.templates import get_template
+
+        assert get_template("job_script_minimal.j2") is get_template("job_script_minimal.j2")
+
+    def test_missing_template_raises(self):
+        """Test that unknown template names raise TemplateNotFound."""
+        from jinja2 import TemplateNotFound
+
+        from srtctl.templates import get_template
+
+        with pytest.raises(TemplateNotFound):
+            get_template("does_not_exist.j2")
+
+    def test_bytecode_cache_off_by_default(self, monkeypatch):
+        """Test that nothing is cached on disk unless a cache dir is requested."""
+        from srtctl import templates
+
+        monkeypatch.delenv(templates.TEMPLATE_CACHE_ENV, raising=False)
+
+        assert templates._get_bytecode_cache() is None
+
+    def test_bytecode_cache_in_requested_dir(self, monkeypatch, tmp_path):
+        """Test that compiled templates are cached in SRTCTL_TEMPLATE_CACHE_DIR."""
+        from srtctl import templates
+
+        cache_dir = tmp_path / "jinja"
+        monkeypatch.setenv(templates.TEMPLATE_CACHE_ENV, str(cache_dir))
+
+        assert templates._get_bytecode_cache() is not None
+        assert cache_dir.is_dir()
+
+    def test_bytecode_cache_disabled_when_unwritable(self, monkeypatch, tmp_path):
+        """Test that an unwritable cache dir disables the bytecode cache."""
+        from srtctl import templates
+
+        blocker = tmp_path / "not_a_dir"
+        blocker.write_text("")
+        monkeypatch.setenv(templates.TEMPLATE_CACHE_ENV, str(blocker / "jinja"))
+
+        assert templates._get_bytecode_cache() is None
+
+    def test_cluster_template_vars_single_lookup(self, monkeypatch, tmp_path):
+        """Test that sbatch cluster settings come from one srtslurm.yaml lookup."""
+        from unittest.mock import MagicMock
+
+        from srtctl.cli import submit
+
+        cluster = {"srtctl_root": str(tmp_path), "use_segment_sbatch_directive": False}
+        mock_load = MagicMock(return_value=cluster)
+        monkeypatch.setattr(submit, "load_cluster_config", mock_load)
+        template_vars = submit._cluster_template_vars()
+
+        mock_load.assert_called_once()
+        assert template_vars["srtctl_source"] == str(tmp_path.resolve())
+        assert template_vars["output_base"] == str((tmp_path / "outputs").resolve())
+        assert template_vars["use_segment_sbatch_directive"] is False
+        assert template_vars["use_gpus_per_node_directive"] is True
+
+
 class TestVLLMDataParallelMode:
     """Tests for vLLM DP+EP (Data Parallel + Expert Parallel) mode."""
 
@@ -958,7 +1128,6 @@ class TestVLLMDataParallelMode:
 
     def test_dp_mode_command_includes_dp_flags(self):
         """Test that DP mode command includes correct DP flags instead of TP flags."""
-        from pathlib import Path
         from unittest.mock import MagicMock, patch
 
         from srtctl.backends import VLLMProtocol, VLLMServerConfig
@@ -1007,21 +1176,25 @@ class TestVLLMDataParallelMode:
                 runtime=mock_runtime,
             )
 
-        # Should include DP flags
-        assert "--data-parallel-rank" in cmd
-        assert "5" in cmd  # dp_rank = 5
-        assert "--data-parallel-address" in cmd
-        assert "10.0.0.1" in cmd
-        assert "--data-parallel-rpc-port" in cmd
-        assert "13345" in cmd
-        assert "--data-parallel-size" in cmd
-        assert "16" in cmd
+        args = set(cmd)
+
+        # Should include DP flags (dp_rank = 5)
+        expected = (
+            "--data-parallel-rank",
+            "5",
+            "--data-parallel-address",
+            "10.0.0.1",
+            "--data-parallel-rpc-port",
+            "13345",
+            "--data-parallel-size",
+            "16",
+        )
+        missing = [arg for arg in expected if arg not in args]
+        assert not missing, missing
 
         # Should NOT include TP multi-node flags
-        assert "--master-addr" not in cmd
-        assert "--nnodes" not in cmd
-        assert "--node-rank" not in cmd
-        assert "--headless" not in cmd
+        unexpected = [arg for arg in ("--master-addr", "--nnodes", "--node-rank", "--headless") if arg in args]
+        assert not unexpected, unexpected
 
     def test_standard_tp_mode_still_works(self):
         """Test that standard TP mode (no DP) still creates per-node processes."""
@@ -1104,9 +1277,27 @@ class TestVLLMDataParallelMode:
         assert "DYN_VLLM_KV_EVENT_PORT" not in env
         assert "VLLM_NIXL_SIDE_CHANNEL_PORT" not in env
 
-    def test_tp_mode_command_includes_multinode_flags(self):
-        """Test standard TP mode includes multi-node coordination flags."""
-        from pathlib import Path
+    @pytest.mark.parametrize(
+        ("node_rank", "expected", "unexpected"),
+        [
+            # node_rank is determined by position in endpoint_nodes, not process.node_rank
+            # ("1" is node1), and the non-leader should be headless.
+            (
+                1,
+                ("--master-addr", "10.0.0.1", "--nnodes", "2", "--node-rank", "1", "--headless"),
+                ("--data-parallel-rank", "--data-parallel-address"),
+            ),
+            # The leader keeps the multi-node flags but is not headless.
+            (
+                0,
+                ("--master-addr", "--nnodes"),
+                ("--headless", "--data-parallel-rank", "--data-parallel-address"),
+            ),
+        ],
+        ids=["non_leader", "leader"],
+    )
+    def test_tp_mode_command_multinode_flags(self, node_rank, expected, unexpected):
+        """Test standard TP mode includes multi-node coordination flags on every node."""
         from unittest.mock import MagicMock, patch
 
         from srtctl.backends import VLLMProtocol, VLLMServerConfig
@@ -1119,37 +1310,18 @@ class TestVLLMDataParallelMode:
             )
         )
 
-        # Non-leader process (node_rank=1)
-        process = Process(
-            node="node1",
-            gpu_indices=frozenset(range(8)),
-            sys_port=8082,
-            http_port=0,
-            endpoint_mode="prefill",
-            endpoint_index=0,
-            node_rank=1,
-        )
-
         # Endpoint spans 2 nodes
         endpoint_processes = [
             Process(
-                node="node0",
+                node=f"node{rank}",
                 gpu_indices=frozenset(range(8)),
-                sys_port=8081,
-                http_port=30000,
+                sys_port=8081 + rank,
+                http_port=30000 if rank == 0 else 0,
                 endpoint_mode="prefill",
                 endpoint_index=0,
-                node_rank=0,
-            ),
-            Process(
-                node="node1",
-                gpu_indices=frozenset(range(8)),
-                sys_port=8082,
-                http_port=0,
-                endpoint_mode="prefill",
-                endpoint_index=0,
-                node_rank=1,
-            ),
+                node_rank=rank,
+            )
+            for rank in range(2)
         ]
 
         mock_runtime = MagicMock()
@@ -1157,75 +1329,15 @@ class TestVLLMDataParallelMode:
 
         with patch("srtctl.core.slurm.get_hostname_ip", return_value="10.0.0.1"):
             cmd = backend.build_worker_command(
-                process=process,
+                process=endpoint_processes[node_rank],
                 endpoint_processes=endpoint_processes,
                 runtime=mock_runtime,
             )
 
-        # Should include TP multi-node flags
-        assert "--master-addr" in cmd
-        assert "10.0.0.1" in cmd
-        assert "--nnodes" in cmd
-        assert "2" in cmd
-        assert "--node-rank" in cmd
-        # node_rank is determined by position in endpoint_nodes, not process.node_rank
-        assert "1" in cmd  # This is node1
-        assert "--headless" in cmd  # Non-leader should be headless
-
-        # Should NOT include DP flags
-        assert "--data-parallel-rank" not in cmd
-        assert "--data-parallel-address" not in cmd
-
-    def test_tp_mode_leader_not_headless(self):
-        """Test TP mode leader (node_rank=0) does not get --headless flag."""
-        from pathlib import Path
-        from unittest.mock import MagicMock, patch
-
-        from srtctl.backends import VLLMProtocol, VLLMServerConfig
-        from srtctl.core.topology import Process
-
-        backend = VLLMProtocol(
-            vllm_config=VLLMServerConfig(
-                prefill={"tensor-parallel-size": 16},
-            )
-        )
-
-        # Leader process (node_rank=0)
-        process = Process(
-            node="node0",
-            gpu_indices=frozenset(range(8)),
-            sys_port=8081,
-            http_port=30000,
-            endpoint_mode="prefill",
-            endpoint_index=0,
-            node_rank=0,
-        )
-
-        endpoint_processes = [
-            process,
-            Process(
-                node="node1",
-                gpu_indices=frozenset(range(8)),
-                sys_port=8082,
-                http_port=0,
-                endpoint_mode="prefill",
-                endpoint_index=0,
-                node_rank=1,
-            ),
-        ]
-
-        mock_runtime = MagicMock()
-        mock_runtime.model_path = Path("/model")
+        args = set(cmd)
 
-        with patch("srtctl.core.slurm.get_hostname_ip", return_value="10.0.0.1"):
-            cmd = backend.build_worker_command(
-                process=process,
-                endpoint_processes=endpoint_processes,
-                runtime=mock_runtime,
-            )
+        missing = [arg for arg in expected if arg not in args]
+        assert not missing, missing
 
-        # Leader should NOT be headless
-        assert "--headless" not in cmd
-        # But should still have multi-node flags
-        assert "--master-addr" in cmd
-        assert "--nnodes" in cmd
+        present = [arg for arg in unexpected if arg in args]
+        assert not present, present
@@ -228,9 +228,6 @@ class TestStartFrontendIntegration:
     @patch("srtctl.cli.mixins.frontend_stage.start_srun_process")
     def test_single_node_starts_one_dynamo_frontend(self, mock_mixin_srun, mock_dynamo_srun):
         """Single node starts one dynamo frontend, no nginx."""
-        mock_mixin_srun.return_value = MagicMock()
-        mock_dynamo_srun.return_value = MagicMock()
-
         config = make_config(enable_multiple_frontends=True, frontend_type="dynamo")
         runtime = make_runtime(["node0"])
         orchestrator = SweepOrchestrator(config=config, runtime=runtime)
@@ -246,9 +243,6 @@ class TestStartFrontendIntegration:
     @patch("srtctl.cli.mixins.frontend_stage.start_srun_process")
     def test_single_node_starts_one_sglang_router(self, mock_mixin_srun, mock_sglang_srun):
         """Single node starts one sglang router, no nginx."""
-        mock_mixin_srun.return_value = MagicMock()
-        mock_sglang_srun.return_value = MagicMock()
-
         config = make_config(enable_multiple_frontends=True, frontend_type="sglang")
         runtime = make_runtime(["node0"])
         orchestrator = SweepOrchestrator(config=config, runtime=runtime)
@@ -265,9 +259,6 @@ class TestStartFrontendIntegration:
     @patch("srtctl.cli.mixins.frontend_stage.start_srun_process")
     def test_multi_node_starts_nginx_and_frontends(self, mock_mixin_srun, mock_dynamo_srun, tmp_path):
         """Multi-node starts nginx on head + frontends on other nodes."""
-        mock_mixin_srun.return_value = MagicMock()
-        mock_dynamo_srun.return_value = MagicMock()
-
         config = make_config(enable_multiple_frontends=True, frontend_type="dynamo")
         runtime = make_runtime(["node0", "node1", "node2"])
         # Use tmp_path for log_dir so nginx config can be written
@@ -312,9 +303,6 @@ class TestStartFrontendIntegration:
     @patch("srtctl.cli.mixins.frontend_stage.start_srun_process")
     def test_multi_node_sglang_with_nginx(self, mock_mixin_srun, mock_sglang_srun, tmp_path):
         """Multi-node with sglang router starts nginx + routers."""
-        mock_mixin_srun.return_value = MagicMock()
-        mock_sglang_srun.return_value = MagicMock()
-
         config = make_config(enable_multiple_frontends=True, frontend_type="sglang")
         runtime = make_runtime(["node0", "node1", "node2"])
         # Use tmp_path for log_dir so nginx config can be written
@@ -349,9 +337,6 @@ class TestStartFrontendIntegration:
     @patch("srtctl.cli.mixins.frontend_stage.start_srun_process")
     def test_frontends_disabled_single_frontend_only(self, mock_mixin_srun, mock_dynamo_srun):
         """enable_multiple_frontends=False: only one frontend, no nginx."""
-        mock_mixin_srun.return_value = MagicMock()
-        mock_dynamo_srun.return_value = MagicMock()
-
         config = make_config(enable_multiple_frontends=False, frontend_type="dynamo")
         runtime = make_runtime(["node0", "node1", "node2", "node3"])
         orchestrator = SweepOrchestrator(config=config, runtime=runtime)
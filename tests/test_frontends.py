@@ -4,13 +4,39 @@
 """Tests for frontend implementations (SGLang and Dynamo)."""
 
 from dataclasses import dataclass
-from unittest.mock import MagicMock, patch
+from unittest.mock import DEFAULT, MagicMock, patch
 
 import pytest
 
+from srtctl.backends import SGLangProtocol, SGLangServerConfig
 from srtctl.frontends import DynamoFrontend, SGLangFrontend, get_frontend
 
 
+# Frontends are stateless, so one instance per module serves every test.
+@pytest.fixture(scope="module")
+def sglang_frontend():
+    """Shared SGLangFrontend."""
+    return SGLangFrontend()
+
+
+@pytest.fixture(scope="module")
+def dynamo_frontend():
+    """Shared DynamoFrontend."""
+    return DynamoFrontend()
+
+
+@pytest.fixture
+def mock_srun():
+    """Patch the SGLang frontend's srun launcher and worker IP lookup together.
+
+    Worker nodes resolve to 10.0.0.<last character of the node name>. Yields
+    the start_srun_process mock.
+    """
+    with patch.multiple("srtctl.frontends.sglang", start_srun_process=DEFAULT, get_hostname_ip=DEFAULT) as mocks:
+        mocks["get_hostname_ip"].side_effect = lambda node: f"10.0.0.{node[-1]}"
+        yield mocks["start_srun_process"]
+
+
 # ============================================================================
 # get_frontend() Tests
 # ============================================================================
@@ -48,25 +74,21 @@ class TestGetFrontend:
 class TestFrontendProperties:
     """Tests for frontend properties."""
 
-    def test_dynamo_type(self):
+    def test_dynamo_type(self, dynamo_frontend):
         """DynamoFrontend.type is 'dynamo'."""
-        frontend = DynamoFrontend()
-        assert frontend.type == "dynamo"
+        assert dynamo_frontend.type == "dynamo"
 
-    def test_sglang_type(self):
+    def test_sglang_type(self, sglang_frontend):
         """SGLangFrontend.type is 'sglang'."""
-        frontend = SGLangFrontend()
-        assert frontend.type == "sglang"
+        assert sglang_frontend.type == "sglang"
 
-    def test_dynamo_health_endpoint(self):
+    def test_dynamo_health_endpoint(self, dynamo_frontend):
         """DynamoFrontend uses /health endpoint."""
-        frontend = DynamoFrontend()
-        assert frontend.health_endpoint == "/health"
+        assert dynamo_frontend.health_endpoint == "/health"
 
-    def test_sglang_health_endpoint(self):
+    def test_sglang_health_endpoint(self, sglang_frontend):
         """SGLangFrontend uses /workers endpoint."""
-        frontend = SGLangFrontend()
-        assert frontend.health_endpoint == "/workers"
+        assert sglang_frontend.health_endpoint == "/workers"
 
 
 # ============================================================================
@@ -77,60 +99,29 @@ class TestFrontendProperties:
 class TestGetFrontendArgsList:
     """Tests for get_frontend_args_list() method."""
 
-    def test_empty_args_returns_empty_list(self):
-        """None or empty args returns empty list."""
-        frontend = SGLangFrontend()
-
-        assert frontend.get_frontend_args_list(None) == []
-        assert frontend.get_frontend_args_list({}) == []
-
-    def test_boolean_true_flag(self):
-        """Boolean True generates flag without value."""
-        frontend = SGLangFrontend()
-
-        result = frontend.get_frontend_args_list({"verbose": True})
-        assert result == ["--verbose"]
-
-    def test_boolean_false_flag_skipped(self):
-        """Boolean False is skipped."""
-        frontend = SGLangFrontend()
-
-        result = frontend.get_frontend_args_list({"verbose": False})
-        assert result == []
-
-    def test_none_value_skipped(self):
-        """None values are skipped."""
-        frontend = SGLangFrontend()
-
-        result = frontend.get_frontend_args_list({"some-arg": None})
-        assert result == []
-
-    def test_string_value(self):
-        """String values become --key value pairs."""
-        frontend = SGLangFrontend()
-
-        result = frontend.get_frontend_args_list({"policy": "cache_aware"})
-        assert result == ["--policy", "cache_aware"]
-
-    def test_numeric_value(self):
-        """Numeric values are converted to strings."""
-        frontend = SGLangFrontend()
-
-        result = frontend.get_frontend_args_list({"timeout": 120})
-        assert result == ["--timeout", "120"]
-
-    def test_float_value(self):
-        """Float values are converted to strings."""
-        frontend = SGLangFrontend()
-
-        result = frontend.get_frontend_args_list({"temperature": 0.5})
-        assert result == ["--temperature", "0.5"]
-
-    def test_mixed_args(self):
+    @pytest.mark.parametrize(
+        ("args", "expected"),
+        [
+            (None, []),
+            ({}, []),
+            # Boolean True generates flag without value; False is skipped
+            ({"verbose": True}, ["--verbose"]),
+            ({"verbose": False}, []),
+            ({"some-arg": None}, []),
+            ({"policy": "cache_aware"}, ["--policy", "cache_aware"]),
+            # Numeric values are converted to strings
+            ({"timeout": 120}, ["--timeout", "120"]),
+            ({"temperature": 0.5}, ["--temperature", "0.5"]),
+        ],
+        ids=["none", "empty", "bool_true", "bool_false", "none_value", "string", "int", "float"],
+    )
+    def test_single_arg(self, args, expected, sglang_frontend):
+        """Each value type maps to the expected CLI tokens."""
+        assert sglang_frontend.get_frontend_args_list(args) == expected
+
+    def test_mixed_args(self, sglang_frontend):
         """Mixed arg types are handled correctly."""
-        frontend = SGLangFrontend()
-
-        result = frontend.get_frontend_args_list({
+        result = sglang_frontend.get_frontend_args_list({
             "policy": "round_robin",
             "verbose": True,
             "timeout": 60,
@@ -138,28 +129,20 @@ class TestGetFrontendArgsList:
             "optional": None,
         })
 
+        args = set(result)
         # Check all expected args are present
-        assert "--policy" in result
-        assert "round_robin" in result
-        assert "--verbose" in result
-        assert "--timeout" in result
-        assert "60" in result
+        assert {"--policy", "round_robin", "--verbose", "--timeout", "60"} <= args
         # Disabled and None should not appear
-        assert "--disabled" not in result
-        assert "--optional" not in result
+        assert not {"--disabled", "--optional"} & args
 
-    def test_dynamo_frontend_args_list(self):
+    def test_dynamo_frontend_args_list(self, dynamo_frontend):
         """DynamoFrontend has same args list behavior."""
-        frontend = DynamoFrontend()
-
-        result = frontend.get_frontend_args_list({
+        result = dynamo_frontend.get_frontend_args_list({
             "router-mode": "kv",
             "router-reset-states": True,
         })
 
-        assert "--router-mode" in result
-        assert "kv" in result
-        assert "--router-reset-states" in result
+        assert {"--router-mode", "kv", "--router-reset-states"} <= set(result)
 
 
 # ============================================================================
@@ -167,7 +150,7 @@ class TestGetFrontendArgsList:
 # ============================================================================
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MockProcess:
     """Mock Process for testing."""
 
@@ -178,7 +161,7 @@ class MockProcess:
     is_leader: bool = True
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MockTopology:
     """Mock FrontendTopology for testing."""
 
@@ -186,7 +169,7 @@ class MockTopology:
     frontend_port: int = 8080
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MockFrontendConfig:
     """Mock FrontendConfig for testing."""
 
@@ -195,7 +178,7 @@ class MockFrontendConfig:
     env: dict | None = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MockResourceConfig:
     """Mock ResourceConfig for testing."""
 
@@ -204,7 +187,7 @@ class MockResourceConfig:
     num_agg: int = 0
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MockConfig:
     """Mock SrtConfig for testing."""
 
@@ -212,284 +195,199 @@ class MockConfig:
     resources: MockResourceConfig
 
 
-class TestSGLangGrpcScheme:
-    """Tests for gRPC/HTTP scheme selection in SGLang frontend."""
+def make_runtime() -> MagicMock:
+    """Create a mock RuntimeContext whose log paths render as /logs/<name>."""
+    runtime = MagicMock()
+    runtime.log_dir = MagicMock()
+    runtime.log_dir.__truediv__ = lambda self, x: f"/logs/{x}"
+    runtime.container_image = "/container.sqsh"
+    runtime.container_mounts = {}
+    return runtime
 
-    @patch("srtctl.frontends.sglang.start_srun_process")
-    @patch("srtctl.frontends.sglang.get_hostname_ip")
-    def test_http_scheme_by_default(self, mock_get_ip, mock_srun):
-        """Default scheme is http:// when gRPC not enabled."""
-        mock_get_ip.return_value = "10.0.0.1"
-        mock_srun.return_value = MagicMock()
-
-        frontend = SGLangFrontend()
-        topology = MockTopology(frontend_nodes=["node0"])
-        config = MockConfig(
-            frontend=MockFrontendConfig(),
-            resources=MockResourceConfig(num_agg=2),
-        )
-
-        # Mock backend without gRPC
-        backend = MagicMock()
-        backend.is_grpc_mode.return_value = False
-
-        # Mock runtime
-        runtime = MagicMock()
-        runtime.log_dir = MagicMock()
-        runtime.log_dir.__truediv__ = lambda self, x: f"/logs/{x}"
-        runtime.container_image = "/container.sqsh"
-        runtime.container_mounts = {}
-
-        # Mock agg workers
-        processes = [
-            MockProcess(node="node1", endpoint_mode="agg", http_port=30000),
-            MockProcess(node="node2", endpoint_mode="agg", http_port=30000),
-        ]
-
-        frontend.start_frontends(topology, runtime, config, backend, processes)
-
-        # Check the command passed to start_srun_process
-        call_args = mock_srun.call_args
-        cmd = call_args.kwargs["command"]
-
-        # Should use http:// scheme
-        assert any("http://10.0.0.1:30000" in arg for arg in cmd)
-        assert not any("grpc://" in arg for arg in cmd)
-
-    @patch("srtctl.frontends.sglang.start_srun_process")
-    @patch("srtctl.frontends.sglang.get_hostname_ip")
-    def test_grpc_scheme_when_enabled(self, mock_get_ip, mock_srun):
-        """gRPC scheme used when backend has grpc-mode enabled."""
-        mock_get_ip.return_value = "10.0.0.1"
-        mock_srun.return_value = MagicMock()
-
-        frontend = SGLangFrontend()
-        topology = MockTopology(frontend_nodes=["node0"])
-        config = MockConfig(
-            frontend=MockFrontendConfig(),
-            resources=MockResourceConfig(num_agg=1),
-        )
-
-        # Mock SGLangProtocol backend with gRPC enabled
-        from srtctl.backends.sglang import SGLangProtocol
-
-        backend = MagicMock(spec=SGLangProtocol)
-        backend.is_grpc_mode.side_effect = lambda mode: mode == "agg"
-
-        # Mock runtime
-        runtime = MagicMock()
-        runtime.log_dir = MagicMock()
-        runtime.log_dir.__truediv__ = lambda self, x: f"/logs/{x}"
-        runtime.container_image = "/container.sqsh"
-        runtime.container_mounts = {}
-
-        processes = [
-            MockProcess(node="node1", endpoint_mode="agg", http_port=30000),
-        ]
-
-        frontend.start_frontends(topology, runtime, config, backend, processes)
-
-        call_args = mock_srun.call_args
-        cmd = call_args.kwargs["command"]
-
-        # Should use grpc:// scheme for agg
-        assert any("grpc://10.0.0.1:30000" in arg for arg in cmd)
-
-    @patch("srtctl.frontends.sglang.start_srun_process")
-    @patch("srtctl.frontends.sglang.get_hostname_ip")
-    def test_disaggregated_mode_command(self, mock_get_ip, mock_srun):
-        """Disaggregated mode uses --pd-disaggregation with --prefill and --decode."""
-        mock_get_ip.side_effect = lambda node: f"10.0.0.{node[-1]}"
-        mock_srun.return_value = MagicMock()
-
-        frontend = SGLangFrontend()
-        topology = MockTopology(frontend_nodes=["node0"])
-        config = MockConfig(
-            frontend=MockFrontendConfig(),
-            resources=MockResourceConfig(num_prefill=1, num_decode=2),
-        )
-
-        backend = MagicMock()
-        backend.is_grpc_mode.return_value = False
-
-        runtime = MagicMock()
-        runtime.log_dir = MagicMock()
-        runtime.log_dir.__truediv__ = lambda self, x: f"/logs/{x}"
-        runtime.container_image = "/container.sqsh"
-        runtime.container_mounts = {}
-
-        processes = [
-            MockProcess(node="node1", endpoint_mode="prefill", http_port=30000, bootstrap_port=30001),
-            MockProcess(node="node2", endpoint_mode="decode", http_port=30000),
-            MockProcess(node="node3", endpoint_mode="decode", http_port=30000),
-        ]
-
-        frontend.start_frontends(topology, runtime, config, backend, processes)
-
-        call_args = mock_srun.call_args
-        cmd = call_args.kwargs["command"]
-
-        # Check disaggregated mode flags
-        assert "--pd-disaggregation" in cmd
-        assert "--prefill" in cmd
-        assert "--decode" in cmd
-        # Bootstrap port should be included
-        assert "30001" in cmd
-
-    @patch("srtctl.frontends.sglang.start_srun_process")
-    @patch("srtctl.frontends.sglang.get_hostname_ip")
-    def test_aggregated_mode_command(self, mock_get_ip, mock_srun):
-        """Aggregated mode uses --worker-urls."""
-        mock_get_ip.side_effect = lambda node: f"10.0.0.{node[-1]}"
-        mock_srun.return_value = MagicMock()
-
-        frontend = SGLangFrontend()
-        topology = MockTopology(frontend_nodes=["node0"])
-        config = MockConfig(
-            frontend=MockFrontendConfig(),
-            resources=MockResourceConfig(num_agg=2),
-        )
-
-        backend = MagicMock()
-        backend.is_grpc_mode.return_value = False
-
-        runtime = MagicMock()
-        runtime.log_dir = MagicMock()
-        runtime.log_dir.__truediv__ = lambda self, x: f"/logs/{x}"
-        runtime.container_image = "/container.sqsh"
-        runtime.container_mounts = {}
-
-        processes = [
-            MockProcess(node="node1", endpoint_mode="agg", http_port=30000),
-            MockProcess(node="node2", endpoint_mode="agg", http_port=30000),
-        ]
-
-        frontend.start_frontends(topology, runtime, config, backend, processes)
-
-        call_args = mock_srun.call_args
-        cmd = call_args.kwargs["command"]
-
-        # Check aggregated mode flags
-        assert "--worker-urls" in cmd
-        assert "--pd-disaggregation" not in cmd
 
+def _cmd_and_env(mock_srun: MagicMock) -> tuple[list[str], dict[str, str] | None]:
+    """Command and env_to_set from the last start_srun_process call."""
+    kwargs = mock_srun.call_args.kwargs
+    return kwargs["command"], kwargs.get("env_to_set")
 
-# ============================================================================
-# Frontend Env Handling Tests
-# ============================================================================
 
+# Immutable fixtures shared by the start_frontends tests
+_SINGLE_NODE_TOPOLOGY = MockTopology(frontend_nodes=["node0"])
+_CFG_AGG1 = MockConfig(frontend=MockFrontendConfig(), resources=MockResourceConfig(num_agg=1))
+_CFG_AGG2 = MockConfig(frontend=MockFrontendConfig(), resources=MockResourceConfig(num_agg=2))
+_CFG_DISAGG_1P2D = MockConfig(frontend=MockFrontendConfig(), resources=MockResourceConfig(num_prefill=1, num_decode=2))
+# No grpc-mode in any section, so every worker URL is http://
+_HTTP_BACKEND = SGLangProtocol()
 
-class TestFrontendEnvHandling:
-    """Tests for frontend environment variable handling."""
 
-    @patch("srtctl.frontends.sglang.start_srun_process")
-    @patch("srtctl.frontends.sglang.get_hostname_ip")
-    def test_sglang_env_passed_to_process(self, mock_get_ip, mock_srun):
-        """SGLang frontend passes env dict to start_srun_process."""
-        mock_get_ip.return_value = "10.0.0.1"
-        mock_srun.return_value = MagicMock()
-
-        frontend = SGLangFrontend()
-        topology = MockTopology(frontend_nodes=["node0"])
-        config = MockConfig(
-            frontend=MockFrontendConfig(
-                env={"MY_VAR": "my_value", "ANOTHER": "123"}
+@dataclass(frozen=True, slots=True)
+class RouterCase:
+    """A start_frontends scenario and the router args it must (not) produce."""
+
+    config: MockConfig
+    processes: tuple[MockProcess, ...]
+    expected: tuple[str, ...]
+    forbidden: tuple[str, ...] = ()
+    grpc_modes: tuple[str, ...] = ()
+
+
+# SGLangServerConfig section for each worker mode
+_MODE_SECTIONS = {"prefill": "prefill", "decode": "decode", "agg": "aggregated"}
+
+_ROUTER_CASES = [
+    # Default scheme is http:// when gRPC not enabled
+    pytest.param(
+        RouterCase(
+            config=_CFG_AGG2,
+            processes=(
+                MockProcess(node="node1", endpoint_mode="agg", http_port=30000),
+                MockProcess(node="node2", endpoint_mode="agg", http_port=30000),
             ),
-            resources=MockResourceConfig(num_agg=1),
-        )
-
-        backend = MagicMock()
-        backend.is_grpc_mode.return_value = False
-
-        runtime = MagicMock()
-        runtime.log_dir = MagicMock()
-        runtime.log_dir.__truediv__ = lambda self, x: f"/logs/{x}"
-        runtime.container_image = "/container.sqsh"
-        runtime.container_mounts = {}
-
-        processes = [
-            MockProcess(node="node1", endpoint_mode="agg", http_port=30000),
-        ]
-
-        frontend.start_frontends(topology, runtime, config, backend, processes)
-
-        call_args = mock_srun.call_args
-        env_to_set = call_args.kwargs.get("env_to_set")
-
-        assert env_to_set is not None
-        assert env_to_set["MY_VAR"] == "my_value"
-        assert env_to_set["ANOTHER"] == "123"
-
-    @patch("srtctl.frontends.sglang.start_srun_process")
-    @patch("srtctl.frontends.sglang.get_hostname_ip")
-    def test_sglang_no_env_when_empty(self, mock_get_ip, mock_srun):
-        """SGLang frontend passes None for env when not configured."""
-        mock_get_ip.return_value = "10.0.0.1"
-        mock_srun.return_value = MagicMock()
-
-        frontend = SGLangFrontend()
-        topology = MockTopology(frontend_nodes=["node0"])
-        config = MockConfig(
-            frontend=MockFrontendConfig(env=None),
-            resources=MockResourceConfig(num_agg=1),
-        )
-
-        backend = MagicMock()
-        backend.is_grpc_mode.return_value = False
-
-        runtime = MagicMock()
-        runtime.log_dir = MagicMock()
-        runtime.log_dir.__truediv__ = lambda self, x: f"/logs/{x}"
-        runtime.container_image = "/container.sqsh"
-        runtime.container_mounts = {}
-
-        processes = [
-            MockProcess(node="node1", endpoint_mode="agg", http_port=30000),
-        ]
-
-        frontend.start_frontends(topology, runtime, config, backend, processes)
-
-        call_args = mock_srun.call_args
-        env_to_set = call_args.kwargs.get("env_to_set")
-
-        # Should be None when no env configured
-        assert env_to_set is None
-
-    @patch("srtctl.frontends.sglang.start_srun_process")
-    @patch("srtctl.frontends.sglang.get_hostname_ip")
-    def test_sglang_frontend_args_in_command(self, mock_get_ip, mock_srun):
-        """SGLang frontend includes args in command."""
-        mock_get_ip.return_value = "10.0.0.1"
-        mock_srun.return_value = MagicMock()
-
-        frontend = SGLangFrontend()
-        topology = MockTopology(frontend_nodes=["node0"])
-        config = MockConfig(
-            frontend=MockFrontendConfig(
-                args={"policy": "cache_aware", "verbose": True}
+            expected=("http://10.0.0.1:30000",),
+            forbidden=("grpc://",),
+        ),
+        id="http_default",
+    ),
+    # gRPC scheme used when backend has grpc-mode enabled
+    pytest.param(
+        RouterCase(
+            config=_CFG_AGG1,
+            processes=(MockProcess(node="node1", endpoint_mode="agg", http_port=30000),),
+            expected=("grpc://10.0.0.1:30000",),
+            grpc_modes=("agg",),
+        ),
+        id="grpc_agg",
+    ),
+    # Disaggregated mode uses --pd-disaggregation with --prefill and --decode,
+    # and includes the prefill bootstrap port
+    pytest.param(
+        RouterCase(
+            config=_CFG_DISAGG_1P2D,
+            processes=(
+                MockProcess(node="node1", endpoint_mode="prefill", http_port=30000, bootstrap_port=30001),
+                MockProcess(node="node2", endpoint_mode="decode", http_port=30000),
+                MockProcess(node="node3", endpoint_mode="decode", http_port=30000),
             ),
-            resources=MockResourceConfig(num_agg=1),
-        )
+            expected=("--pd-disaggregation", "--prefill", "--decode", "30001"),
+        ),
+        id="disagg",
+    ),
+    # Aggregated mode uses --worker-urls
+    pytest.param(
+        RouterCase(
+            config=_CFG_AGG2,
+            processes=(
+                MockProcess(node="node1", endpoint_mode="agg", http_port=30000),
+                MockProcess(node="node2", endpoint_mode="agg", http_port=30000),
+            ),
+            expected=("--worker-urls",),
+            forbidden=("--pd-disaggregation",),
+        ),
+        id="agg",
+    ),
+]
 
-        backend = MagicMock()
-        backend.is_grpc_mode.return_value = False
 
-        runtime = MagicMock()
-        runtime.log_dir = MagicMock()
-        runtime.log_dir.__truediv__ = lambda self, x: f"/logs/{x}"
-        runtime.container_image = "/container.sqsh"
-        runtime.container_mounts = {}
+class TestSGLangGrpcScheme:
+    """Tests for gRPC/HTTP scheme selection in SGLang frontend."""
 
-        processes = [
-            MockProcess(node="node1", endpoint_mode="agg", http_port=30000),
-        ]
+    @pytest.mark.parametrize("case", _ROUTER_CASES)
+    def test_router_command(self, case, sglang_frontend, mock_srun):
+        """Router command uses the right mode flags and worker URL schemes."""
+        # A real SGLangProtocol with grpc-mode set for the case's modes; only
+        # SGLang backends are asked about gRPC.
+        sglang_config = SGLangServerConfig(**{_MODE_SECTIONS[mode]: {"grpc-mode": True} for mode in case.grpc_modes})
+        backend = SGLangProtocol(sglang_config=sglang_config)
 
-        frontend.start_frontends(topology, runtime, config, backend, processes)
+        runtime = make_runtime()
 
-        call_args = mock_srun.call_args
-        cmd = call_args.kwargs["command"]
+        sglang_frontend.start_frontends(_SINGLE_NODE_TOPOLOGY, runtime, case.config, backend, list(case.processes))
 
-        assert "--policy" in cmd
-        assert "cache_aware" in cmd
-        assert "--verbose" in cmd
+        cmd, _ = _cmd_and_env(mock_srun)
 
+        missing = set(case.expected).difference(cmd)
+        assert not missing, missing
+        joined = "\0".join(cmd)
+        present = [arg for arg in case.forbidden if arg in joined]
+        assert not present, present
+
+
+# ============================================================================
+# Frontend Env Handling Tests
+# ============================================================================
+
+
+class TestFrontendEnvHandling:
+    """Tests for frontend environment variable handling."""
+
+    @pytest.mark.parametrize(
+        ("frontend", "expected_env", "expected_args"),
+        [
+            pytest.param(
+                MockFrontendConfig(env={"MY_VAR": "my_value", "ANOTHER": "123"}),
+                {"MY_VAR": "my_value", "ANOTHER": "123"},
+                (),
+                id="env_passed",
+            ),
+            # No env configured means None, not an empty dict
+            pytest.param(MockFrontendConfig(env=None), None, (), id="env_none"),
+            pytest.param(
+                MockFrontendConfig(args={"policy": "cache_aware", "verbose": True}),
+                None,
+                ("--policy", "cache_aware", "--verbose"),
+                id="args_in_cmd",
+            ),
+        ],
+    )
+    def test_sglang_frontend_config_reaches_srun(
+        self, frontend, expected_env, expected_args, sglang_frontend, mock_srun
+    ):
+        """SGLang frontend env becomes env_to_set and its args land in the router command."""
+        config = MockConfig(frontend=frontend, resources=MockResourceConfig(num_agg=1))
+        processes = [MockProcess(node="node1", endpoint_mode="agg", http_port=30000)]
+
+        sglang_frontend.start_frontends(_SINGLE_NODE_TOPOLOGY, make_runtime(), config, _HTTP_BACKEND, processes)
+
+        cmd, env_to_set = _cmd_and_env(mock_srun)
+        assert env_to_set == expected_env
+        # Values must directly follow their flags, so match the args as one contiguous run
+        assert "\0".join(("", *expected_args, "")) in "\0".join(("", *cmd, ""))
+
+    def test_sglang_routers_started_on_every_frontend_node(self, sglang_frontend, mock_srun):
+        """Each frontend node gets its own router, returned in node order."""
+        topology = MockTopology(frontend_nodes=["node0", "node1", "node2"])
+
+        runtime = make_runtime()
+
+        processes = [MockProcess(node="node1", endpoint_mode="agg", http_port=30000)]
+
+        started = sglang_frontend.start_frontends(topology, runtime, _CFG_AGG1, _HTTP_BACKEND, processes)
+
+        assert [p.name for p in started] == ["sglang_router_0", "sglang_router_1", "sglang_router_2"]
+        assert [p.node for p in started] == ["node0", "node1", "node2"]
+        assert sorted(c.kwargs["nodelist"][0] for c in mock_srun.call_args_list) == ["node0", "node1", "node2"]
+
+    @patch("srtctl.frontends.dynamo.start_srun_process")
+    def test_dynamo_launch_spec_built_once(self, mock_dynamo_srun, dynamo_frontend):
+        """Dynamo frontends share one command, env and preamble across nodes."""
+        topology = MockTopology(frontend_nodes=["node0", "node1"])
+        config = MagicMock()
+        config.frontend = MockFrontendConfig(type="dynamo", env={"MY_VAR": "1"})
+
+        runtime = make_runtime()
+        runtime.nodes.infra = "infra0"
+
+        with patch.object(DynamoFrontend, "_build_preamble", return_value="setup") as mock_preamble:
+            started = dynamo_frontend.start_frontends(topology, runtime, config, MagicMock(), [])
+
+        assert [p.node for p in started] == ["node0", "node1"]
+        mock_preamble.assert_called_once_with(config)
+        first, second = (c.kwargs for c in mock_dynamo_srun.call_args_list)
+        assert first["command"] == second["command"]
+        assert first["env_to_set"] == {
+            "ETCD_ENDPOINTS": "http://infra0:2379",
+            "NATS_SERVER": "nats://infra0:4222",
+            "DYN_REQUEST_PLANE": "nats",
+            "MY_VAR": "1",
+        }
+        assert first["bash_preamble"] == second["bash_preamble"] == "setup"
@@ -3,403 +3,264 @@
 
 """Tests for health check parsing (Dynamo and SGLang router)."""
 
+import socket
+import threading
+from unittest.mock import MagicMock, patch
+
 import pytest
 
+from srtctl.core import health
 from srtctl.core.health import (
     WorkerHealthResult,
     check_dynamo_health,
     check_sglang_router_health,
+    wait_for_etcd,
+    wait_for_model,
+    wait_for_port,
+    wait_for_ports,
 )
 
-
 # ============================================================================
 # Dynamo Health Check Tests
 # ============================================================================
 
 
-class TestDynamoHealthDisaggregated:
-    """Test Dynamo /health parsing for disaggregated mode (prefill + decode workers)."""
+def _generate_instances(*components: str) -> dict:
+    """Dynamo /health response with one 'generate' instance per component."""
+    return {"instances": [{"endpoint": "generate", "component": c} for c in components]}
 
-    def test_all_workers_ready(self):
-        """All expected prefill and decode workers are registered."""
-        response = {
-            "instances": [
-                {"endpoint": "generate", "component": "prefill"},
-                {"endpoint": "generate", "component": "prefill"},
-                {"endpoint": "generate", "component": "decode"},
-                {"endpoint": "generate", "component": "decode"},
-                {"endpoint": "generate", "component": "decode"},
-            ]
-        }
 
-        result = check_dynamo_health(response, expected_prefill=2, expected_decode=3)
+# Realistic /workers response captured from an actual SGLang router
+_REALISTIC_ROUTER_RESPONSE = {
+    "workers": [
+        {"id": "http://10.66.5.20:30000", "worker_type": "decode", "is_healthy": True},
+        {"id": "http://10.66.5.15:30000", "worker_type": "decode", "is_healthy": True},
+        {"id": "http://10.66.5.14:30000", "worker_type": "prefill", "is_healthy": True},
+    ],
+    "total": 3,
+    "stats": {"prefill_count": 1, "decode_count": 2, "regular_count": 0},
+}
 
-        assert result.ready is True
-        assert result.prefill_ready == 2
-        assert result.decode_ready == 3
-        assert "Model is ready" in result.message
-
-    def test_missing_prefill_workers(self):
-        """Not enough prefill workers registered."""
-        response = {
-            "instances": [
-                {"endpoint": "generate", "component": "prefill"},
-                {"endpoint": "generate", "component": "decode"},
-                {"endpoint": "generate", "component": "decode"},
-            ]
-        }
-
-        result = check_dynamo_health(response, expected_prefill=2, expected_decode=2)
-
-        assert result.ready is False
-        assert result.prefill_ready == 1
-        assert result.prefill_expected == 2
-        assert "waiting for 1 prefills" in result.message
-
-    def test_missing_decode_workers(self):
-        """Not enough decode workers registered."""
-        response = {
-            "instances": [
-                {"endpoint": "generate", "component": "prefill"},
-                {"endpoint": "generate", "component": "prefill"},
-                {"endpoint": "generate", "component": "decode"},
-            ]
-        }
-
-        result = check_dynamo_health(response, expected_prefill=2, expected_decode=4)
-
-        assert result.ready is False
-        assert result.decode_ready == 1
-        assert result.decode_expected == 4
-        assert "waiting for" in result.message
-        assert "3 decodes" in result.message
-
-    def test_empty_instances(self):
-        """No workers registered yet."""
-        response = {"instances": []}
-
-        result = check_dynamo_health(response, expected_prefill=1, expected_decode=1)
-
-        assert result.ready is False
-        assert result.prefill_ready == 0
-        assert result.decode_ready == 0
 
-    def test_ignores_non_generate_endpoints(self):
-        """Only 'generate' endpoint instances count."""
-        response = {
-            "instances": [
-                {"endpoint": "generate", "component": "prefill"},
-                {"endpoint": "other", "component": "prefill"},  # Should be ignored
-                {"endpoint": "generate", "component": "decode"},
-            ]
-        }
+def _router_stats(prefill: int = 0, decode: int = 0, regular: int = 0) -> dict:
+    """SGLang router /workers response carrying only the per-type worker counts."""
+    return {
+        "workers": [],
+        "total": prefill + decode + regular,
+        "stats": {"prefill_count": prefill, "decode_count": decode, "regular_count": regular},
+    }
+
 
-        result = check_dynamo_health(response, expected_prefill=1, expected_decode=1)
+def _assert_health(result: WorkerHealthResult, expected: dict, messages: tuple[str, ...]) -> None:
+    """Check the given result fields and that the message contains each substring."""
+    actual = {name: getattr(result, name) for name in expected}
+    assert actual == expected
+    missing = [m for m in messages if m not in result.message]
+    assert not missing, (missing, result.message)
 
-        assert result.ready is True
-        assert result.prefill_ready == 1
-        assert result.decode_ready == 1
 
+class TestDynamoHealth:
+    """Test Dynamo /health parsing.
 
-class TestDynamoHealthAggregated:
-    """Test Dynamo /health parsing for aggregated mode (backend workers).
-    
     In aggregated mode, workers report as "backend" and count as decode.
     Caller should pass expected_prefill=0, expected_decode=num_agg.
     """
 
-    def test_all_backend_workers_ready(self):
-        """All expected backend workers are registered (aggregated mode)."""
-        response = {
-            "instances": [
-                {"endpoint": "generate", "component": "backend"},
-                {"endpoint": "generate", "component": "backend"},
-            ]
-        }
-
-        # Aggregated: expect 0 prefill, N decode (backend counts as decode)
-        result = check_dynamo_health(response, expected_prefill=0, expected_decode=2)
-
-        assert result.ready is True
-        assert result.decode_ready == 2
-        assert result.prefill_ready == 0
-
-    def test_backend_workers_count_as_decode(self):
-        """Backend workers always count as decode."""
-        response = {
-            "instances": [
-                {"endpoint": "generate", "component": "backend"},
-                {"endpoint": "generate", "component": "backend"},
-                {"endpoint": "generate", "component": "backend"},
-                {"endpoint": "generate", "component": "backend"},
-            ]
-        }
-
-        # All 4 backend workers count as decode
-        result = check_dynamo_health(response, expected_prefill=0, expected_decode=4)
-
-        assert result.ready is True
-        assert result.decode_ready == 4
-        assert result.prefill_ready == 0
-
-    def test_not_enough_backend_workers(self):
-        """Fewer backend workers than expected."""
-        response = {
-            "instances": [
-                {"endpoint": "generate", "component": "backend"},
-            ]
-        }
-
-        result = check_dynamo_health(response, expected_prefill=0, expected_decode=2)
-
-        assert result.ready is False
-        assert result.decode_ready == 1
-        assert result.decode_expected == 2
-
-
-class TestDynamoHealthErrors:
-    """Test Dynamo /health error handling."""
-
-    def test_missing_instances_key(self):
-        """Response missing 'instances' key."""
-        response = {"status": "ok"}
-
-        result = check_dynamo_health(response, expected_prefill=1, expected_decode=1)
-
-        assert result.ready is False
-        assert "instances" in result.message
-
-    def test_empty_response(self):
-        """Empty response dict."""
-        response = {}
-
-        result = check_dynamo_health(response, expected_prefill=1, expected_decode=1)
-
-        assert result.ready is False
-
-
-# ============================================================================
-# SGLang Router Health Check Tests
-# ============================================================================
-
-
-class TestSGLangRouterHealthDisaggregated:
-    """Test SGLang router /workers parsing for disaggregated mode.
-
-    Uses realistic response format from actual SGLang router.
+    @pytest.mark.parametrize(
+        ("response", "expected_prefill", "expected_decode", "expected", "messages"),
+        [
+            # Disaggregated: all expected prefill and decode workers are registered
+            pytest.param(
+                _generate_instances("prefill", "prefill", "decode", "decode", "decode"),
+                2,
+                3,
+                {"ready": True, "prefill_ready": 2, "decode_ready": 3},
+                ("Model is ready",),
+                id="all_ready",
+            ),
+            pytest.param(
+                _generate_instances("prefill", "decode", "decode"),
+                2,
+                2,
+                {"ready": False, "prefill_ready": 1, "prefill_expected": 2},
+                ("waiting for 1 prefills",),
+                id="missing_prefill",
+            ),
+            pytest.param(
+                _generate_instances("prefill", "prefill", "decode"),
+                2,
+                4,
+                {"ready": False, "decode_ready": 1, "decode_expected": 4},
+                ("waiting for", "3 decodes"),
+                id="missing_decode",
+            ),
+            # No workers registered yet
+            pytest.param(
+                {"instances": []},
+                1,
+                1,
+                {"ready": False, "prefill_ready": 0, "decode_ready": 0},
+                (),
+                id="empty_instances",
+            ),
+            # Only 'generate' endpoint instances count
+            pytest.param(
+                {
+                    "instances": [
+                        {"endpoint": "generate", "component": "prefill"},
+                        {"endpoint": "other", "component": "prefill"},
+                        {"endpoint": "generate", "component": "decode"},
+                    ]
+                },
+                1,
+                1,
+                {"ready": True, "prefill_ready": 1, "decode_ready": 1},
+                (),
+                id="ignores_non_generate",
+            ),
+            # Aggregated: backend workers always count as decode
+            pytest.param(
+                _generate_instances("backend", "backend"),
+                0,
+                2,
+                {"ready": True, "prefill_ready": 0, "decode_ready": 2},
+                (),
+                id="agg_all_ready",
+            ),
+            pytest.param(
+                _generate_instances("backend", "backend", "backend", "backend"),
+                0,
+                4,
+                {"ready": True, "prefill_ready": 0, "decode_ready": 4},
+                (),
+                id="agg_backend_counts_as_decode",
+            ),
+            pytest.param(
+                _generate_instances("backend"),
+                0,
+                2,
+                {"ready": False, "decode_ready": 1, "decode_expected": 2},
+                (),
+                id="agg_not_enough_backend",
+            ),
+            # Errors
+            pytest.param({"status": "ok"}, 1, 1, {"ready": False}, ("instances",), id="missing_instances_key"),
+            pytest.param({}, 1, 1, {"ready": False}, (), id="empty_response"),
+        ],
+    )
+    def test_check_dynamo_health(self, response, expected_prefill, expected_decode, expected, messages):
+        """Worker counts, readiness and message for each response shape."""
+        result = check_dynamo_health(response, expected_prefill=expected_prefill, expected_decode=expected_decode)
+
+        _assert_health(result, expected, messages)
+
+
+class TestSGLangRouterHealth:
+    """Test SGLang router /workers parsing.
+
+    In aggregated mode, workers may report as 'regular' instead of prefill/decode;
+    regular workers count towards decode.
     """
 
-    def test_all_workers_ready_realistic_format(self):
-        """All expected workers are registered (realistic response format)."""
-        # Realistic format from actual SGLang router
-        response = {
-            "workers": [
-                {"id": "http://10.66.5.20:30000", "worker_type": "decode", "is_healthy": True},
-                {"id": "http://10.66.5.15:30000", "worker_type": "decode", "is_healthy": True},
-                {"id": "http://10.66.5.14:30000", "worker_type": "prefill", "is_healthy": True},
-            ],
-            "total": 3,
-            "stats": {
-                "prefill_count": 1,
-                "decode_count": 2,
-                "regular_count": 0,
-            },
-        }
-
-        result = check_sglang_router_health(response, expected_prefill=1, expected_decode=2)
-
-        assert result.ready is True
-        assert result.prefill_ready == 1
-        assert result.decode_ready == 2
-        assert "Model is ready" in result.message
-
-    def test_all_workers_ready(self):
-        """All expected workers are registered."""
-        response = {
-            "workers": [],
-            "total": 12,
-            "stats": {
-                "prefill_count": 4,
-                "decode_count": 8,
-                "regular_count": 0,
-            },
-        }
-
-        result = check_sglang_router_health(response, expected_prefill=4, expected_decode=8)
-
-        assert result.ready is True
-        assert result.prefill_ready == 4
-        assert result.decode_ready == 8
-        assert "Model is ready" in result.message
-
-    def test_more_workers_than_expected(self):
-        """More workers than expected is still ready."""
-        response = {
-            "workers": [],
-            "total": 16,
-            "stats": {
-                "prefill_count": 6,
-                "decode_count": 10,
-                "regular_count": 0,
-            },
-        }
-
-        result = check_sglang_router_health(response, expected_prefill=4, expected_decode=8)
-
-        assert result.ready is True
-        assert result.prefill_ready == 6
-        assert result.decode_ready == 10
-
-    def test_missing_prefill_workers(self):
-        """Not enough prefill workers."""
-        response = {
-            "workers": [],
-            "total": 10,
-            "stats": {
-                "prefill_count": 2,
-                "decode_count": 8,
-                "regular_count": 0,
-            },
-        }
-
-        result = check_sglang_router_health(response, expected_prefill=4, expected_decode=8)
-
-        assert result.ready is False
-        assert result.prefill_ready == 2
-        assert result.prefill_expected == 4
-        assert "waiting for 2 prefills" in result.message
-
-    def test_missing_decode_workers(self):
-        """Not enough decode workers."""
-        response = {
-            "workers": [],
-            "total": 7,
-            "stats": {
-                "prefill_count": 4,
-                "decode_count": 3,
-                "regular_count": 0,
-            },
-        }
-
-        result = check_sglang_router_health(response, expected_prefill=4, expected_decode=8)
-
-        assert result.ready is False
-        assert result.decode_ready == 3
-        assert "waiting for" in result.message
-        assert "5 decodes" in result.message
-
-    def test_zero_workers(self):
-        """No workers registered yet."""
-        response = {
-            "workers": [],
-            "total": 0,
-            "stats": {
-                "prefill_count": 0,
-                "decode_count": 0,
-                "regular_count": 0,
-            },
-        }
-
-        result = check_sglang_router_health(response, expected_prefill=2, expected_decode=4)
-
-        assert result.ready is False
-        assert result.prefill_ready == 0
-        assert result.decode_ready == 0
-
-
-class TestSGLangRouterHealthAggregated:
-    """Test SGLang router /workers parsing for aggregated mode.
-
-    In aggregated mode, workers may report as 'regular' instead of prefill/decode.
-    """
-
-    def test_regular_workers_count_as_decode(self):
-        """Regular workers (aggregated mode) count towards decode."""
-        response = {
-            "workers": [],
-            "total": 4,
-            "stats": {
-                "prefill_count": 0,
-                "decode_count": 0,
-                "regular_count": 4,
-            },
-        }
-
-        # Aggregated: expect 0 prefill, 4 decode (regular counts as decode)
-        result = check_sglang_router_health(response, expected_prefill=0, expected_decode=4)
-
-        assert result.ready is True
-        assert result.decode_ready == 4
-        assert "regular workers" in result.message
-
-    def test_aggregated_workers_as_decode(self):
-        """In aggregated mode, all workers might report as decode."""
-        response = {
-            "workers": [],
-            "total": 4,
-            "stats": {
-                "prefill_count": 0,
-                "decode_count": 4,
-                "regular_count": 0,
-            },
-        }
-
-        # Aggregated: expect 0 prefill, N decode
-        result = check_sglang_router_health(response, expected_prefill=0, expected_decode=4)
-
-        assert result.ready is True
-        assert result.decode_ready == 4
-
-    def test_mixed_decode_and_regular(self):
-        """Mix of decode and regular workers."""
-        response = {
-            "workers": [],
-            "total": 4,
-            "stats": {
-                "prefill_count": 0,
-                "decode_count": 2,
-                "regular_count": 2,
-            },
-        }
-
-        # Both decode and regular should count
-        result = check_sglang_router_health(response, expected_prefill=0, expected_decode=4)
-
-        assert result.ready is True
-        assert result.decode_ready == 4  # 2 decode + 2 regular
-
-
-class TestSGLangRouterHealthErrors:
-    """Test SGLang router /workers error handling."""
-
-    def test_missing_stats_key(self):
-        """Response missing 'stats' key."""
-        response = {"workers": []}
-
-        result = check_sglang_router_health(response, expected_prefill=1, expected_decode=1)
-
-        assert result.ready is False
-        assert "stats" in result.message
-
-    def test_empty_response(self):
-        """Empty response dict."""
-        response = {}
-
-        result = check_sglang_router_health(response, expected_prefill=1, expected_decode=1)
-
-        assert result.ready is False
-
-    def test_missing_count_fields_defaults_to_zero(self):
-        """Missing count fields default to 0."""
-        response = {
-            "stats": {}
-        }
-
-        result = check_sglang_router_health(response, expected_prefill=1, expected_decode=1)
+    @pytest.mark.parametrize(
+        ("response", "expected_prefill", "expected_decode", "expected", "messages"),
+        [
+            pytest.param(
+                _REALISTIC_ROUTER_RESPONSE,
+                1,
+                2,
+                {"ready": True, "prefill_ready": 1, "decode_ready": 2},
+                ("Model is ready",),
+                id="all_ready_realistic",
+            ),
+            pytest.param(
+                _router_stats(prefill=4, decode=8),
+                4,
+                8,
+                {"ready": True, "prefill_ready": 4, "decode_ready": 8},
+                ("Model is ready",),
+                id="all_ready",
+            ),
+            # More workers than expected is still ready
+            pytest.param(
+                _router_stats(prefill=6, decode=10),
+                4,
+                8,
+                {"ready": True, "prefill_ready": 6, "decode_ready": 10},
+                (),
+                id="more_than_expected",
+            ),
+            pytest.param(
+                _router_stats(prefill=2, decode=8),
+                4,
+                8,
+                {"ready": False, "prefill_ready": 2, "prefill_expected": 4},
+                ("waiting for 2 prefills",),
+                id="missing_prefill",
+            ),
+            pytest.param(
+                _router_stats(prefill=4, decode=3),
+                4,
+                8,
+                {"ready": False, "decode_ready": 3},
+                ("waiting for", "5 decodes"),
+                id="missing_decode",
+            ),
+            pytest.param(
+                _router_stats(),
+                2,
+                4,
+                {"ready": False, "prefill_ready": 0, "decode_ready": 0},
+                (),
+                id="zero_workers",
+            ),
+            # Aggregated: regular workers count towards decode
+            pytest.param(
+                _router_stats(regular=4),
+                0,
+                4,
+                {"ready": True, "decode_ready": 4},
+                ("regular workers",),
+                id="agg_regular_as_decode",
+            ),
+            # Aggregated: all workers might report as decode
+            pytest.param(
+                _router_stats(decode=4),
+                0,
+                4,
+                {"ready": True, "decode_ready": 4},
+                (),
+                id="agg_decode",
+            ),
+            # Both decode and regular count: 2 decode + 2 regular
+            pytest.param(
+                _router_stats(decode=2, regular=2),
+                0,
+                4,
+                {"ready": True, "decode_ready": 4},
+                (),
+                id="agg_mixed_decode_regular",
+            ),
+            # Errors; missing count fields default to 0
+            pytest.param({"workers": []}, 1, 1, {"ready": False}, ("stats",), id="missing_stats_key"),
+            pytest.param({}, 1, 1, {"ready": False}, (), id="empty_response"),
+            pytest.param(
+                {"stats": {}},
+                1,
+                1,
+                {"ready": False, "prefill_ready": 0, "decode_ready": 0},
+                (),
+                id="missing_count_fields",
+            ),
+        ],
+    )
+    def test_check_sglang_router_health(self, response, expected_prefill, expected_decode, expected, messages):
+        """Worker counts, readiness and message for each response shape."""
+        result = check_sglang_router_health(
+            response, expected_prefill=expected_prefill, expected_decode=expected_decode
+        )
 
-        assert result.ready is False
-        assert result.prefill_ready == 0
-        assert result.decode_ready == 0
+        _assert_health(result, expected, messages)
 
 
 # ============================================================================
@@ -433,3 +294,114 @@ class TestWorkerHealthResult:
         assert result.prefill_ready == 2
         assert result.decode_ready == 4
 
+    def test_uses_slots(self):
+        """Results have no per-instance __dict__."""
+        result = WorkerHealthResult(ready=True, message="OK", decode_ready=1)
+
+        assert not hasattr(result, "__dict__")
+
+
+# ============================================================================
+# HTTP Polling Tests
+# ============================================================================
+
+
+class TestHealthPolling:
+    """Test HTTP polling helpers."""
+
+    def test_pool_shared_across_threads(self):
+        """All polling threads share one keep-alive connection pool."""
+        pools = []
+        thread = threading.Thread(target=lambda: pools.append(health._get_pool()))
+        thread.start()
+        thread.join()
+
+        assert pools[0] is health._get_pool()
+
+    def test_wait_for_etcd_polls_via_pool(self):
+        """wait_for_etcd issues its requests through the shared pool."""
+        pool = MagicMock()
+        pool.request.return_value.status = 200
+
+        with patch.object(health, "_get_pool", return_value=pool):
+            assert wait_for_etcd("http://node0:2379", max_retries=1, interval=0) is True
+
+        pool.request.assert_called_once_with("GET", "http://node0:2379/health")
+
+    def test_wait_for_model_parses_response_body(self):
+        """wait_for_model decodes the JSON body and returns once workers are up."""
+        pool = MagicMock()
+        pool.request.return_value.status = 200
+        pool.request.return_value.data = b'{"stats": {"prefill_count": 1, "decode_count": 1}}'
+
+        with patch.object(health, "_get_pool", return_value=pool):
+            assert wait_for_model("node0", 8000, n_prefill=1, n_decode=1, frontend_type="sglang") is True
+
+        pool.request.assert_called_once_with("GET", "http://node0:8000/workers")
+
+    def test_backoff_delay_grows_to_cap_with_jitter(self):
+        """Retry delays double from the base, stay under the cap, and are jittered."""
+        with patch.object(health.random, "random", return_value=0.999999):
+            delays = [health._backoff_delay(attempt, cap=1.0) for attempt in range(6)]
+
+        assert delays == sorted(delays)
+        assert delays[0] == pytest.approx(0.1, rel=1e-3)
+        assert delays[-1] == pytest.approx(1.0, rel=1e-3)
+
+        with patch.object(health.random, "random", return_value=0.0):
+            assert health._backoff_delay(10, cap=1.0) == pytest.approx(0.5)
+
+    def test_wait_for_port_backs_off(self):
+        """wait_for_port retries with increasing delays until the port opens."""
+        connection = MagicMock()
+        with (
+            patch.object(health.socket, "create_connection", side_effect=[OSError, OSError, OSError, connection]),
+            patch.object(health.time, "sleep") as mock_sleep,
+            patch.object(health.random, "random", return_value=0.999999),
+        ):
+            assert wait_for_port("node0", 4222, timeout=60.0, interval=1.0) is True
+
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        assert delays == pytest.approx([0.1, 0.2, 0.4], rel=1e-3)
+
+    def test_wait_for_etcd_keeps_full_time_budget(self):
+        """Backoff shortens early sleeps, so polling continues until max_retries * interval has elapsed."""
+        pool = MagicMock()
+        pool.request.return_value.status = 503
+        clock = [0.0]
+
+        def fake_sleep(seconds):
+            clock[0] += seconds
+
+        with (
+            patch.object(health, "_get_pool", return_value=pool),
+            patch.object(health.time, "monotonic", side_effect=lambda: clock[0]),
+            patch.object(health.time, "sleep", side_effect=fake_sleep),
+            patch.object(health.random, "random", return_value=0.0),
+        ):
+            assert wait_for_etcd("http://node0:2379", max_retries=3, interval=1.0) is False
+
+        assert clock[0] == pytest.approx(3.0)
+        assert pool.request.call_count > 3
+
+    def test_wait_for_ports_polls_concurrently(self):
+        """wait_for_ports reports only the endpoints that never accepted connections."""
+        with socket.socket() as listener, socket.socket() as unused:
+            listener.bind(("127.0.0.1", 0))
+            listener.listen()
+            unused.bind(("127.0.0.1", 0))
+            open_endpoint = listener.getsockname()
+            closed_endpoint = unused.getsockname()
+
+            pending = wait_for_ports([open_endpoint, closed_endpoint], timeout=0.5, interval=0.1)
+
+        assert pending == [closed_endpoint]
+
+    def test_wait_for_ports_all_ready(self):
+        """An empty result means every endpoint is up."""
+        with socket.socket() as first, socket.socket() as second:
+            for listener in (first, second):
+                listener.bind(("127.0.0.1", 0))
+                listener.listen()
+
+            assert wait_for_ports([first.getsockname(), second.getsockname()], timeout=5.0) == []
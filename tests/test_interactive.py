@@ -0,0 +1,144 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for interactive CLI helpers."""
+
+from unittest.mock import patch
+
+from srtctl.cli import interactive
+
+
+class TestDisplayConfigSummary:
+    """Tests for display_config_summary tree reuse."""
+
+    def setup_method(self):
+        interactive._tree_cache.clear()
+
+    def test_unchanged_config_reuses_tree(self):
+        """Displaying the same config twice renders the same Tree object."""
+        config = {"name": "test", "model": {"path": "/model"}, "resources": {"gpu_type": "h100"}}
+
+        with patch.object(interactive.console, "print") as mock_print:
+            interactive.display_config_summary(config)
+            interactive.display_config_summary(dict(config))
+
+        first, second = (c.args[0] for c in mock_print.call_args_list)
+        assert first is second
+
+    def test_changed_config_rebuilds_tree(self):
+        """A modified config produces a fresh Tree."""
+        config = {"name": "test", "resources": {"prefill_workers": 1}}
+        modified = {"name": "test", "resources": {"prefill_workers": 2}}
+
+        with patch.object(interactive.console, "print") as mock_print:
+            interactive.display_config_summary(config)
+            interactive.display_config_summary(modified)
+
+        first, second = (c.args[0] for c in mock_print.call_args_list)
+        assert first is not second
+
+    def test_cache_is_bounded(self):
+        """Only the most recent trees are retained."""
+        with patch.object(interactive.console, "print"):
+            for i in range(interactive._TREE_CACHE_SIZE + 3):
+                interactive.display_config_summary({"name": f"job_{i}"})
+
+        assert len(interactive._tree_cache) == interactive._TREE_CACHE_SIZE
+
+
+class TestModifyConfigInteractive:
+    """Tests for modify_config_interactive."""
+
+    def _run(self, config: dict, answers: list[str]) -> dict:
+        with (
+            patch.object(interactive.console, "print"),
+            patch.object(interactive.questionary, "text") as mock_text,
+        ):
+            mock_text.return_value.ask.side_effect = answers
+            return interactive.modify_config_interactive(config)
+
+    def test_input_config_not_mutated(self):
+        """Edits to nested sections do not leak into the original config."""
+        config = {"name": "test", "resources": {"prefill_workers": 1, "decode_workers": 2}, "benchmark": {}}
+
+        modified = self._run(config, ["", "4", "", "1024", ""])
+
+        assert config == {"name": "test", "resources": {"prefill_workers": 1, "decode_workers": 2}, "benchmark": {}}
+        assert modified["resources"] == {"prefill_workers": 4, "decode_workers": 2}
+        assert modified["benchmark"] == {"isl": 1024}
+
+    def test_untouched_sections_are_shared(self):
+        """Sections without edits are reused rather than copied."""
+        config = {"name": "test", "model": {"path": "/model"}, "resources": {"prefill_workers": 1}}
+
+        modified = self._run(config, ["renamed", "2", "", "", ""])
+
+        assert modified["name"] == "renamed"
+        assert modified["model"] is config["model"]
+        assert modified["resources"] is not config["resources"]
+
+    def test_missing_section_created(self):
+        """Setting a value under a missing section creates it."""
+        modified = self._run({"name": "test"}, ["", "", "", "", "128"])
+
+        assert modified["benchmark"] == {"osl": 128}
+
+
+class TestDisplaySweepTable:
+    """Tests for display_sweep_table."""
+
+    def test_consumes_iterator_and_returns_count(self):
+        """Rows are streamed from an iterator and counted."""
+        rows = (({"name": f"job_{i}"}, {"x": i}) for i in range(3))
+
+        assert interactive.display_sweep_table(rows) == 3
+
+
+class TestWriteConfigFile:
+    """Tests for write_config_file."""
+
+    def test_unmodified_config_uses_original_file(self, tmp_path):
+        """No temp file is written when the config was not edited."""
+        config_path = tmp_path / "config.yaml"
+
+        with patch.object(interactive.tempfile, "mkstemp") as mock_mkstemp:
+            assert interactive.write_config_file(config_path, {"name": "test"}, modified=False) == config_path
+
+        mock_mkstemp.assert_not_called()
+
+    def test_modified_config_written_to_temp_file(self):
+        """Edited configs are dumped to a fresh YAML file."""
+        path = interactive.write_config_file(interactive.Path("unused.yaml"), {"name": "edited"}, modified=True)
+        try:
+            assert interactive.yaml_utils.safe_load(path.read_text()) == {"name": "edited"}
+        finally:
+            path.unlink()
+
+
+class TestRunInteractive:
+    """Tests for the run_interactive action loop."""
+
+    def test_modified_single_dry_run_renders_edited_file(self, tmp_path):
+        """A dry-run after modifying the config points the script at a file holding the edits."""
+        config_path = tmp_path / "recipe.yaml"
+        config_path.write_text("name: original\n")
+        edited = {"name": "edited"}
+
+        with (
+            patch.object(interactive, "select_recipe", return_value=config_path),
+            patch.object(interactive, "display_config_summary"),
+            patch.object(interactive, "modify_config_interactive", return_value=edited),
+            patch.object(interactive.console, "print"),
+            patch.object(interactive.questionary, "select") as mock_select,
+            patch("srtctl.core.config.load_config_dict"),
+            patch("srtctl.cli.submit.submit_single") as mock_submit,
+        ):
+            mock_select.return_value.ask.side_effect = ["modify", "dry-run", "exit"]
+            assert interactive.run_interactive() == 0
+
+        dry_run_path = mock_submit.call_args.kwargs["config_path"]
+        try:
+            assert dry_run_path != config_path
+            assert interactive.yaml_utils.safe_load(dry_run_path.read_text()) == edited
+        finally:
+            dry_run_path.unlink()
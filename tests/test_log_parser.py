@@ -0,0 +1,221 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for node log parsing in the analysis package."""
+
+import io
+import re
+import sys
+import types
+
+import pytest
+
+pytest.importorskip("pandas")
+
+from analysis.srtlog import log_parser
+from analysis.srtlog.log_parser import NodeAnalyzer, _read_line_chunks
+from analysis.srtlog.models import BatchMetrics, MemoryMetrics
+
+_PREFILL_LOG = """\
+python3 -m sglang.launch_server --model-path /model --tp-size 4 --dp-size 2 --ep-size 2
+[2025-11-04 05:27:13 DP0 TP0 EP0] Load weight end. type=DeepseekV3ForCausalLM, dtype=torch.bfloat16, avail mem=75.11 GB, mem usage=107.07 GB.
+[2025-11-04 05:27:14 DP0 TP0 EP0] KV Cache is allocated. #tokens: 524288, KV size: 17.16 GB
+[2025-11-04 05:31:43 DP0 TP0 EP0] Prefill batch, #new-seq: 18, #new-token: 16384, #cached-token: 0, token usage: 0.00, #running-req: 0, #queue-req: 0, #prealloc-req: 0, #inflight-req: 0, input throughput (token/s): 0.00,
+[2025-11-04 05:31:44 DP0 TP0 EP0] Scheduler heartbeat
+[2025-11-04 05:31:45 TP1] Prefill batch, #new-seq: 2, #new-token: 4096, #cached-token: 1024, token usage: 0.25, #running-req: 1, #queue-req: 3, input throughput (token/s): 1234.5,
+restarted with --tp-size 8
+"""
+
+_DECODE_LOG = """\
+[2025-11-04 05:32:32 DP31 TP31 EP31] Decode batch, #running-req: 7, #token: 7040, token usage: 0.00, pre-allocated usage: 0.00, #prealloc-req: 0, #transfer-req: 0, #retracted-req: 0, cuda graph: True, gen throughput (token/s): 6.73, #queue-req: 0,
+[2025-12-08 14:34:44 PP2] Decode batch, #running-req: 1, #token: 128, token usage: 1, gen throughput (token/s): 100, #queue-req: 2,"""
+
+
+def _write_logs(tmp_path) -> list[str]:
+    """Write one prefill and one decode node log and return their paths."""
+    prefill = tmp_path / "cn01_prefill_w0.err"
+    decode = tmp_path / "cn02_decode_w1.out"
+    prefill.write_text(_PREFILL_LOG)
+    decode.write_text(_DECODE_LOG)
+    return [str(prefill), str(decode)]
+
+
+class TestParseLogs:
+    """Tests for parsing several node logs."""
+
+    def test_worker_pool_matches_sequential_parse(self, tmp_path, caplog):
+        """Logs parsed in spawned worker processes match parsing them in-process, in order."""
+        analyzer = NodeAnalyzer()
+        filepaths = _write_logs(tmp_path)
+
+        nodes = analyzer._parse_logs(filepaths)
+
+        assert nodes == [analyzer.parse_single_log(filepath) for filepath in filepaths]
+        assert [node.worker_type for node in nodes] == ["prefill", "decode"]
+        assert "parsing sequentially" not in caplog.text
+
+    def test_unpicklable_analyzer_falls_back_to_sequential(self, tmp_path, caplog):
+        """A pool that cannot ship the work to workers falls back to parsing in-process."""
+        analyzer = NodeAnalyzer()
+        analyzer.unpicklable = lambda: None
+        filepaths = _write_logs(tmp_path)
+
+        nodes = analyzer._parse_logs(filepaths)
+
+        assert nodes == [analyzer.parse_single_log(filepath) for filepath in filepaths]
+        assert "parsing sequentially" in caplog.text
+
+
+class TestParseSingleLog:
+    """Golden tests for parse_single_log on small prefill and decode logs."""
+
+    def test_prefill_log(self, tmp_path):
+        """Batches, memory snapshots and the first launch command's parallel sizes are extracted."""
+        prefill_path, _ = _write_logs(tmp_path)
+
+        node = NodeAnalyzer().parse_single_log(prefill_path)
+
+        assert node.node_info == {"node": "cn01", "worker_type": "prefill", "worker_id": "w0"}
+        # The first --tp-size line wins; later restarts don't overwrite it
+        assert node.config == {"tp_size": 4, "dp_size": 2, "ep_size": 2}
+        assert node.batches == [
+            BatchMetrics(
+                timestamp="2025-11-04 05:31:43",
+                dp=0,
+                tp=0,
+                ep=0,
+                batch_type="prefill",
+                new_seq=18,
+                new_token=16384,
+                cached_token=0,
+                token_usage=0.0,
+                running_req=0,
+                queue_req=0,
+                prealloc_req=0,
+                inflight_req=0,
+                input_throughput=0.0,
+            ),
+            BatchMetrics(
+                timestamp="2025-11-04 05:31:45",
+                dp=0,
+                tp=1,
+                ep=0,
+                batch_type="prefill",
+                new_seq=2,
+                new_token=4096,
+                cached_token=1024,
+                token_usage=0.25,
+                running_req=1,
+                queue_req=3,
+                input_throughput=1234.5,
+            ),
+        ]
+        assert node.memory_snapshots == [
+            MemoryMetrics(
+                timestamp="2025-11-04 05:27:13",
+                dp=0,
+                tp=0,
+                ep=0,
+                metric_type="memory",
+                avail_mem_gb=75.11,
+                mem_usage_gb=107.07,
+            ),
+            MemoryMetrics(
+                timestamp="2025-11-04 05:27:14",
+                dp=0,
+                tp=0,
+                ep=0,
+                metric_type="kv_cache",
+                kv_cache_gb=17.16,
+                kv_tokens=524288,
+            ),
+        ]
+
+    def test_decode_log(self, tmp_path):
+        """Decode batches with full and pipeline tags are extracted, including an unterminated last line."""
+        _, decode_path = _write_logs(tmp_path)
+
+        node = NodeAnalyzer().parse_single_log(decode_path)
+
+        assert node.node_info == {"node": "cn02", "worker_type": "decode", "worker_id": "w1"}
+        assert node.config == {}
+        assert node.memory_snapshots == []
+        assert node.batches == [
+            BatchMetrics(
+                timestamp="2025-11-04 05:32:32",
+                dp=31,
+                tp=31,
+                ep=31,
+                batch_type="decode",
+                token_usage=0.0,
+                running_req=7,
+                queue_req=0,
+                prealloc_req=0,
+                gen_throughput=6.73,
+                transfer_req=0,
+                num_tokens=7040,
+                preallocated_usage=0.0,
+            ),
+            BatchMetrics(
+                timestamp="2025-12-08 14:34:44",
+                dp=0,
+                tp=2,
+                ep=0,
+                batch_type="decode",
+                token_usage=1.0,
+                running_req=1,
+                queue_req=2,
+                gen_throughput=100.0,
+                num_tokens=128,
+            ),
+        ]
+
+    def test_metric_types(self, tmp_path):
+        """Counts are ints; usages and throughputs are floats even when logged without a decimal point."""
+        nodes = [NodeAnalyzer().parse_single_log(path) for path in _write_logs(tmp_path)]
+
+        for batch in (batch for node in nodes for batch in node.batches):
+            for field in ("new_seq", "new_token", "cached_token", "running_req", "queue_req", "num_tokens"):
+                value = getattr(batch, field)
+                assert value is None or type(value) is int, (field, value)
+            for field in ("token_usage", "preallocated_usage", "input_throughput", "gen_throughput"):
+                value = getattr(batch, field)
+                assert value is None or type(value) is float, (field, value)
+
+    def test_lines_split_across_read_chunks(self):
+        """Lines straddling block boundaries are reassembled."""
+        chunks = list(_read_line_chunks(io.StringIO("first\nsecond line\nlast"), chunk_size=4))
+
+        assert [line for chunk in chunks for line in chunk] == ["first", "second line", "last"]
+
+
+class TestRegexBackend:
+    """Tests for choosing between google-re2 and the stdlib re module."""
+
+    def test_google_re2_used_when_installed(self):
+        """google-re2 is picked up when present."""
+        re2 = pytest.importorskip("re2")
+        if not hasattr(re2, "Options"):
+            pytest.skip("installed re2 module is not google-re2")
+
+        assert log_parser._regex_module() is re2
+
+    def test_other_re2_module_ignored(self, monkeypatch):
+        """A module named re2 without google-re2's API falls back to re."""
+        monkeypatch.setitem(sys.modules, "re2", types.ModuleType("re2"))
+
+        assert log_parser._regex_module() is re
+
+    @pytest.mark.parametrize("backend", ["re", "re2"])
+    def test_extract_metrics_with_backend(self, backend):
+        """Both regex backends extract the same named metrics, keeping the first occurrence."""
+        module = re if backend == "re" else pytest.importorskip("re2")
+        if backend == "re2" and not hasattr(module, "Options"):
+            pytest.skip("installed re2 module is not google-re2")
+        pattern = module.compile(log_parser._DECODE_METRICS.pattern)
+        line = "Decode batch, #running-req: 7, #token: 7040, token usage: 0.5, gen throughput (token/s): 6, #running-req: 9,"
+        metrics = {}
+
+        log_parser._extract_metrics(pattern, line, metrics)
+
+        assert metrics == {"running_req": 7, "num_tokens": 7040, "token_usage": 0.5, "gen_throughput": 6.0}
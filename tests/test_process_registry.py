@@ -3,13 +3,42 @@
 
 """Tests for ProcessRegistry."""
 
+from dataclasses import dataclass
 from pathlib import Path
-from subprocess import Popen
-from unittest.mock import MagicMock
 
 import pytest
 
-from srtctl.core.processes import ManagedProcess, ProcessRegistry
+from srtctl.core.processes import ManagedProcess, ProcessRegistry, _tail_lines
+
+# Log paths are only recorded, never opened
+_LOG = Path("/tmp/test.log")
+_LOGS = tuple(Path(f"/tmp/test_{i}.log") for i in range(3))
+
+
+@dataclass(slots=True)
+class FakePopen:
+    """Popen stand-in exposing only what ManagedProcess and ProcessRegistry use.
+
+    poll() reports returncode, so None means the process is still running.
+    """
+
+    pid: int = 12345
+    returncode: int | None = None
+    poll_calls: int = 0
+    terminate_calls: int = 0
+
+    def poll(self) -> int | None:
+        self.poll_calls += 1
+        return self.returncode
+
+    def wait(self, timeout: float | None = None) -> int | None:
+        return self.returncode
+
+    def terminate(self) -> None:
+        self.terminate_calls += 1
+
+    def kill(self) -> None:
+        pass
 
 
 class TestManagedProcess:
@@ -17,14 +46,12 @@ class TestManagedProcess:
 
     def test_managed_process_creation(self):
         """Test creating a ManagedProcess."""
-        mock_popen = MagicMock(spec=Popen)
-        mock_popen.poll.return_value = None
-        mock_popen.pid = 12345
+        popen = FakePopen()
 
         mp = ManagedProcess(
             name="test_process",
-            popen=mock_popen,
-            log_file=Path("/tmp/test.log"),
+            popen=popen,
+            log_file=_LOG,
             node="node0",
         )
 
@@ -33,113 +60,120 @@ class TestManagedProcess:
 
     def test_managed_process_exit_code(self):
         """Test exit_code property."""
-        mock_popen = MagicMock(spec=Popen)
-        mock_popen.poll.return_value = 1
-        mock_popen.returncode = 1
-        mock_popen.pid = 12345
+        popen = FakePopen(returncode=1)
 
         mp = ManagedProcess(
             name="test",
-            popen=mock_popen,
-            log_file=Path("/tmp/test.log"),
+            popen=popen,
+            log_file=_LOG,
         )
 
-        # exit_code comes from popen.returncode
-        assert mock_popen.returncode == 1
+        # exit_code comes from popen.poll()
+        assert mp.exit_code == 1
+
+
+@pytest.fixture
+def registry():
+    """A fresh, empty registry."""
+    return ProcessRegistry(job_id="test_job")
 
 
 class TestProcessRegistry:
     """Tests for ProcessRegistry."""
 
-    def test_add_process(self):
+    def test_add_process(self, registry):
         """Test adding a process to the registry."""
-        registry = ProcessRegistry(job_id="test_job")
-
-        mock_popen = MagicMock(spec=Popen)
-        mock_popen.poll.return_value = None
-        mock_popen.pid = 12345
-
-        mp = ManagedProcess(
-            name="worker_0",
-            popen=mock_popen,
-            log_file=Path("/tmp/test.log"),
-        )
-
-        registry.add_process(mp)
+        registry.add_process(ManagedProcess(name="worker_0", popen=FakePopen(), log_file=_LOG))
         # Just verify it doesn't error
 
-    def test_add_processes(self):
+    def test_add_processes(self, registry):
         """Test adding multiple processes."""
-        registry = ProcessRegistry(job_id="test_job")
-
-        processes = {}
-        for i in range(3):
-            mock_popen = MagicMock(spec=Popen)
-            mock_popen.poll.return_value = None
-            mock_popen.pid = 12345 + i
-            mp = ManagedProcess(
-                name=f"worker_{i}",
-                popen=mock_popen,
-                log_file=Path(f"/tmp/test_{i}.log"),
-            )
-            processes[mp.name] = mp
+        processes = {
+            f"worker_{i}": ManagedProcess(name=f"worker_{i}", popen=FakePopen(pid=12345 + i), log_file=_LOGS[i])
+            for i in range(3)
+        }
 
         registry.add_processes(processes)
         # Just verify it doesn't error
 
-    def test_check_failures_no_failures(self):
-        """Test check_failures with no failures."""
-        registry = ProcessRegistry(job_id="test_job")
+    @pytest.mark.parametrize(
+        ("returncode", "critical", "expected"),
+        [
+            pytest.param(None, True, False, id="running"),
+            pytest.param(1, True, True, id="critical_failed"),
+            pytest.param(0, True, False, id="clean_exit"),
+            pytest.param(1, False, False, id="non_critical_failed"),
+        ],
+    )
+    def test_check_failures(self, registry, returncode, critical, expected):
+        """Test that only critical processes exiting non-zero count as failures."""
+        popen = FakePopen(returncode=returncode)
+        registry.add_process(ManagedProcess(name="worker_0", popen=popen, log_file=_LOG, critical=critical))
+
+        assert registry.check_failures() is expected
+
+    def test_check_failures_polls_each_process_once(self, registry):
+        """Test that each tick polls running processes once and skips known failures."""
+        running = FakePopen()
+        failed = FakePopen(pid=12346, returncode=1)
+        registry.add_process(ManagedProcess(name="worker_0", popen=running))
+        registry.add_process(ManagedProcess(name="worker_1", popen=failed))
+
+        assert registry.check_failures()
+        assert registry.check_failures()
 
-        mock_popen = MagicMock(spec=Popen)
-        mock_popen.poll.return_value = None  # Still running
-        mock_popen.pid = 12345
+        assert running.poll_calls == 2
+        assert failed.poll_calls == 1
 
-        mp = ManagedProcess(
-            name="worker_0",
-            popen=mock_popen,
-            log_file=Path("/tmp/test.log"),
-            critical=True,
-        )
+    def test_cleanup(self, registry):
+        """Test cleanup terminates all processes."""
+        popen = FakePopen()
+        registry.add_process(ManagedProcess(name="worker_0", popen=popen, log_file=_LOG))
 
-        registry.add_process(mp)
-        assert not registry.check_failures()
+        registry.cleanup()
 
-    def test_check_failures_with_failure(self):
-        """Test check_failures detects failed process."""
-        registry = ProcessRegistry(job_id="test_job")
+        assert popen.terminate_calls == 1
 
-        mock_popen = MagicMock(spec=Popen)
-        mock_popen.poll.return_value = 1  # Failed
-        mock_popen.returncode = 1
-        mock_popen.pid = 12345
 
-        mp = ManagedProcess(
-            name="worker_0",
-            popen=mock_popen,
-            log_file=Path("/tmp/test.log"),
-            critical=True,
-        )
+class TestTailLines:
+    """Tests for _tail_lines."""
 
-        registry.add_process(mp)
-        assert registry.check_failures()
+    @pytest.mark.parametrize("block_size", [4, 7, 64 * 1024])
+    def test_matches_full_read(self, tmp_path, block_size):
+        """Test that tailing in blocks returns the same lines as reading the whole file."""
+        log_file = tmp_path / "worker.log"
+        log_file.write_text("".join(f"line {i}\n" for i in range(100)))
 
-    def test_cleanup(self):
-        """Test cleanup terminates all processes."""
-        registry = ProcessRegistry(job_id="test_job")
+        expected = log_file.read_text().splitlines()[-5:]
+        assert _tail_lines(log_file, 5, block_size=block_size) == expected
 
-        mock_popen = MagicMock(spec=Popen)
-        mock_popen.poll.return_value = None  # Still running
-        mock_popen.wait.return_value = 0
-        mock_popen.pid = 12345
+    def test_short_file(self, tmp_path):
+        """Test that a file with fewer lines than requested is returned whole."""
+        log_file = tmp_path / "worker.log"
+        log_file.write_text("only\ntwo")
 
-        mp = ManagedProcess(
-            name="worker_0",
-            popen=mock_popen,
-            log_file=Path("/tmp/test.log"),
-        )
+        assert _tail_lines(log_file, 50, block_size=3) == ["only", "two"]
 
-        registry.add_process(mp)
-        registry.cleanup()
+    def test_empty_file(self, tmp_path):
+        """Test that an empty file has no lines."""
+        log_file = tmp_path / "worker.log"
+        log_file.touch()
+
+        assert _tail_lines(log_file, 50) == []
+
+    def test_zero_count(self, tmp_path):
+        """Test that asking for no lines returns none."""
+        log_file = tmp_path / "worker.log"
+        log_file.write_text("a\nb\n")
+
+        assert _tail_lines(log_file, 0) == []
+
+    def test_long_stretch_without_newlines(self, tmp_path):
+        """Test that carriage-return progress output between lines is read through in blocks."""
+        log_file = tmp_path / "worker.log"
+        progress = "".join(f"\r{i}%" for i in range(100))
+        log_file.write_text(f"start\n{progress}\nerror: worker died\n")
+        full = log_file.read_bytes().decode().splitlines()
 
-        mock_popen.terminate.assert_called_once()
+        assert _tail_lines(log_file, 1, block_size=16) == ["error: worker died"]
+        assert _tail_lines(log_file, 3, block_size=16) == full[-3:]
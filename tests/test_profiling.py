@@ -4,9 +4,18 @@
 """Tests for profiling configuration, validation, and benchmark runner."""
 
 import pytest
+from marshmallow import ValidationError
 
 from srtctl.benchmarks import get_runner
 from srtctl.benchmarks.base import SCRIPTS_DIR
+from srtctl.core.schema import (
+    BenchmarkConfig,
+    ModelConfig,
+    ProfilingConfig,
+    ProfilingPhaseConfig,
+    ResourceConfig,
+    SrtConfig,
+)
 
 
 class TestProfilingConfig:
@@ -14,8 +23,6 @@ class TestProfilingConfig:
 
     def test_profiling_defaults(self):
         """Test profiling config defaults."""
-        from srtctl.core.schema import ProfilingConfig
-
         profiling = ProfilingConfig()
 
         assert profiling.enabled is False
@@ -25,8 +32,6 @@ class TestProfilingConfig:
 
     def test_nsys_profiling(self):
         """Test nsys profiling configuration."""
-        from srtctl.core.schema import ProfilingConfig
-
         profiling = ProfilingConfig(
             type="nsys",
             isl=1024,
@@ -46,8 +51,6 @@ class TestProfilingConfig:
 
     def test_torch_profiling(self):
         """Test torch profiling configuration."""
-        from srtctl.core.schema import ProfilingConfig, ProfilingPhaseConfig
-
         profiling = ProfilingConfig(
             type="torch",
             isl=2048,
@@ -78,8 +81,6 @@ class TestProfilingConfig:
 
     def test_aggregated_profiling(self):
         """Test aggregated profiling configuration."""
-        from srtctl.core.schema import ProfilingConfig, ProfilingPhaseConfig
-
         profiling = ProfilingConfig(
             type="torch",
             isl=1024,
@@ -92,193 +93,75 @@ class TestProfilingConfig:
         assert env["PROFILE_AGG_START_STEP"] == "0"
         assert env["PROFILE_AGG_STOP_STEP"] == "100"
 
+    def test_unset_params_omitted_from_env(self):
+        """Test that unset traffic and step params produce no env vars."""
+        profiling = ProfilingConfig(type="torch", isl=1024, prefill=ProfilingPhaseConfig(stop_step=7))
 
-class TestProfilingValidation:
-    """Tests for profiling config validation in SrtConfig."""
+        assert profiling.get_traffic_env_vars() == {"PROFILE_ISL": "1024"}
+        assert profiling.get_phase_env_vars("prefill") == {"PROFILE_PREFILL_STOP_STEP": "7"}
+        assert profiling.get_phase_env_vars("decode") == {}
 
-    def test_disagg_requires_prefill_and_decode(self):
-        """Disaggregated mode requires both prefill and decode profiling configs."""
-        from marshmallow import ValidationError
 
-        from srtctl.core.schema import (
-            ModelConfig,
-            ProfilingConfig,
-            ProfilingPhaseConfig,
-            ResourceConfig,
-            SrtConfig,
-        )
+# Frozen config pieces shared by the validation tests
+_MODEL = ModelConfig(path="/model", container="/container", precision="fp8")
+_PHASE = ProfilingPhaseConfig(start_step=0, stop_step=50)
+_TORCH_TRAFFIC = {"type": "torch", "isl": 1024, "osl": 128, "concurrency": 1}
+_DISAGG_1P1D = ResourceConfig(gpu_type="h100", prefill_nodes=1, decode_nodes=1, prefill_workers=1, decode_workers=1)
+_DISAGG_PROFILING = ProfilingConfig(**_TORCH_TRAFFIC, prefill=_PHASE, decode=_PHASE)
 
-        # Missing decode config should fail (with valid single worker config)
-        with pytest.raises(ValidationError, match="both profiling.prefill and profiling.decode"):
-            SrtConfig(
-                name="test",
-                model=ModelConfig(path="/model", container="/container", precision="fp8"),
-                resources=ResourceConfig(
-                    gpu_type="h100",
-                    prefill_nodes=1,
-                    decode_nodes=1,
-                    prefill_workers=1,
-                    decode_workers=1,
-                ),
-                profiling=ProfilingConfig(
-                    type="torch",
-                    isl=1024,
-                    osl=128,
-                    concurrency=1,
-                    prefill=ProfilingPhaseConfig(start_step=0, stop_step=50),
-                    # Missing decode config
-                ),
-            )
-
-    def test_agg_requires_aggregated_config(self):
-        """Aggregated mode requires aggregated profiling config."""
-        from marshmallow import ValidationError
-
-        from srtctl.core.schema import (
-            ModelConfig,
-            ProfilingConfig,
-            ResourceConfig,
-            SrtConfig,
-        )
 
-        # Aggregated mode without aggregated profiling config should fail
-        with pytest.raises(ValidationError, match="profiling.aggregated to be set"):
-            SrtConfig(
-                name="test",
-                model=ModelConfig(path="/model", container="/container", precision="fp8"),
-                resources=ResourceConfig(gpu_type="h100", agg_nodes=1, agg_workers=1),
-                profiling=ProfilingConfig(
-                    type="torch",
-                    isl=1024,
-                    osl=128,
-                    concurrency=1,
-                    # Missing aggregated config
-                ),
-            )
-
-    def test_profiling_requires_traffic_params(self):
-        """Profiling requires isl/osl/concurrency."""
-        from marshmallow import ValidationError
-
-        from srtctl.core.schema import (
-            ModelConfig,
-            ProfilingConfig,
-            ProfilingPhaseConfig,
-            ResourceConfig,
-            SrtConfig,
-        )
-
-        # Missing concurrency should fail
-        with pytest.raises(ValidationError, match="isl/osl/concurrency must be set"):
-            SrtConfig(
-                name="test",
-                model=ModelConfig(path="/model", container="/container", precision="fp8"),
-                resources=ResourceConfig(gpu_type="h100", prefill_nodes=1, decode_nodes=1),
-                profiling=ProfilingConfig(
-                    type="torch",
-                    isl=1024,
-                    osl=128,
-                    # Missing concurrency
-                    prefill=ProfilingPhaseConfig(start_step=0, stop_step=50),
-                    decode=ProfilingPhaseConfig(start_step=0, stop_step=50),
-                ),
-            )
-
-    def test_profiling_requires_single_worker_disagg(self):
-        """Profiling in disaggregated mode requires exactly 1P + 1D."""
-        from marshmallow import ValidationError
-
-        from srtctl.core.schema import (
-            ModelConfig,
-            ProfilingConfig,
-            ProfilingPhaseConfig,
-            ResourceConfig,
-            SrtConfig,
-        )
-
-        # Multiple prefill workers should fail
-        with pytest.raises(ValidationError, match="exactly 1 prefill and 1 decode"):
-            SrtConfig(
-                name="test",
-                model=ModelConfig(path="/model", container="/container", precision="fp8"),
-                resources=ResourceConfig(
-                    gpu_type="h100",
-                    prefill_nodes=1,
-                    decode_nodes=1,
-                    prefill_workers=2,  # More than 1!
-                    decode_workers=1,
-                ),
-                profiling=ProfilingConfig(
-                    type="torch",
-                    isl=1024,
-                    osl=128,
-                    concurrency=1,
-                    prefill=ProfilingPhaseConfig(start_step=0, stop_step=50),
-                    decode=ProfilingPhaseConfig(start_step=0, stop_step=50),
-                ),
-            )
-
-    def test_profiling_requires_single_worker_agg(self):
-        """Profiling in aggregated mode requires exactly 1 agg worker."""
-        from marshmallow import ValidationError
-
-        from srtctl.core.schema import (
-            ModelConfig,
-            ProfilingConfig,
-            ProfilingPhaseConfig,
-            ResourceConfig,
-            SrtConfig,
-        )
+class TestProfilingValidation:
+    """Tests for profiling config validation in SrtConfig."""
 
-        # Multiple agg workers should fail
-        with pytest.raises(ValidationError, match="exactly 1 aggregated worker"):
-            SrtConfig(
-                name="test",
-                model=ModelConfig(path="/model", container="/container", precision="fp8"),
-                resources=ResourceConfig(
-                    gpu_type="h100",
-                    agg_nodes=2,
-                    agg_workers=2,  # More than 1!
-                ),
-                profiling=ProfilingConfig(
-                    type="torch",
-                    isl=1024,
-                    osl=128,
-                    concurrency=1,
-                    aggregated=ProfilingPhaseConfig(start_step=0, stop_step=50),
-                ),
-            )
+    @pytest.mark.parametrize(
+        ("resources", "profiling", "match"),
+        [
+            # Disaggregated mode requires both prefill and decode profiling configs
+            pytest.param(
+                _DISAGG_1P1D,
+                ProfilingConfig(**_TORCH_TRAFFIC, prefill=_PHASE),
+                "both profiling.prefill and profiling.decode",
+                id="disagg_missing_decode",
+            ),
+            # Aggregated mode requires aggregated profiling config
+            pytest.param(
+                ResourceConfig(gpu_type="h100", agg_nodes=1, agg_workers=1),
+                ProfilingConfig(**_TORCH_TRAFFIC),
+                "profiling.aggregated to be set",
+                id="agg_missing_aggregated",
+            ),
+            # Profiling requires isl/osl/concurrency
+            pytest.param(
+                ResourceConfig(gpu_type="h100", prefill_nodes=1, decode_nodes=1),
+                ProfilingConfig(type="torch", isl=1024, osl=128, prefill=_PHASE, decode=_PHASE),
+                "isl/osl/concurrency must be set",
+                id="missing_concurrency",
+            ),
+            # Profiling in disaggregated mode requires exactly 1P + 1D
+            pytest.param(
+                ResourceConfig(gpu_type="h100", prefill_nodes=1, decode_nodes=1, prefill_workers=2, decode_workers=1),
+                _DISAGG_PROFILING,
+                "exactly 1 prefill and 1 decode",
+                id="disagg_two_prefill_workers",
+            ),
+            # Profiling in aggregated mode requires exactly 1 agg worker
+            pytest.param(
+                ResourceConfig(gpu_type="h100", agg_nodes=2, agg_workers=2),
+                ProfilingConfig(**_TORCH_TRAFFIC, aggregated=_PHASE),
+                "exactly 1 aggregated worker",
+                id="agg_two_workers",
+            ),
+        ],
+    )
+    def test_invalid_profiling_rejected(self, resources, profiling, match):
+        """Profiling configs that do not fit the worker layout fail validation."""
+        with pytest.raises(ValidationError, match=match):
+            SrtConfig(name="test", model=_MODEL, resources=resources, profiling=profiling)
 
     def test_valid_profiling_config_disagg(self):
         """Valid profiling config with 1P + 1D passes validation."""
-        from srtctl.core.schema import (
-            ModelConfig,
-            ProfilingConfig,
-            ProfilingPhaseConfig,
-            ResourceConfig,
-            SrtConfig,
-        )
-
         # Should not raise
-        config = SrtConfig(
-            name="test",
-            model=ModelConfig(path="/model", container="/container", precision="fp8"),
-            resources=ResourceConfig(
-                gpu_type="h100",
-                prefill_nodes=1,
-                decode_nodes=1,
-                prefill_workers=1,
-                decode_workers=1,
-            ),
-            profiling=ProfilingConfig(
-                type="torch",
-                isl=1024,
-                osl=128,
-                concurrency=1,
-                prefill=ProfilingPhaseConfig(start_step=0, stop_step=50),
-                decode=ProfilingPhaseConfig(start_step=0, stop_step=50),
-            ),
-        )
+        config = SrtConfig(name="test", model=_MODEL, resources=_DISAGG_1P1D, profiling=_DISAGG_PROFILING)
         assert config.profiling.enabled
 
 
@@ -287,35 +170,13 @@ class TestProfilingAutoSwitch:
 
     def test_profiling_enabled_overrides_benchmark_type(self):
         """When profiling is enabled, benchmark type should be treated as 'profiling'."""
-        from srtctl.core.schema import (
-            BenchmarkConfig,
-            ModelConfig,
-            ProfilingConfig,
-            ProfilingPhaseConfig,
-            ResourceConfig,
-            SrtConfig,
-        )
-
         # User sets benchmark.type to "manual" but has profiling enabled
         config = SrtConfig(
             name="test",
-            model=ModelConfig(path="/model", container="/container", precision="fp8"),
-            resources=ResourceConfig(
-                gpu_type="h100",
-                prefill_nodes=1,
-                decode_nodes=1,
-                prefill_workers=1,
-                decode_workers=1,
-            ),
+            model=_MODEL,
+            resources=_DISAGG_1P1D,
             benchmark=BenchmarkConfig(type="manual"),  # User says manual
-            profiling=ProfilingConfig(
-                type="torch",
-                isl=1024,
-                osl=128,
-                concurrency=1,
-                prefill=ProfilingPhaseConfig(start_step=0, stop_step=50),
-                decode=ProfilingPhaseConfig(start_step=0, stop_step=50),
-            ),
+            profiling=_DISAGG_PROFILING,
         )
 
         # The orchestrator should detect profiling.enabled and use "profiling" runner
@@ -344,12 +205,6 @@ class TestProfilingRunner:
     def test_validate_config_requires_profiling_enabled(self):
         """Validates that profiling must be enabled."""
         from srtctl.benchmarks.profiling import ProfilingRunner
-        from srtctl.core.schema import (
-            ModelConfig,
-            ProfilingConfig,
-            ResourceConfig,
-            SrtConfig,
-        )
 
         runner = ProfilingRunner()
         config = SrtConfig(
@@ -364,12 +219,6 @@ class TestProfilingRunner:
     def test_validate_config_requires_params(self):
         """Validates that isl/osl/concurrency are required."""
         from srtctl.benchmarks.profiling import ProfilingRunner
-        from srtctl.core.schema import (
-            ModelConfig,
-            ProfilingConfig,
-            ResourceConfig,
-            SrtConfig,
-        )
 
         runner = ProfilingRunner()
         config = SrtConfig(
@@ -0,0 +1,288 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for SLURM node IP resolution."""
+
+import io
+from unittest.mock import patch
+
+from srtctl.core import slurm
+
+
+class TestIPCache:
+    """Tests for the resolved node IP cache."""
+
+    def setup_method(self):
+        slurm.clear_ip_cache()
+
+    def teardown_method(self):
+        slurm.clear_ip_cache()
+
+    def test_srun_resolution_cached(self, monkeypatch):
+        """Repeated lookups of a node run srun only once."""
+        monkeypatch.setenv("SLURM_JOB_ID", "123")
+        with patch.object(slurm, "get_node_ip", return_value="10.0.0.5") as mock_get:
+            assert slurm.get_hostname_ip("node5") == "10.0.0.5"
+            assert slurm.get_hostname_ip("node5") == "10.0.0.5"
+
+        mock_get.assert_called_once_with("node5", "123", None)
+
+    def test_cache_keyed_by_interface(self, monkeypatch):
+        """Different network interfaces are resolved separately."""
+        monkeypatch.setenv("SLURM_JOB_ID", "123")
+        with patch.object(slurm, "get_node_ip", side_effect=["10.0.0.5", "192.168.0.5"]):
+            assert slurm.get_hostname_ip("node5") == "10.0.0.5"
+            assert slurm.get_hostname_ip("node5", "ib0") == "192.168.0.5"
+
+    def test_expired_entries_re_resolved(self, monkeypatch):
+        """Entries older than the TTL are looked up again."""
+        monkeypatch.setenv("SLURM_JOB_ID", "123")
+        monkeypatch.setattr(slurm, "_IP_CACHE_TTL", 0.0)
+        with patch.object(slurm, "get_node_ip", return_value="10.0.0.5") as mock_get:
+            slurm.get_hostname_ip("node5")
+            slurm.get_hostname_ip("node5")
+
+        assert mock_get.call_count == 2
+
+    def test_socket_fallback_not_cached(self, monkeypatch):
+        """A failed srun falls back to the socket result without caching it."""
+        monkeypatch.setenv("SLURM_JOB_ID", "123")
+        with (
+            patch.object(slurm, "get_node_ip", side_effect=[None, "10.0.0.5"]) as mock_get,
+            patch.object(slurm.socket, "gethostbyname", return_value="127.0.1.1"),
+        ):
+            assert slurm.get_hostname_ip("node5") == "127.0.1.1"
+            assert slurm.get_hostname_ip("node5") == "10.0.0.5"
+
+        assert mock_get.call_count == 2
+
+    def test_get_node_ips_shares_cache(self, monkeypatch):
+        """get_node_ips reuses IPs resolved by get_hostname_ip."""
+        monkeypatch.setenv("SLURM_JOB_ID", "123")
+        with patch.object(slurm, "get_node_ip", side_effect=["10.0.0.1", "10.0.0.2"]) as mock_get:
+            slurm.get_hostname_ip("node1")
+            assert slurm.get_node_ips(["node1", "node2"], "123") == {"node1": "10.0.0.1", "node2": "10.0.0.2"}
+
+        assert mock_get.call_count == 2
+
+
+class TestBatchIPResolution:
+    """Tests for resolving several node IPs with one srun."""
+
+    def setup_method(self):
+        slurm.clear_ip_cache()
+
+    def teardown_method(self):
+        slurm.clear_ip_cache()
+
+    def test_batch_output_parsed_by_node_name(self):
+        """Each 'node ip' line maps to its node, regardless of task order."""
+        from srtctl.core import ip_utils
+
+        output = "node2 10.0.0.2\nnode1 10.0.0.1\nstray 10.9.9.9"
+        with patch.object(ip_utils, "_run_bash_function", return_value=(True, output)) as mock_run:
+            ips = ip_utils.get_node_ips_batch(["node1", "node2"], "123", "ib0")
+
+        assert ips == {"node1": "10.0.0.1", "node2": "10.0.0.2"}
+        assert mock_run.call_args.args[2] == ["node1,node2", "123", "ib0"]
+
+    def test_batch_failure_returns_empty(self):
+        """A failed srun resolves nothing."""
+        from srtctl.core import ip_utils
+
+        with patch.object(ip_utils, "_run_bash_function", return_value=(False, "srun: error")):
+            assert ip_utils.get_node_ips_batch(["node1", "node2"], "123") == {}
+
+    def test_get_node_ips_falls_back_per_node(self):
+        """Nodes missing from the batch result are resolved individually."""
+        with (
+            patch.object(slurm, "get_node_ips_batch", return_value={"node1": "10.0.0.1"}) as mock_batch,
+            patch.object(slurm, "get_node_ip", return_value="10.0.0.2") as mock_single,
+        ):
+            ips = slurm.get_node_ips(["node1", "node2"], "123")
+
+        assert ips == {"node1": "10.0.0.1", "node2": "10.0.0.2"}
+        mock_batch.assert_called_once_with(["node1", "node2"], "123", None)
+        mock_single.assert_called_once_with("node2", "123", None)
+
+
+class TestStageLeaderResolution:
+    """Tests for resolving worker and frontend nodes in the launch stages."""
+
+    def test_benchmark_stage_resolves_each_node_once(self, monkeypatch):
+        """Leader nodes shared by several endpoints are resolved once, after one batched warm-up."""
+        from srtctl.cli.mixins import benchmark_stage
+
+        monkeypatch.setenv("SLURM_JOB_ID", "123")
+        with (
+            patch.object(benchmark_stage, "get_node_ips") as mock_batch,
+            patch.object(benchmark_stage, "get_hostname_ip", side_effect=lambda n, _: f"ip-{n}") as mock_get,
+        ):
+            ips = benchmark_stage._resolve_node_ips(["node1", "node2", "node1"], "ib0")
+
+        assert ips == {"node1": "ip-node1", "node2": "ip-node2"}
+        mock_batch.assert_called_once_with(["node1", "node2"], "123", "ib0")
+        assert mock_get.call_count == 2
+
+    def test_nginx_config_warms_ip_cache_once(self, monkeypatch):
+        """Frontend hosts for nginx are resolved after one batched srun."""
+        from srtctl.cli.mixins import frontend_stage
+
+        topology = frontend_stage.FrontendTopology(
+            nginx_node="node0", frontend_nodes=["node1", "node2"], frontend_port=8080, public_port=8000
+        )
+        monkeypatch.setenv("SLURM_JOB_ID", "123")
+        with (
+            patch.object(frontend_stage, "get_node_ips") as mock_batch,
+            patch.object(frontend_stage, "get_hostname_ip", side_effect=lambda n: f"ip-{n}"),
+        ):
+            nginx_config = frontend_stage.FrontendStageMixin._generate_nginx_config(None, topology)
+
+        mock_batch.assert_called_once_with(["node1", "node2"], "123")
+        assert "ip-node1" in nginx_config
+        assert "ip-node2" in nginx_config
+
+
+class TestLocalIP:
+    """Tests for in-process local IP discovery."""
+
+    def test_interface_address_preferred(self):
+        """A usable address on the requested interface wins without running bash."""
+        from srtctl.core import ip_utils
+
+        with (
+            patch.object(ip_utils, "_interface_ip", return_value="10.1.2.3"),
+            patch.object(ip_utils, "_run_bash_function") as mock_run,
+        ):
+            assert ip_utils.get_local_ip("ib0") == "10.1.2.3"
+
+        mock_run.assert_not_called()
+
+    def test_loopback_skipped_for_default_route(self):
+        """Loopback interface addresses fall through to the default route IP."""
+        from srtctl.core import ip_utils
+
+        with (
+            patch.object(ip_utils, "_interface_ip", return_value="127.0.0.1"),
+            patch.object(ip_utils, "_default_route_ip", return_value="192.168.1.7"),
+        ):
+            assert ip_utils.get_local_ip("lo") == "192.168.1.7"
+
+    def test_bash_fallback(self):
+        """The bash resolver is used only when in-process methods fail."""
+        from srtctl.core import ip_utils
+
+        with (
+            patch.object(ip_utils, "_default_route_ip", return_value=None),
+            patch.object(ip_utils, "_run_bash_function", return_value=(True, "10.0.0.9")) as mock_run,
+        ):
+            assert ip_utils.get_local_ip() == "10.0.0.9"
+
+        mock_run.assert_called_once()
+
+
+class TestStartSrunProcess:
+    """Tests for srun command construction."""
+
+    def test_container_mounts_str_used_as_is(self):
+        """A pre-serialized mount string is passed straight to --container-mounts."""
+        from pathlib import Path
+
+        with patch.object(slurm.subprocess, "Popen") as mock_popen:
+            slurm.start_srun_process(
+                ["true"],
+                container_image="/c.sqsh",
+                container_mounts={Path("/ignored"): Path("/x")},
+                container_mounts_str="/a:/b,/c:/d",
+            )
+
+        srun_cmd = mock_popen.call_args.args[0]
+        assert srun_cmd[srun_cmd.index("--container-mounts") + 1] == "/a:/b,/c:/d"
+
+    def test_container_mounts_dict_serialized(self):
+        """Without a string, the mounts dict is serialized."""
+        from pathlib import Path
+
+        with patch.object(slurm.subprocess, "Popen") as mock_popen:
+            slurm.start_srun_process(["true"], container_image="/c.sqsh", container_mounts={Path("/a"): Path("/b")})
+
+        srun_cmd = mock_popen.call_args.args[0]
+        assert srun_cmd[srun_cmd.index("--container-mounts") + 1] == "/a:/b"
+
+    def test_command_not_joined_without_debug_logging(self):
+        """The debug rendering of the srun command is skipped when DEBUG is off."""
+        with (
+            patch.object(slurm.logger, "isEnabledFor", return_value=False),
+            patch.object(slurm.shlex, "join") as mock_join,
+            patch.object(slurm.subprocess, "Popen"),
+        ):
+            slurm.start_srun_process(["true"], use_bash_wrapper=False)
+
+        mock_join.assert_not_called()
+
+
+class TestRunBashFunction:
+    """Tests for invoking get_node_ip.sh functions."""
+
+    def test_function_invoked_with_argv(self):
+        """The script is run directly with the function name and args as argv."""
+        from srtctl.core import ip_utils
+
+        with patch.object(ip_utils.subprocess, "run") as mock_run:
+            mock_run.return_value.returncode = 0
+            mock_run.return_value.stdout = "10.0.0.1\n"
+            assert ip_utils._run_bash_function("get_node_ip.sh", "get_local_ip", ["ib0"]) == (True, "10.0.0.1")
+
+        argv = mock_run.call_args.args[0]
+        assert argv == ["bash", str(ip_utils.SCRIPTS_DIR / "get_node_ip.sh"), "get_local_ip", "ib0"]
+
+    def test_script_dispatches_to_function(self):
+        """Running the script with a function name calls that function."""
+        from srtctl.core import ip_utils
+
+        success, output = ip_utils._run_bash_function("get_node_ip.sh", "get_local_ip", [""])
+
+        assert success is True
+        assert output.count(".") == 3
+
+
+class TestGetSlurmNodelist:
+    """Tests for SLURM_NODELIST expansion."""
+
+    def setup_method(self):
+        slurm._nodelist_cache.clear()
+
+    def teardown_method(self):
+        slurm._nodelist_cache.clear()
+
+    def test_expansion_cached(self, monkeypatch):
+        """scontrol runs once per distinct nodelist."""
+        monkeypatch.setenv("SLURM_NODELIST", "gpu-[01-02]")
+        with patch.object(slurm.subprocess, "Popen") as mock_popen:
+            proc = mock_popen.return_value.__enter__.return_value
+            proc.stdout = io.StringIO("gpu-01\ngpu-02\n")
+            proc.returncode = 0
+            assert slurm.get_slurm_nodelist() == ["gpu-01", "gpu-02"]
+            assert slurm.get_slurm_nodelist() == ["gpu-01", "gpu-02"]
+
+        mock_popen.assert_called_once()
+
+    def test_failed_expansion_not_cached(self, monkeypatch):
+        """A failed scontrol call is retried next time."""
+        monkeypatch.setenv("SLURM_NODELIST", "gpu-01")
+        with patch.object(slurm.subprocess, "Popen", side_effect=FileNotFoundError) as mock_popen:
+            assert slurm.get_slurm_nodelist() == ["gpu-01"]
+            assert slurm.get_slurm_nodelist() == ["gpu-01"]
+
+        assert mock_popen.call_count == 2
+
+    def test_nonzero_exit_falls_back(self, monkeypatch):
+        """An scontrol error returns the raw nodelist."""
+        monkeypatch.setenv("SLURM_NODELIST", "gpu-[01-02]")
+        with patch.object(slurm.subprocess, "Popen") as mock_popen:
+            proc = mock_popen.return_value.__enter__.return_value
+            proc.stdout = io.StringIO("")
+            proc.returncode = 1
+            assert slurm.get_slurm_nodelist() == ["gpu-[01-02]"]
+
+        assert slurm._nodelist_cache == {}
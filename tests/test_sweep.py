@@ -5,7 +5,7 @@
 
 import pytest
 
-from srtctl.core.sweep import expand_template, generate_sweep_configs
+from srtctl.core.sweep import _apply_plan, _plan_template, expand_template, generate_sweep_configs, iter_sweep_configs
 
 
 class TestExpandTemplate:
@@ -26,6 +26,16 @@ class TestExpandTemplate:
         result = expand_template("{a}-{b}", {"a": "x", "b": "y"})
         assert result == "x-y"
 
+    def test_substituted_values_not_reexpanded(self):
+        """Placeholders inside substituted values are left alone."""
+        result = expand_template("{a}-{b}", {"a": "{b}", "b": "y"})
+        assert result == "{b}-y"
+
+    def test_unknown_placeholder_preserved(self):
+        """Placeholders without a value are kept verbatim."""
+        result = expand_template("{a}-{missing}", {"a": "x"})
+        assert result == "x-{missing}"
+
     def test_numeric_value(self):
         """Test that numeric values are converted to strings."""
         result = expand_template("{num}", {"num": 42})
@@ -104,6 +114,66 @@ class TestExpandTemplate:
         result = expand_template("{missing}", {"other": "value"})
         assert result == "{missing}"
 
+    def test_placeholder_free_subtrees_reused(self):
+        """Test that subtrees without placeholders are returned rather than copied."""
+        template = {"static": {"a": [1, "x"], "b": "plain"}, "dynamic": {"c": "{val}", "d": ["fixed"]}}
+
+        result = expand_template(template, {"val": 8})
+
+        assert result == {"static": {"a": [1, "x"], "b": "plain"}, "dynamic": {"c": "8", "d": ["fixed"]}}
+        assert result is not template
+        assert result["static"] is template["static"]
+        assert result["dynamic"] is not template["dynamic"]
+        assert result["dynamic"]["d"] is template["dynamic"]["d"]
+
+    def test_same_template_across_values(self):
+        """Test that repeated expansion of one template string tracks each value set."""
+        template = "tp{tp}_c{conc}_{tp}"
+
+        results = [expand_template(template, {"tp": tp, "conc": conc}) for tp in (4, 8) for conc in (16, 32)]
+
+        assert results == ["tp4_c16_4", "tp4_c32_4", "tp8_c16_8", "tp8_c32_8"]
+
+    def test_plan_reused_across_values(self):
+        """Test that one plan expands independent results that share placeholder-free subtrees."""
+        template = {"static": {"a": 1}, "dynamic": ["fixed", "{val}"], "flag": True}
+        plan = _plan_template(template)
+
+        first = _apply_plan(template, plan, {"val": 1})
+        second = _apply_plan(template, plan, {"val": 2})
+
+        assert plan == {"dynamic": {1: "{val}"}}
+        assert first["dynamic"] == ["fixed", "1"]
+        assert second["dynamic"] == ["fixed", "2"]
+        assert first["static"] is second["static"] is template["static"]
+        assert template["dynamic"] == ["fixed", "{val}"]
+
+    def test_nesting_deeper_than_recursion_limit(self):
+        """Test that expansion does not recurse per nesting level."""
+        import sys
+
+        depth = sys.getrecursionlimit() + 100
+        template = "{val}"
+        for _ in range(depth):
+            template = {"child": [template]}
+
+        result = expand_template(template, {"val": "leaf"})
+
+        for _ in range(depth):
+            result = result["child"][0]
+        assert result == "leaf"
+
+
+def _sweep_config(sweep: dict, prefill: dict | None = None, name: str = "test") -> dict:
+    """Build a fresh disaggregated SGLang sweep config; tests may mutate the result."""
+    return {
+        "name": name,
+        "model": {"path": "model", "container": "container.sqsh", "precision": "fp8"},
+        "resources": {"gpu_type": "h100", "prefill_nodes": 1, "decode_nodes": 1},
+        "backend": {"sglang_config": {"prefill": prefill or {}, "decode": {}}},
+        "sweep": sweep,
+    }
+
 
 class TestGenerateSweepConfigs:
     """Tests for generate_sweep_configs function."""
@@ -114,136 +184,39 @@ class TestGenerateSweepConfigs:
         with pytest.raises(ValueError, match="must have 'sweep' section"):
             generate_sweep_configs(config)
 
-    def test_single_param_sweep(self):
-        """Test sweep with single parameter."""
-        config = {
-            "name": "test",
-            "model": {
-                "path": "model",
-                "container": "container.sqsh",
-                "precision": "fp8",
-            },
-            "resources": {
-                "gpu_type": "h100",
-                "prefill_nodes": 1,
-                "decode_nodes": 1,
-            },
-            "backend": {
-                "sglang_config": {
-                    "prefill": {
-                        "max-total-tokens": "{tokens}",
-                    },
-                    "decode": {},
-                }
-            },
-            "sweep": {
-                "tokens": [1024, 2048, 4096],
-            },
-        }
-        results = generate_sweep_configs(config)
-
-        assert len(results) == 3
-
-        # Check parameter values
-        params = [r[1] for r in results]
-        assert params[0] == {"tokens": 1024}
-        assert params[1] == {"tokens": 2048}
-        assert params[2] == {"tokens": 4096}
-
-    def test_cartesian_product(self):
-        """Test that multiple params create Cartesian product."""
-        config = {
-            "name": "test",
-            "model": {
-                "path": "model",
-                "container": "container.sqsh",
-                "precision": "fp8",
-            },
-            "resources": {
-                "gpu_type": "h100",
-                "prefill_nodes": 1,
-                "decode_nodes": 1,
-            },
-            "backend": {
-                "sglang_config": {
-                    "prefill": {
-                        "val-a": "{a}",
-                        "val-b": "{b}",
-                    },
-                    "decode": {},
-                }
-            },
-            "sweep": {
-                "a": [1, 2],
-                "b": [10, 20],
-            },
-        }
-        results = generate_sweep_configs(config)
-
-        # 2 x 2 = 4 combinations
-        assert len(results) == 4
-
-        # Check all combinations exist
-        all_params = [r[1] for r in results]
-        assert {"a": 1, "b": 10} in all_params
-        assert {"a": 1, "b": 20} in all_params
-        assert {"a": 2, "b": 10} in all_params
-        assert {"a": 2, "b": 20} in all_params
+    @pytest.mark.parametrize(
+        ("prefill", "sweep", "expected_params"),
+        [
+            pytest.param(
+                {"max-total-tokens": "{tokens}"},
+                {"tokens": [1024, 2048, 4096]},
+                [{"tokens": 1024}, {"tokens": 2048}, {"tokens": 4096}],
+                id="single_param",
+            ),
+            pytest.param(
+                {"val-a": "{a}", "val-b": "{b}"},
+                {"a": [1, 2], "b": [10, 20]},
+                [{"a": 1, "b": 10}, {"a": 1, "b": 20}, {"a": 2, "b": 10}, {"a": 2, "b": 20}],
+                id="cartesian_product",
+            ),
+        ],
+    )
+    def test_parameter_combinations(self, prefill, sweep, expected_params):
+        """Test that every combination of the sweep parameters is generated, in order."""
+        results = generate_sweep_configs(_sweep_config(sweep, prefill=prefill))
+
+        assert [params for _, params in results] == expected_params
 
     def test_sweep_removes_sweep_section(self):
         """Test that generated configs don't have sweep section."""
-        config = {
-            "name": "test",
-            "model": {
-                "path": "model",
-                "container": "container.sqsh",
-                "precision": "fp8",
-            },
-            "resources": {
-                "gpu_type": "h100",
-                "prefill_nodes": 1,
-                "decode_nodes": 1,
-            },
-            "backend": {
-                "sglang_config": {
-                    "prefill": {},
-                    "decode": {},
-                }
-            },
-            "sweep": {
-                "x": [1],
-            },
-        }
-        results = generate_sweep_configs(config)
+        results = generate_sweep_configs(_sweep_config({"x": [1]}))
         generated_config = results[0][0]
 
         assert "sweep" not in generated_config
 
     def test_unique_names_generated(self):
         """Test that each config gets a unique name."""
-        config = {
-            "name": "base",
-            "model": {
-                "path": "model",
-                "container": "container.sqsh",
-                "precision": "fp8",
-            },
-            "resources": {
-                "gpu_type": "h100",
-                "prefill_nodes": 1,
-                "decode_nodes": 1,
-            },
-            "backend": {
-                "sglang_config": {
-                    "prefill": {},
-                    "decode": {},
-                }
-            },
-            "sweep": {
-                "val": [100, 200],
-            },
-        }
-        results = generate_sweep_configs(config)
+        results = generate_sweep_configs(_sweep_config({"val": [100, 200]}, name="base"))
 
         names = [r[0]["name"] for r in results]
         assert len(names) == len(set(names)), "Names should be unique"
@@ -252,30 +225,7 @@ class TestGenerateSweepConfigs:
 
     def test_placeholder_substitution_in_generated_config(self):
         """Test that placeholders are actually replaced in output."""
-        config = {
-            "name": "test",
-            "model": {
-                "path": "model",
-                "container": "container.sqsh",
-                "precision": "fp8",
-            },
-            "resources": {
-                "gpu_type": "h100",
-                "prefill_nodes": 1,
-                "decode_nodes": 1,
-            },
-            "backend": {
-                "sglang_config": {
-                    "prefill": {
-                        "mem-fraction-static": "{mem}",
-                    },
-                    "decode": {},
-                }
-            },
-            "sweep": {
-                "mem": [0.85, 0.90],
-            },
-        }
+        config = _sweep_config({"mem": [0.85, 0.90]}, prefill={"mem-fraction-static": "{mem}"})
         results = generate_sweep_configs(config)
 
         # Check that values are substituted (note: they become strings)
@@ -288,3 +238,96 @@ class TestGenerateSweepConfigs:
         assert prefill1["mem-fraction-static"] == "0.85"
         assert prefill2["mem-fraction-static"] == "0.9"
 
+    def test_iter_sweep_configs_is_lazy(self):
+        """Test that iter_sweep_configs yields combinations on demand."""
+        it = iter_sweep_configs(_sweep_config({"val": [1, 2, 3]}, name="lazy"))
+
+        first_config, first_params = next(it)
+        assert first_params == {"val": 1}
+        assert first_config["name"] == "lazy_val1"
+        assert [params for _, params in it] == [{"val": 2}, {"val": 3}]
+
+    def test_schema_built_once_per_sweep(self):
+        """Test that one schema validates every combination of every sweep and the input is untouched."""
+        import copy
+        from unittest.mock import patch
+
+        from srtctl.core.schema import SrtConfig, cached_schema
+
+        config = {
+            "name": "once",
+            "model": {"path": "model", "container": "container.sqsh", "precision": "fp8"},
+            "resources": {"gpu_type": "h100", "agg_nodes": 1},
+            "benchmark": {"type": "manual"},
+            "sweep": {"a": [1, 2], "b": [3, 4]},
+        }
+        original = copy.deepcopy(config)
+
+        cached_schema.cache_clear()
+        with patch.object(SrtConfig, "Schema", wraps=SrtConfig.Schema) as mock_schema:
+            results = generate_sweep_configs(config)
+            generate_sweep_configs(config)
+
+        assert mock_schema.call_count == 1
+        assert [c["name"] for c, _ in results] == ["once_a1_b3", "once_a1_b4", "once_a2_b3", "once_a2_b4"]
+        assert config == original
+
+    def test_results_do_not_alias_input(self):
+        """Test that mutating a generated config leaves the sweep config untouched."""
+        config = {
+            "name": "alias",
+            "model": {"path": "model", "container": "container.sqsh", "precision": "fp8"},
+            "resources": {"gpu_type": "h100", "agg_nodes": 1},
+            "backend": {"sglang_config": {"aggregated": {"mem-fraction-static": "{mem}", "tp-size": 8}}},
+            "benchmark": {"type": "manual"},
+            "sweep": {"mem": [0.8]},
+        }
+
+        ((result, _),) = generate_sweep_configs(config)
+        result["backend"]["sglang_config"]["aggregated"]["tp-size"] = 1
+        result["model"]["path"] = "other"
+
+        assert config["backend"]["sglang_config"]["aggregated"] == {"mem-fraction-static": "{mem}", "tp-size": 8}
+        assert config["model"]["path"] == "model"
+
+    def test_results_do_not_alias_each_other(self):
+        """Test that mutating one generated config leaves the other combinations untouched."""
+        config = {
+            "name": "shared",
+            "model": {"path": "model", "container": "container.sqsh", "precision": "fp8"},
+            "resources": {"gpu_type": "h100", "agg_nodes": 1},
+            "backend": {"sglang_config": {"aggregated": {"mem-fraction-static": "{mem}", "cuda-graph-bs": [1, 2]}}},
+            "benchmark": {"type": "manual"},
+            "sweep": {"mem": [0.8, 0.9]},
+        }
+
+        (first, _), (second, _) = generate_sweep_configs(config)
+        first["backend"]["sglang_config"]["aggregated"]["cuda-graph-bs"].append(4)
+        first["resources"]["agg_nodes"] = 2
+
+        assert second["backend"]["sglang_config"]["aggregated"]["cuda-graph-bs"] == [1, 2]
+        assert second["resources"]["agg_nodes"] == 1
+
+
+class TestSweepConfigField:
+    """Tests for sweep section deserialization."""
+
+    def test_flat_and_nested_parameters(self):
+        """Both the flat and 'parameters' layouts deserialize to the same SweepConfig."""
+        from srtctl.core.schema import SweepConfigField
+
+        field = SweepConfigField()
+        flat = field.deserialize({"mode": "grid", "x": [1, 2], "y": ["a"]})
+        nested = field.deserialize({"mode": "grid", "parameters": {"x": [1, 2], "y": ["a"]}})
+
+        assert flat == nested
+        assert flat.parameters == {"x": [1, 2], "y": ["a"]}
+
+    def test_non_list_parameter_rejected(self):
+        """A scalar sweep parameter is reported by name."""
+        from marshmallow import ValidationError
+
+        from srtctl.core.schema import SweepConfigField
+
+        with pytest.raises(ValidationError, match="Sweep parameter 'y' must be a list"):
+            SweepConfigField().deserialize({"x": [1], "y": 2})